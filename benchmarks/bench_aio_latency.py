@@ -0,0 +1,78 @@
+"""Longest event loop stall while a large payload is encoded with dumps or aiterencode, and decoded with aload or
+aiterload.
+
+A ticker task measures the gap between its wake ups while a handler encodes or decodes the payload.
+
+Run with: python -m benchmarks.bench_aio_latency
+"""
+
+import asyncio
+import datetime
+import decimal
+import time
+
+import jsonstar
+
+
+def make_payload(n):
+    now = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    return [{"id": i, "amount": decimal.Decimal("9.99"), "at": now, "name": f"record {i}"} for i in range(n)]
+
+
+async def measure(handler):
+    stalls = []
+    done = asyncio.Event()
+
+    async def ticker():
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0)
+            now = time.perf_counter()
+            stalls.append(now - last)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await handler()
+    elapsed = time.perf_counter() - start
+    done.set()
+    await task
+    return elapsed, max(stalls)
+
+
+def reader_of(data):
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+def main(n=200_000):
+    payload = make_payload(n)
+
+    async def blocking():
+        jsonstar.dumps(payload).encode()
+
+    async def streaming():
+        async for _ in jsonstar.aiterencode(payload):
+            pass
+
+    data = jsonstar.dumps(payload).encode()
+
+    async def whole():
+        await jsonstar.aload(reader_of(data))
+
+    async def incremental():
+        async for _ in jsonstar.aiterload(reader_of(data)):
+            pass
+
+    print(f"{'handler':>12} {'total s':>8} {'max stall ms':>13}")
+    handlers = {"dumps": blocking, "aiterencode": streaming, "aload": whole, "aiterload": incremental}
+    for name, handler in handlers.items():
+        elapsed, stall = asyncio.run(measure(handler))
+        print(f"{name:>12} {elapsed:>8.3f} {stall * 1000:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Time and memory to encode a series of floats held in array.array or NumPy, and to decode it packed or as lists.
+
+Run with: python -m benchmarks.bench_arrays
+"""
+
+import array
+import random
+import timeit
+import tracemalloc
+
+import jsonstar
+from jsonstar.backends import orjson
+
+
+COMPACT = {"separators": (",", ":"), "ensure_ascii": False}
+
+
+def measure(run, repeat):
+    """Return the best time of run and the peak memory allocated while running it once."""
+    seconds = min(timeit.repeat(run, number=1, repeat=repeat))
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def encode_cases(series):
+    cases = {
+        "list dumps": lambda: jsonstar.dumps(series.tolist()),
+        "array dumps": lambda: jsonstar.dumps(series),
+        "array fragments": lambda: jsonstar.dumps(series, fragment_cache=jsonstar.FragmentCache()),
+    }
+    if orjson is not None:
+        cases["list orjson"] = lambda: jsonstar.dumps_bytes(series.tolist(), backend="orjson", **COMPACT)
+        cases["array orjson"] = lambda: jsonstar.dumps_bytes(series, backend="orjson", **COMPACT)
+    try:
+        import numpy
+    except ImportError:
+        return cases
+
+    matrix = numpy.frombuffer(series, dtype="d")
+    cases["numpy dumps"] = lambda: jsonstar.dumps(matrix)
+    cases["numpy fragments"] = lambda: jsonstar.dumps(matrix, fragment_cache=jsonstar.FragmentCache())
+    if orjson is not None:
+        cases["numpy orjson"] = lambda: jsonstar.dumps_bytes(matrix, backend="orjson", **COMPACT)
+    return cases
+
+
+def retained(run):
+    """Return the memory still held by the result of run."""
+    tracemalloc.start()
+    result = run()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main(n=1_000_000, repeat=3):
+    series = array.array("d", (random.uniform(-1000, 1000) for _ in range(n)))
+    print(f"Encoding {n:,} floats")
+    print(f"{'case':>20} {'seconds':>8} {'peak MB':>8}")
+    for name, run in encode_cases(series).items():
+        seconds, peak = measure(run, repeat)
+        print(f"{name:>20} {seconds:>8.3f} {peak / 2**20:>8.1f}")
+
+    arrays = []
+    for start in range(0, n, 1000):
+        end = start + 1000
+        arrays.append(series[start:end])
+    data = jsonstar.dumps({"series": arrays})
+    print(f"\nDecoding {n:,} floats in arrays of 1,000, {len(data) / 2**20:.1f} MB")
+    print(f"{'case':>20} {'seconds':>8} {'kept MB':>8}")
+    for name, kwargs in {"lists": {}, "numeric_arrays": {"numeric_arrays": True}}.items():
+        seconds = min(timeit.repeat(lambda: jsonstar.loads(data, **kwargs), number=1, repeat=repeat))
+        size = retained(lambda: jsonstar.loads(data, **kwargs))
+        print(f"{name:>20} {seconds:>8.3f} {size / 2**20:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
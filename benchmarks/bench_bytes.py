@@ -0,0 +1,42 @@
+"""Time to produce UTF-8 bytes with dumps().encode() and dumps_bytes on the stdlib and orjson backends.
+
+Run with: python -m benchmarks.bench_bytes
+"""
+
+import datetime
+import decimal
+import timeit
+import uuid
+
+import jsonstar
+from jsonstar.backends import orjson
+
+
+COMPACT = {"separators": (",", ":"), "ensure_ascii": False}
+
+
+def make_payload(n):
+    now = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    return [
+        {"id": uuid.uuid4(), "amount": decimal.Decimal("9.99"), "at": now, "tags": ["a", "b"], "name": f"record {i}"}
+        for i in range(n)
+    ]
+
+
+def main(n=100_000):
+    payload = make_payload(n)
+    cases = {
+        "dumps().encode()": lambda: jsonstar.dumps(payload, **COMPACT).encode(),
+        "dumps_bytes json": lambda: jsonstar.dumps_bytes(payload, backend="json", **COMPACT),
+    }
+    if orjson is not None:
+        cases["dumps_bytes orjson"] = lambda: jsonstar.dumps_bytes(payload, backend="orjson", **COMPACT)
+
+    print(f"{'case':>20} {'seconds':>8}")
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=1, repeat=5))
+        print(f"{name:>20} {seconds:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Encoding time of dataclasses through dataclasses_asdict, the shallow encoder and compiled serializers.
+
+Run with: python -m benchmarks.bench_compiled
+"""
+
+import dataclasses
+import datetime
+import decimal
+import timeit
+import uuid
+
+from jsonstar.encoder import JSONEncoderStar, ShallowJSONEncoderStar
+
+
+@dataclasses.dataclass
+class Item:
+    id: uuid.UUID
+    price: decimal.Decimal
+    created_at: datetime.datetime
+    name: str
+
+
+@dataclasses.dataclass
+class Order:
+    id: int
+    placed_at: datetime.datetime
+    items: list
+
+
+class CompiledJSONEncoderStar(JSONEncoderStar):
+    compile_serializers = True
+
+
+def make_payload(orders):
+    now = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    return [
+        Order(
+            id=i,
+            placed_at=now,
+            items=[Item(uuid.uuid4(), decimal.Decimal("9.99"), now, f"item {j}") for j in range(5)],
+        )
+        for i in range(orders)
+    ]
+
+
+def main(orders=10_000):
+    payload = make_payload(orders)
+    CompiledJSONEncoderStar.precompile(Order, Item)
+
+    print(f"{'encoder':>24} {'seconds':>8}")
+    for cls in (JSONEncoderStar, ShallowJSONEncoderStar, CompiledJSONEncoderStar):
+        encoder = cls()
+        seconds = min(timeit.repeat(lambda: encoder.encode(payload), number=1, repeat=5))
+        print(f"{cls.__name__:>24} {seconds:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Throughput of the datetime and date encoders on time-series exports, with and without the LRU cache.
+
+Run with: python -m benchmarks.bench_datetime
+"""
+
+import datetime
+import timeit
+
+import jsonstar
+from jsonstar.default_encoders import cached_temporal_encoders, encode_datetime_as_ecma262_string
+from jsonstar.encoder import TypedEncoderRegistry
+
+
+START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def make_series(points, distinct):
+    """Rows of a time-series export where timestamps and days repeat every distinct points."""
+    days = [(START + datetime.timedelta(days=i)).date() for i in range(30)]
+    return [{"at": START + datetime.timedelta(seconds=i % distinct), "day": days[i % 30]} for i in range(points)]
+
+
+def baseline(o):
+    return o.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def main(points=200_000, distinct=(200_000, 10_000, 100), repeat=3):
+    datetimes = [START + datetime.timedelta(seconds=i, microseconds=i) for i in range(points)]
+    for name, encode in (("isoformat + replace", baseline), ("default encoder", encode_datetime_as_ecma262_string)):
+        seconds = min(timeit.repeat(lambda: list(map(encode, datetimes)), number=1, repeat=repeat))
+        print(f"{name:>20} {seconds / points * 1e9:>8.0f} ns/datetime")
+
+    cached = TypedEncoderRegistry(cached_temporal_encoders()).freeze()
+    print(f"\n{'distinct':>10} {'default rows/s':>15} {'cached rows/s':>15}")
+    for count in distinct:
+        series = make_series(points, count)
+        default = min(timeit.repeat(lambda: jsonstar.dumps(series), number=1, repeat=repeat))
+        lru = min(timeit.repeat(lambda: jsonstar.dumps(series, typed_encoders=cached), number=1, repeat=repeat))
+        print(f"{count:>10} {points / default:>15,.0f} {points / lru:>15,.0f}")
+
+
+if __name__ == "__main__":
+    main()
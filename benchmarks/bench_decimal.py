@@ -0,0 +1,59 @@
+"""Throughput of Decimal amounts written as strings and as JSON numbers, and decoded back, on a ledger payload.
+
+Run with: python -m benchmarks.bench_decimal
+"""
+
+import decimal
+import json
+import timeit
+
+import jsonstar
+from jsonstar.backends import orjson
+
+
+COMPACT = {"separators": (",", ":"), "ensure_ascii": False}
+
+
+def make_ledger(entries):
+    """Ledger entries with three amounts each, all with two decimal places."""
+    return [
+        {
+            "id": i,
+            "account": f"acct-{i % 1000:04d}",
+            "debit": decimal.Decimal(i % 10_000) / 100,
+            "credit": decimal.Decimal(i % 7_000) / 100,
+            "balance": decimal.Decimal(i * 37 % 1_000_000) / 100,
+        }
+        for i in range(entries)
+    ]
+
+
+def main(entries=400_000, repeat=3):
+    ledger = make_ledger(entries)
+    amounts = entries * 3
+
+    encode_cases = {
+        "strings": lambda: jsonstar.dumps(ledger),
+        "numbers": lambda: jsonstar.dumps(ledger, decimals_as_numbers=True),
+        "float round trip": lambda: json.dumps(ledger, default=float),
+    }
+    if orjson is not None and hasattr(orjson, "Fragment"):
+        encode_cases["numbers orjson"] = lambda: jsonstar.dumps_bytes(
+            ledger, backend="orjson", decimals_as_numbers=True, **COMPACT
+        )
+
+    document = jsonstar.dumps(ledger, decimals_as_numbers=True)
+    decode_cases = {
+        "numbers as floats": lambda: json.loads(document),
+        "numbers as Decimals": lambda: jsonstar.loads(document, decimals_as_numbers=True),
+    }
+
+    print(f"{'case':>28} {'seconds':>8} {'amounts/s':>12}")
+    for kind, cases in (("encode", encode_cases), ("decode", decode_cases)):
+        for name, case in cases.items():
+            seconds = min(timeit.repeat(case, number=1, repeat=repeat))
+            print(f"{kind + ' ' + name:>28} {seconds:>8.3f} {amounts / seconds:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
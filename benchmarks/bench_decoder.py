@@ -0,0 +1,40 @@
+"""Decode throughput of JSONDecoderStar against stdlib json.loads on string heavy documents.
+
+Run with: python -m benchmarks.bench_decoder
+"""
+
+import json
+import timeit
+
+import jsonstar
+
+
+def make_document(records):
+    return json.dumps(
+        [
+            {
+                "id": f"user-{i}",
+                "name": f"User Number {i}",
+                "email": f"user{i}@example.com",
+                "bio": "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
+                "city": "Rio de Janeiro",
+                "created_at": "2024-01-01T12:30:45.123+00:00",
+                "zip": "20000000",
+            }
+            for i in range(records)
+        ]
+    )
+
+
+def main(records=100_000):
+    document = make_document(records)
+    size = len(document) / 1024 / 1024
+
+    print(f"{'decoder':>16} {'seconds':>8} {'MB/s':>8}")
+    for name, loads in (("json.loads", json.loads), ("jsonstar.loads", jsonstar.loads)):
+        seconds = min(timeit.repeat(lambda: loads(document), number=1, repeat=5))
+        print(f"{name:>16} {seconds:>8.3f} {size / seconds:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Per-object cost of JSONEncoderStar.default as the number of registered typed encoders grows.
+
+Run with: python -m benchmarks.bench_dispatch
+"""
+
+import decimal
+import timeit
+
+from jsonstar.encoder import JSONEncoderStar
+
+
+def make_encoder(registered_types):
+    class BenchEncoder(JSONEncoderStar):
+        pass
+
+    for i in range(registered_types):
+        BenchEncoder.register_default_encoder(str, type(f"Type{i}", (), {}))
+
+    return BenchEncoder()
+
+
+def main(sizes=(0, 10, 100, 1000), objects=100_000):
+    payload = [decimal.Decimal(i) for i in range(objects)]
+
+    print(f"{'registered types':>16} {'ns/object':>10}")
+    for size in sizes:
+        encoder = make_encoder(size)
+        seconds = min(timeit.repeat(lambda: encoder.encode(payload), number=1, repeat=5))
+        print(f"{size:>16} {seconds / objects * 1e9:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
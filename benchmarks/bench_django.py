@@ -0,0 +1,87 @@
+"""Peak RSS and time to dump a table of a million rows, as a list of models or as a queryset read in chunks.
+
+Each mode runs in its own process on the same SQLite database file, since the peak RSS of a process never goes down.
+
+Run with: python -m benchmarks.bench_django
+"""
+
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import jsonstar
+
+
+def setup(path):
+    import django
+    from django.conf import settings
+
+    settings.configure(
+        INSTALLED_APPS=["django.contrib.auth", "django.contrib.contenttypes"],
+        DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": path}},
+    )
+    django.setup()
+
+
+def populate(path, n):
+    setup(path)
+    from django.contrib.auth.models import Permission
+    from django.contrib.contenttypes.models import ContentType
+    from django.core.management import call_command
+
+    call_command("migrate", run_syncdb=True, verbosity=0)
+    content_type = ContentType.objects.get_for_model(Permission)
+    for start in range(0, n, 10_000):
+        Permission.objects.bulk_create(
+            Permission(name=f"Can do thing {i}", codename=f"thing_{i}", content_type=content_type)
+            for i in range(start, min(start + 10_000, n))
+        )
+
+
+def model_to_dict_list(queryset):
+    from django.forms.models import model_to_dict
+
+    return [model_to_dict(model) for model in queryset]
+
+
+MODES = {
+    "model_to_dict list": model_to_dict_list,
+    "list of models": list,
+    "queryset": lambda queryset: queryset,
+}
+
+
+def run(mode, path):
+    setup(path)
+    from django.contrib.auth.models import Permission
+
+    start = time.perf_counter()
+    with open(os.devnull, "w") as fp:
+        jsonstar.dump(MODES[mode](Permission.objects.all()), fp)
+    seconds = time.perf_counter() - start
+    return seconds, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def main(n=1_000_000):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "db.sqlite3")
+        subprocess.check_call([sys.executable, "-m", "benchmarks.bench_django", "populate", path, str(n)])
+
+        print(f"{n:,} rows")
+        print(f"{'mode':>20} {'seconds':>8} {'rows/s':>10} {'peak RSS (KiB)':>15}")
+        for mode in MODES:
+            output = subprocess.check_output([sys.executable, "-m", "benchmarks.bench_django", mode, path], text=True)
+            seconds, rss = output.split()
+            print(f"{mode:>20} {float(seconds):>8.2f} {n / float(seconds):>10,.0f} {int(rss):>15,}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "populate":
+        populate(sys.argv[2], int(sys.argv[3]))
+    elif len(sys.argv) > 1:
+        print(*run(*sys.argv[1:]))
+    else:
+        main()
@@ -0,0 +1,42 @@
+"""Peak RSS of jsonstar.dump streaming generated records to a file, as the output grows.
+
+Each size runs in its own process, since the peak RSS of a process never goes down.
+
+Run with: python -m benchmarks.bench_dump_memory
+"""
+
+import datetime
+import decimal
+import os
+import resource
+import subprocess
+import sys
+
+import jsonstar
+
+
+def records(n):
+    now = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    for i in range(n):
+        yield {"id": i, "amount": decimal.Decimal("9.99"), "created_at": now, "name": f"record {i}"}
+
+
+def run(n):
+    with open(os.devnull, "w") as fp:
+        jsonstar.dump({"records": records(n)}, fp)
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def main(sizes=(10_000, 100_000, 1_000_000)):
+    print(f"{'records':>10} {'peak RSS (KiB)':>15}")
+    for n in sizes:
+        output = subprocess.check_output([sys.executable, "-m", "benchmarks.bench_dump_memory", str(n)], text=True)
+        print(f"{n:>10} {output.strip():>15}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        print(run(int(sys.argv[1])))
+    else:
+        main()
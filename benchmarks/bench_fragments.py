@@ -0,0 +1,97 @@
+"""Time to encode responses repeating the same reference objects, with and without a shared fragment cache.
+
+Run with: python -m benchmarks.bench_fragments
+"""
+
+import dataclasses
+import decimal
+import timeit
+
+from pydantic import BaseModel, ConfigDict
+
+import jsonstar
+
+
+COMPACT = {"separators": (",", ":"), "ensure_ascii": False}
+
+
+@dataclasses.dataclass(frozen=True)
+class Currency:
+    code: str
+    name: str
+    symbol: str
+    decimals: int
+
+
+@dataclasses.dataclass(frozen=True)
+class Country:
+    code: str
+    name: str
+    currency: Currency
+
+
+@dataclasses.dataclass(frozen=True)
+class Product:
+    sku: str
+    name: str
+    description: str
+    price: decimal.Decimal
+    currency: Currency
+
+
+class PydanticProduct(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    sku: str
+    name: str
+    description: str
+    price: decimal.Decimal
+
+
+def make_response(n, product):
+    currencies = [Currency(f"C{i:02}", f"Currency {i}", "¤", 2) for i in range(10)]
+    countries = [Country(f"K{i:02}", f"Country ação {i}", currencies[i % 10]) for i in range(20)]
+    products = [product(i, currencies[i % 10]) for i in range(100)]
+    return [{"id": i, "quantity": i % 7, "country": countries[i % 20], "product": products[i % 100]} for i in range(n)]
+
+
+def dataclass_product(i, currency):
+    return Product(f"SKU-{i}", f"Product {i}", "Lorem ipsum dolor sit amet.", decimal.Decimal("9.99"), currency)
+
+
+def pydantic_product(i, currency):
+    return PydanticProduct(sku=f"SKU-{i}", name=f"Product {i}", description="Lorem ipsum.", price="9.99")
+
+
+CASES = {
+    "dataclasses": (dataclass_product, jsonstar.JSONEncoderStar),
+    "dataclasses shallow": (dataclass_product, jsonstar.ShallowJSONEncoderStar),
+    "pydantic": (pydantic_product, jsonstar.JSONEncoderStar),
+}
+
+
+def main(n=10_000, repeat=5):
+    print(f"{n:,} orders per response, 100 distinct products, 20 countries and 10 currencies")
+    print(f"{'case':>20} {'no cache':>9} {'cache':>9} {'speedup':>8} {'orjson':>9} {'cache':>9} {'speedup':>8}")
+    for name, (product, cls) in CASES.items():
+        response = make_response(n, product)
+        cache = jsonstar.FragmentCache()
+        assert jsonstar.dumps(response, cls=cls, fragment_cache=cache) == jsonstar.dumps(response, cls=cls)
+
+        times = [
+            min(timeit.repeat(run, number=1, repeat=repeat))
+            for run in (
+                lambda: jsonstar.dumps(response, cls=cls),
+                lambda: jsonstar.dumps(response, cls=cls, fragment_cache=cache),
+                lambda: jsonstar.dumps_bytes(response, cls=cls, backend="orjson", **COMPACT),
+                lambda: jsonstar.dumps_bytes(response, cls=cls, backend="orjson", fragment_cache=cache, **COMPACT),
+            )
+        ]
+        print(
+            f"{name:>20} {times[0]:>9.3f} {times[1]:>9.3f} {times[0] / times[1]:>7.1f}x"
+            f" {times[2]:>9.3f} {times[3]:>9.3f} {times[2] / times[3]:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Time to import jsonstar in a fresh interpreter, compared with the stdlib json module.
+
+Run with: python -m benchmarks.bench_import
+"""
+
+import subprocess
+import sys
+
+
+CODE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start, *sorted({{'attrs', 'django', 'pydantic'}} & set(sys.modules)))
+"""
+
+
+def import_time(module, repeat):
+    """Return the fastest import time and the optional integrations imported along."""
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", CODE.format(module=module)], capture_output=True, text=True)
+        seconds, *imported = output.stdout.split()
+        runs.append((float(seconds), imported))
+    return min(runs)
+
+
+def main(modules=("json", "jsonstar"), repeat=10):
+    print(f"{'module':>10} {'ms':>8}  imported integrations")
+    for module in modules:
+        seconds, imported = import_time(module, repeat)
+        print(f"{module:>10} {seconds * 1e3:>8.1f}  {', '.join(imported) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
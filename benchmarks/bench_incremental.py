@@ -0,0 +1,64 @@
+"""Peak RSS and time to go through every element of a large JSON array file, whole or incrementally.
+
+Each mode runs in its own process, since the peak RSS of a process never goes down.
+
+Run with: python -m benchmarks.bench_incremental
+"""
+
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import jsonstar
+
+
+MODES = {
+    "load": lambda fp: jsonstar.load(fp, cls=jsonstar.JSONDecoderStar),
+    "iterload": lambda fp: jsonstar.iterload(fp),
+    "iterload memory_map": lambda fp: jsonstar.iterload(fp, memory_map=True),
+}
+
+
+def write_array(path, n):
+    with open(path, "w") as fp:
+        jsonstar.dump(
+            (
+                {"id": i, "name": f"record {i}", "created_at": "2024-01-01T12:30:45.123Z", "tags": ["a", "b"]}
+                for i in range(n)
+            ),
+            fp,
+        )
+
+
+def run(mode, path):
+    start = time.perf_counter()
+    with open(path, "rb") as fp:
+        count = sum(1 for _ in MODES[mode](fp))
+    seconds = time.perf_counter() - start
+    return count, seconds, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def main(n=500_000):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "array.json")
+        write_array(path, n)
+        size = os.path.getsize(path) / 2**20
+
+        print(f"{size:.0f} MiB, {n:,} elements")
+        print(f"{'mode':>20} {'seconds':>8} {'peak RSS (KiB)':>15}")
+        for mode in MODES:
+            output = subprocess.check_output(
+                [sys.executable, "-m", "benchmarks.bench_incremental", mode, path], text=True
+            )
+            count, seconds, rss = output.split()
+            print(f"{mode:>20} {float(seconds):>8.2f} {int(rss):>15,}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        print(*run(*sys.argv[1:]))
+    else:
+        main()
@@ -0,0 +1,37 @@
+"""Throughput of dumps_lines and load_lines against a per record dumps/loads loop.
+
+Run with: python -m benchmarks.bench_lines
+"""
+
+import datetime
+import decimal
+import io
+import timeit
+
+import jsonstar
+
+
+def make_records(n):
+    now = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    return [{"id": i, "amount": decimal.Decimal("9.99"), "at": now, "event": "payment"} for i in range(n)]
+
+
+def main(n=100_000):
+    records = make_records(n)
+    text = jsonstar.dumps_lines(records)
+
+    cases = {
+        "dumps loop": lambda: "".join(jsonstar.dumps(record) + "\n" for record in records),
+        "dumps_lines": lambda: jsonstar.dumps_lines(records),
+        "loads loop": lambda: [jsonstar.loads(line) for line in io.StringIO(text)],
+        "load_lines": lambda: list(jsonstar.load_lines(io.StringIO(text))),
+    }
+
+    print(f"{'case':>12} {'records/s':>12}")
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=1, repeat=5))
+        print(f"{name:>12} {n / seconds:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Time to encode lists of nested pydantic v2 models, through model_dump or through their compiled serializer.
+
+Run with: python -m benchmarks.bench_native
+"""
+
+import datetime
+import decimal
+import timeit
+import uuid
+
+from pydantic import BaseModel
+
+import jsonstar
+
+
+class Product(BaseModel):
+    id: uuid.UUID
+    sku: str
+    name: str
+    price: decimal.Decimal
+    released: datetime.date
+
+
+class Line(BaseModel):
+    product: Product
+    quantity: int
+    notes: str | None = None
+
+
+class Order(BaseModel):
+    id: int
+    customer: str
+    lines: list[Line]
+    tags: list[str]
+
+
+class ModelDumpEncoder(jsonstar.JSONEncoderStar):
+    native_pydantic = False
+
+
+def make_orders(n):
+    return [
+        Order(
+            id=i,
+            customer=f"Customer {i}",
+            lines=[
+                Line(
+                    product=Product(
+                        id=uuid.UUID(int=i * 10 + j),
+                        sku=f"SKU-{j}",
+                        name=f"Product ação {j}",
+                        price=decimal.Decimal("9.99"),
+                        released=datetime.date(2024, 1, 1),
+                    ),
+                    quantity=j,
+                )
+                for j in range(10)
+            ],
+            tags=["new", "priority"],
+        )
+        for i in range(n)
+    ]
+
+
+COMPACT = {"separators": (",", ":"), "ensure_ascii": False}
+
+
+def main(n=5_000, repeat=5):
+    orders = make_orders(n)
+    cases = {
+        "dumps, default format": lambda cls: jsonstar.dumps(orders, cls=cls),
+        "dumps_bytes, orjson": lambda cls: jsonstar.dumps_bytes(orders, cls=cls, backend="orjson", **COMPACT),
+        "dumps_bytes, json": lambda cls: jsonstar.dumps_bytes(
+            orders, cls=cls, backend="json", fragment_cache=jsonstar.FragmentCache(), **COMPACT
+        ),
+    }
+
+    print(f"{n:,} orders of 10 lines")
+    print(f"{'case':>24} {'model_dump':>11} {'native':>8} {'speedup':>8}")
+    for name, case in cases.items():
+        assert case(ModelDumpEncoder) == case(jsonstar.JSONEncoderStar)
+        before = min(timeit.repeat(lambda: case(ModelDumpEncoder), number=1, repeat=repeat))
+        after = min(timeit.repeat(lambda: case(jsonstar.JSONEncoderStar), number=1, repeat=repeat))
+        print(f"{name:>24} {before:>11.3f} {after:>8.3f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
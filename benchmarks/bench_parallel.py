@@ -0,0 +1,44 @@
+"""Encoding time of a large list of dataclasses with dumps against dumps_parallel on process and thread pools.
+
+Run with: python -m benchmarks.bench_parallel
+"""
+
+import dataclasses
+import datetime
+import decimal
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import jsonstar
+
+
+@dataclasses.dataclass
+class Record:
+    id: int
+    amount: decimal.Decimal
+    created_at: datetime.datetime
+    name: str
+
+
+def main(n=200_000, chunk_size=5_000):
+    now = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    records = [Record(i, decimal.Decimal("9.99"), now, f"record {i}") for i in range(n)]
+
+    cases = {
+        "dumps": lambda: jsonstar.dumps(records),
+        "threads": lambda: jsonstar.dumps_parallel(records, threads, chunk_size=chunk_size),
+        "processes": lambda: jsonstar.dumps_parallel(records, processes, chunk_size=chunk_size),
+    }
+
+    with ProcessPoolExecutor() as processes, ThreadPoolExecutor() as threads:
+        jsonstar.dumps_parallel(records[:chunk_size], processes, chunk_size=chunk_size)  # start the workers
+
+        print(f"{'case':>10} {'seconds':>8}")
+        for name, case in cases.items():
+            start = time.perf_counter()
+            case()
+            print(f"{name:>10} {time.perf_counter() - start:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
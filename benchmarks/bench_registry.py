@@ -0,0 +1,51 @@
+"""Cost of building typed encoder registries for many model classes, at startup and per encoder instance.
+
+Run with: python -m benchmarks.bench_registry
+"""
+
+import timeit
+
+from jsonstar.encoder import JSONEncoderStar, TypedEncoderRegistry
+
+
+def make_models(count):
+    """A shallow hierarchy of model classes, like the ones an ORM generates."""
+    base = type("Model", (), {})
+    mixins = [type(f"Mixin{i}", (base,), {}) for i in range(10)]
+    return [type(f"Model{i}", (mixins[i % 10],), {}) for i in range(count)]
+
+
+def main(sizes=(100, 500, 2000), number=20):
+    print(f"{'models':>8} {'startup ms':>11} {'bulk ms':>8} {'per instance µs':>16} {'shared µs':>10}")
+    for size in sizes:
+        encoders = {model: str for model in make_models(size)}
+
+        def startup():
+            class StartupEncoder(JSONEncoderStar):
+                pass
+
+            for model, encoder in encoders.items():
+                StartupEncoder.register_default_encoder(encoder, model)
+            StartupEncoder.default_typed_encoders()
+
+        def bulk():
+            class BulkEncoder(JSONEncoderStar):
+                pass
+
+            BulkEncoder.register_default_encoders(encoders)
+            BulkEncoder.default_typed_encoders()
+
+        shared = TypedEncoderRegistry(encoders).freeze()
+
+        startup_seconds = min(timeit.repeat(startup, number=1, repeat=3))
+        bulk_seconds = min(timeit.repeat(bulk, number=1, repeat=3))
+        instance_seconds = min(timeit.repeat(lambda: JSONEncoderStar(typed_encoders=encoders), number=number))
+        shared_seconds = min(timeit.repeat(lambda: JSONEncoderStar(typed_encoders=shared), number=number))
+        print(
+            f"{size:>8} {startup_seconds * 1e3:>11.1f} {bulk_seconds * 1e3:>8.1f}"
+            f" {instance_seconds / number * 1e6:>16.1f} {shared_seconds / number * 1e6:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Time and peak traced memory to decode a few key paths out of a large document, against decoding it whole.
+
+Run with: python -m benchmarks.bench_select
+"""
+
+import datetime
+import json
+import timeit
+import tracemalloc
+
+import jsonstar
+
+
+def make_document(n):
+    return json.dumps(
+        {
+            "meta": {"count": n, "created_at": "2024-01-01T12:30:45.123+00:00"},
+            "items": [
+                {
+                    "id": i,
+                    "sku": f"SKU-{i:08}",
+                    "name": f"Product number {i}",
+                    "description": "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
+                    "price": "19.99",
+                    "created_at": "2024-01-01T12:30:45.123+00:00",
+                    "updated_at": "2024-02-01T08:00:00+00:00",
+                    "tags": ["new", "sale", "featured"],
+                    "dimensions": {"width": 10.5, "height": 4.25, "depth": 1.0, "unit": "cm"},
+                    "seller": {"id": i % 100, "name": f"Seller {i % 100}", "joined": "2020-05-17"},
+                    "ratings": [{"stars": 5, "at": "2024-03-01T00:00:00"}, {"stars": 4, "at": "2024-03-02T00:00:00"}],
+                }
+                for i in range(n)
+            ],
+        }
+    )
+
+
+CASES = {
+    "stdlib json.loads": lambda document: json.loads(document),
+    "jsonstar.loads": lambda document: jsonstar.loads(document),
+    "select items[*].id": lambda document: jsonstar.loads(document, select=["items[*].id"]),
+    "select 3 paths": lambda document: jsonstar.loads(
+        document, select=["meta.created_at", "items[*].id", "items[*].seller.id"]
+    ),
+    "select typed paths": lambda document: jsonstar.loads(
+        document, select={"items[*].id": int, "items[*].created_at": datetime.datetime}
+    ),
+    "select meta only": lambda document: jsonstar.loads(document, select=["meta.created_at"]),
+}
+
+
+def measure(run, repeat):
+    seconds = min(timeit.repeat(run, number=1, repeat=repeat))
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return seconds, peak
+
+
+def main(n=50_000, repeat=5):
+    document = make_document(n)
+    print(f"{len(document) / 2**20:.0f} MiB, {n:,} items")
+    print(f"{'case':>20} {'seconds':>8} {'peak KiB':>10}")
+    for name, case in CASES.items():
+        seconds, peak = measure(lambda: case(document), repeat)
+        print(f"{name:>20} {seconds:>8.3f} {peak / 1024:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
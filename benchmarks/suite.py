@@ -0,0 +1,287 @@
+"""Benchmark suite for the encoder and decoder hot paths, with stdlib json as the baseline.
+
+Every case runs on synthetic payloads, offline, and reports throughput and peak traced memory for jsonstar and for
+the stdlib baseline. Results can be saved and compared between runs.
+
+Run with:
+    python -m benchmarks.suite
+    python -m benchmarks.suite --save before.json
+    python -m benchmarks.suite --compare before.json
+    python -m benchmarks.suite --filter decode
+"""
+
+import argparse
+import dataclasses
+import datetime
+import decimal
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+import uuid
+
+import jsonstar
+from jsonstar import JSONEncoderStar
+
+
+CASES = {}
+
+
+def case(name):
+    """Register a function returning (objects, jsonstar_run, baseline_run), or None when it can't run here."""
+
+    def register(function):
+        CASES[name] = function
+        return function
+
+    return register
+
+
+def stdlib_default(o):
+    """What one would write by hand to feed these payloads to stdlib json."""
+    if dataclasses.is_dataclass(o):
+        return dataclasses.asdict(o)
+    if isinstance(o, (set, frozenset)):
+        return list(o)
+    return str(o)
+
+
+def encode_case(payload, cls=JSONEncoderStar):
+    return (
+        len(payload),
+        lambda: jsonstar.dumps(payload, cls=cls),
+        lambda: json.dumps(payload, default=stdlib_default),
+    )
+
+
+NOW = datetime.datetime(2024, 1, 1, 12, 30, 45, 123456, tzinfo=datetime.timezone.utc)
+
+TYPED_PAYLOADS = {
+    "datetime": lambda i: NOW + datetime.timedelta(seconds=i),
+    "date": lambda i: datetime.date(2024, 1, 1) + datetime.timedelta(days=i % 1000),
+    "time": lambda i: datetime.time(i % 24, i % 60, i % 60, i % 1000),
+    "timedelta": lambda i: datetime.timedelta(seconds=i, microseconds=i % 1000),
+    "decimal": lambda i: decimal.Decimal(i) / 100,
+    "uuid": lambda i: uuid.UUID(int=i),
+    "set": lambda i: {i, i + 1},
+    "frozenset": lambda i: frozenset((i, i + 1)),
+}
+
+
+def typed_case(make):
+    return lambda n: encode_case([make(i) for i in range(n)])
+
+
+for _name, _make in TYPED_PAYLOADS.items():
+    case(f"encode {_name}")(typed_case(_make))
+
+
+@dataclasses.dataclass
+class Item:
+    id: uuid.UUID
+    price: decimal.Decimal
+    created_at: datetime.datetime
+    name: str
+
+
+@case("encode dataclass")
+def encode_dataclass(n):
+    return encode_case([Item(uuid.UUID(int=i), decimal.Decimal("9.99"), NOW, f"item {i}") for i in range(n)])
+
+
+@case("encode attrs")
+def encode_attrs(n):
+    try:
+        import attrs
+    except ImportError:
+        return None
+
+    @attrs.define
+    class AttrsItem:
+        id: int
+        price: decimal.Decimal
+        name: str
+
+    payload = [AttrsItem(i, decimal.Decimal("9.99"), f"item {i}") for i in range(n)]
+
+    def default(o):
+        return attrs.asdict(o) if attrs.has(type(o)) else str(o)
+
+    return len(payload), lambda: jsonstar.dumps(payload), lambda: json.dumps(payload, default=default)
+
+
+@case("encode pydantic")
+def encode_pydantic(n):
+    try:
+        from pydantic import BaseModel
+    except ImportError:
+        return None
+
+    class PydanticItem(BaseModel):
+        id: int
+        price: decimal.Decimal
+        name: str
+
+    payload = [PydanticItem(id=i, price=decimal.Decimal("9.99"), name=f"item {i}") for i in range(n)]
+    return (
+        len(payload),
+        lambda: jsonstar.dumps(payload),
+        lambda: json.dumps(payload, default=lambda o: o.model_dump(mode="json")),
+    )
+
+
+@case("encode django")
+def encode_django(n):
+    try:
+        import django
+        from django.conf import settings
+    except ImportError:
+        return None
+
+    if not settings.configured:
+        settings.configure(INSTALLED_APPS=["django.contrib.auth", "django.contrib.contenttypes"])
+        django.setup()
+
+    from django.contrib.auth.models import User
+    from django.forms.models import model_to_dict
+
+    def default(o):
+        return model_to_dict(o) if isinstance(o, User) else str(o)
+
+    payload = [User(username=f"user{i}", date_joined=NOW) for i in range(n)]
+    return len(payload), lambda: jsonstar.dumps(payload), lambda: json.dumps(payload, default=default)
+
+
+@case("encode deep subclass chain")
+def encode_subclass_chain(n, depth=8):
+    cls = JSONEncoderStar
+    for level in range(depth):
+        cls = type(f"Level{level}Encoder", (cls,), {})
+        cls.register_default_encoder(str, type(f"Type{level}", (), {}))
+
+    return encode_case([decimal.Decimal(i) for i in range(n)], cls)
+
+
+@case("encode large registry")
+def encode_large_registry(n, size=500):
+    class LargeRegistryEncoder(JSONEncoderStar):
+        pass
+
+    for i in range(size):
+        LargeRegistryEncoder.register_default_encoder(str, type(f"Type{i}", (), {}))
+
+    return encode_case([decimal.Decimal(i) for i in range(n)], LargeRegistryEncoder)
+
+
+@case("encode registry construction")
+def encode_registry_construction(n):
+    typed_encoders = {type(f"Type{i}", (), {}): str for i in range(50)}
+    return (
+        n,
+        lambda: [JSONEncoderStar(typed_encoders=typed_encoders).encode(i) for i in range(n)],
+        lambda: [json.JSONEncoder(default=str).encode(i) for i in range(n)],
+    )
+
+
+@case("decode string heavy")
+def decode_string_heavy(n):
+    document = json.dumps(
+        [
+            {
+                "id": f"user-{i}",
+                "name": f"User Number {i}",
+                "email": f"user{i}@example.com",
+                "bio": "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
+                "created_at": "2024-01-01T12:30:45.123+00:00",
+            }
+            for i in range(n)
+        ]
+    )
+    return n, lambda: jsonstar.loads(document), lambda: json.loads(document)
+
+
+def measure(run, repeat):
+    seconds = min(timeit.repeat(run, number=1, repeat=repeat))
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return seconds, peak
+
+
+def run_suite(names, n, repeat):
+    results = {}
+    for name in names:
+        prepared = CASES[name](n)
+        if prepared is None:
+            print(f"{name:<32} skipped, optional dependency missing")
+            continue
+
+        objects, jsonstar_run, baseline_run = prepared
+        seconds, peak = measure(jsonstar_run, repeat)
+        baseline_seconds, baseline_peak = measure(baseline_run, repeat)
+        results[name] = {
+            "objects_per_second": objects / seconds,
+            "peak_kib": peak / 1024,
+            "baseline_objects_per_second": objects / baseline_seconds,
+            "baseline_peak_kib": baseline_peak / 1024,
+        }
+    return results
+
+
+def print_results(results, previous=None):
+    header = f"{'case':<32} {'objects/s':>12} {'stdlib/s':>12} {'ratio':>6} {'peak KiB':>10} {'stdlib KiB':>10}"
+    if previous:
+        header += f" {'vs saved':>9}"
+    print(header)
+
+    for name, result in results.items():
+        speed = result["objects_per_second"]
+        baseline = result["baseline_objects_per_second"]
+        line = (
+            f"{name:<32} {speed:>12,.0f} {baseline:>12,.0f} {speed / baseline:>6.2f}"
+            f" {result['peak_kib']:>10,.0f} {result['baseline_peak_kib']:>10,.0f}"
+        )
+        if previous and name in previous:
+            line += f" {speed / previous[name]['objects_per_second'] - 1:>+9.1%}"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", type=int, default=20_000, help="objects per payload")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case, the fastest is reported")
+    parser.add_argument("--filter", default="", help="only run cases containing this text")
+    parser.add_argument("--save", metavar="FILE", help="save the results as JSON")
+    parser.add_argument("--compare", metavar="FILE", help="compare with results saved before")
+    args = parser.parse_args(argv)
+
+    names = [name for name in CASES if args.filter in name]
+    results = run_suite(names, args.n, args.repeat)
+
+    previous = None
+    if args.compare:
+        with open(args.compare) as fp:
+            previous = json.load(fp)["results"]
+
+    print_results(results, previous)
+
+    if args.save:
+        with open(args.save, "w") as fp:
+            json.dump(
+                {
+                    "python": sys.version,
+                    "platform": platform.platform(),
+                    "n": args.n,
+                    "results": results,
+                },
+                fp,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,129 @@
 import json as stdlib_json
 
+from jsonstar.aio import adump, aiterencode, aiterload, aload, aload_lines
+from jsonstar.backends import encode_bytes
 from jsonstar.decoder import JSONDecoderStar
-from jsonstar.encoder import JSONEncoderStar
+from jsonstar.encoder import EncoderMeta, JSONEncoderStar, ShallowJSONEncoderStar, TypedEncoderRegistry, value_dependent
+from jsonstar.fragments import FragmentCache
+from jsonstar.incremental import IncrementalDecoder, iterload
+from jsonstar.parallel import iterencode_parallel
+from jsonstar.stats import DecoderStats, EncoderStats
+from jsonstar.streaming import DEFAULT_BUFFER_SIZE, write_buffered
 
 
-def dump(obj, fp, cls=JSONDecoderStar, **kwargs):
-    return stdlib_json.dump(obj, fp, cls=cls, **kwargs)
+__all__ = [
+    "DecoderStats",
+    "EncoderStats",
+    "FragmentCache",
+    "IncrementalDecoder",
+    "JSONDecoderStar",
+    "JSONEncoderStar",
+    "ShallowJSONEncoderStar",
+    "TypedEncoderRegistry",
+    "adump",
+    "aiterencode",
+    "aiterload",
+    "aload",
+    "aload_lines",
+    "dump",
+    "dump_bytes",
+    "dump_lines",
+    "dump_parallel",
+    "dumps",
+    "dumps_bytes",
+    "dumps_lines",
+    "dumps_parallel",
+    "iterload",
+    "load",
+    "load_lines",
+    "loads",
+    "register_default_encoder",
+    "register_default_encoders",
+    "value_dependent",
+]
+
+
+def dump(obj, fp, cls=JSONEncoderStar, buffer_size=DEFAULT_BUFFER_SIZE, **kwargs):
+    """Stream obj to fp in writes of about buffer_size characters, encoding iterators as arrays as they are consumed.
+
+    Memory stays bounded by the buffer size and the nesting depth of obj.
+    """
+    write_buffered(fp, _encoder(cls, kwargs).iterencode(obj), buffer_size)
 
 
 def dumps(obj, cls=JSONEncoderStar, **kwargs):
-    return stdlib_json.dumps(obj, cls=cls, **kwargs)
+    return _encoder(cls, kwargs).encode(obj)
+
+
+def dumps_bytes(obj, cls=JSONEncoderStar, backend="json", **kwargs):
+    """Encode obj as UTF-8 bytes, with the stdlib encoder or, when backend="orjson", with orjson.
+
+    See jsonstar.backends.orjson_options for the configurations orjson supports and how its output differs.
+    """
+    return encode_bytes(_encoder(cls, kwargs), obj, backend)
+
+
+def dump_bytes(obj, fp, cls=JSONEncoderStar, backend="json", buffer_size=DEFAULT_BUFFER_SIZE, **kwargs):
+    """Write obj to a binary file as UTF-8, streaming like dump, or at once with orjson when backend="orjson"."""
+    encoder = _encoder(cls, kwargs)
+    if backend == "json":
+        write_buffered(fp, encoder.iterencode(obj), buffer_size, encoding="utf-8")
+    else:
+        fp.write(encode_bytes(encoder, obj, backend))
+
+
+def _encoder(cls, kwargs):
+    """Reuse the configured instances of jsonstar encoders, building other encoders as stdlib json does."""
+    if cls is None:
+        cls = stdlib_json.JSONEncoder
+
+    if isinstance(cls, EncoderMeta):
+        return cls.configured(**kwargs)
+
+    return cls(**kwargs)
+
+
+def _line_encoder(cls, kwargs):
+    if kwargs.get("indent") is not None:
+        raise ValueError("JSON Lines records can't be indented.")
+
+    return _encoder(cls, kwargs).encode
+
+
+def dumps_lines(records, cls=JSONEncoderStar, **kwargs):
+    """Encode each record as one JSON document per line, reusing a single encoder."""
+    encode = _line_encoder(cls, kwargs)
+    return "".join([f"{encode(record)}\n" for record in records])
+
+
+def dump_lines(records, fp, cls=JSONEncoderStar, buffer_size=DEFAULT_BUFFER_SIZE, **kwargs):
+    """Write each record as one JSON document per line, reusing a single encoder and buffering the writes."""
+    encode = _line_encoder(cls, kwargs)
+    write_buffered(fp, (f"{encode(record)}\n" for record in records), buffer_size)
+
+
+def dumps_parallel(iterable, executor=None, **kwargs):
+    """Encode the items of iterable as a JSON array, or JSON Lines with lines=True, in chunks on executor.
+
+    See jsonstar.parallel.iterencode_parallel for the options.
+    """
+    return "".join(iterencode_parallel(iterable, executor, **kwargs))
+
+
+def dump_parallel(iterable, fp, executor=None, buffer_size=DEFAULT_BUFFER_SIZE, **kwargs):
+    """Write the items of iterable as a JSON array, or JSON Lines with lines=True, encoding chunks on executor."""
+    write_buffered(fp, iterencode_parallel(iterable, executor, **kwargs), buffer_size)
+
+
+def load_lines(fp, cls=JSONDecoderStar, buffer_size=DEFAULT_BUFFER_SIZE, **kwargs):
+    """Lazily yield the records of a JSON Lines file, reading about buffer_size characters at a time."""
+    decode = cls(**kwargs).decode
+    for lines in iter(lambda: fp.readlines(buffer_size), []):
+        for line in lines:
+            if isinstance(line, bytes):
+                line = line.decode("utf-8")
+            if line.strip():
+                yield decode(line)
 
 
 def load(fp, *, cls=None, **kwargs):
@@ -22,3 +136,7 @@ def loads(obj, cls=JSONDecoderStar, **kwargs):
 
 def register_default_encoder(function, type_=JSONEncoderStar.FUNCTIONAL):
     return JSONEncoderStar.register_default_encoder(function, type_)
+
+
+def register_default_encoders(typed_encoders):
+    return JSONEncoderStar.register_default_encoders(typed_encoders)
@@ -0,0 +1,99 @@
+import codecs
+import types
+
+from jsonstar.decoder import JSONDecoderStar
+from jsonstar.encoder import EncoderMeta, JSONEncoderStar
+from jsonstar.incremental import IncrementalDecoder
+from jsonstar.streaming import DEFAULT_BUFFER_SIZE
+
+
+__all__ = ["adump", "aiterencode", "aiterload", "aload", "aload_lines"]
+
+
+@types.coroutine
+def yield_to_loop():
+    """Let the event loop run other tasks, like asyncio.sleep(0) does, without importing asyncio with jsonstar."""
+    yield
+
+
+async def aiterencode(obj, cls=JSONEncoderStar, chunk_size=DEFAULT_BUFFER_SIZE, encoding="utf-8", **kwargs):
+    """Encode obj as an async generator of byte chunks, yielding to the event loop after every chunk_size characters.
+
+    Iterators are streamed as arrays, like in jsonstar.dump.
+    """
+    encoder = cls.configured(**kwargs) if isinstance(cls, EncoderMeta) else cls(**kwargs)
+    buffer = []
+    size = 0
+    for chunk in encoder.iterencode(obj):
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= chunk_size:
+            yield "".join(buffer).encode(encoding)
+            buffer.clear()
+            size = 0
+            await yield_to_loop()
+
+    if buffer:
+        yield "".join(buffer).encode(encoding)
+
+
+async def adump(obj, writer, **kwargs):
+    """Write obj to an asyncio.StreamWriter, waiting for it to drain after each chunk."""
+    async for chunk in aiterencode(obj, **kwargs):
+        writer.write(chunk)
+        await writer.drain()
+
+
+async def aread_text(reader, chunk_size, encoding):
+    """Yield the text of an asyncio.StreamReader, decoding multibyte characters split across chunks."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    while chunk := await reader.read(chunk_size):
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+
+async def aload(reader, cls=JSONDecoderStar, chunk_size=DEFAULT_BUFFER_SIZE, encoding="utf-8", **kwargs):
+    """Read a JSON document from an asyncio.StreamReader and decode it once it is complete.
+
+    The document is decoded in one call, blocking the event loop meanwhile, see aiterload for large documents.
+    """
+    text = "".join([part async for part in aread_text(reader, chunk_size, encoding)])
+    return cls(**kwargs).decode(text)
+
+
+async def aiterload(reader, cls=JSONDecoderStar, chunk_size=DEFAULT_BUFFER_SIZE, encoding="utf-8", **kwargs):
+    """Yield the elements of the top-level array read from an asyncio.StreamReader as soon as each is complete, or
+    its only value when it's not an array, yielding to the event loop after every chunk.
+
+    Each chunk is fed to a jsonstar.IncrementalDecoder, so decoding happens while the document is read.
+    """
+    decoder = IncrementalDecoder(cls, encoding, **kwargs)
+    while chunk := await reader.read(chunk_size):
+        for value in decoder.feed(chunk):
+            yield value
+        await yield_to_loop()
+
+    for value in decoder.close():
+        yield value
+
+
+async def aload_lines(reader, cls=JSONDecoderStar, chunk_size=DEFAULT_BUFFER_SIZE, encoding="utf-8", **kwargs):
+    """Yield the records of a JSON Lines stream as soon as each line is complete."""
+    decode = cls(**kwargs).decode
+    pending = []
+    async for part in aread_text(reader, chunk_size, encoding):
+        first, *lines = part.split("\n")
+        pending.append(first)
+        if not lines:
+            continue
+
+        *lines, last = ["".join(pending), *lines]
+        pending = [last]
+        for line in lines:
+            if line.strip():
+                yield decode(line)
+        await yield_to_loop()
+
+    line = "".join(pending)
+    if line.strip():
+        yield decode(line)
@@ -0,0 +1,116 @@
+import array
+import decimal
+import sys
+import uuid
+
+from jsonstar.default_encoders import buffer_tolist, numpy_item
+from jsonstar.fragments import Fragment
+from jsonstar.numeric import number_floatstr
+
+
+try:
+    import orjson
+
+    ORJSON_PASSTHROUGH = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+except ImportError:
+    orjson = None
+
+
+__all__ = ["encode_bytes", "orjson_options"]
+
+
+def orjson_options(encoder):
+    """Return the orjson options writing the output of encoder, or None when orjson can't write it.
+
+    orjson writes UTF-8 without spaces, or indented by 2 spaces, so it only matches encoders configured with
+    ensure_ascii=False and either separators=(",", ":") or indent=2. It writes NaN and infinities as null, so it's
+    never used by encoders refusing them with allow_nan=False. Datetimes and dataclasses are passed through to
+    the encoder default, and UUIDs must keep their default str encoding, which orjson reproduces natively.
+    Decimals written as numbers and cached fragments need orjson.Fragment, from orjson 3.9, without which pydantic
+    models aren't written natively either. NumPy arrays and scalars are written by orjson straight from their memory,
+    unless they have typed encoders of their own.
+
+    Even then, its output differs for a few values: some floats are written in another form, like 1e-7 instead of
+    1e-07, NaN and infinities as null, and plain enums as their values where the encoder refuses them. That's why
+    orjson is only used when asked for.
+    """
+    if orjson is None or encoder.ensure_ascii or encoder.skipkeys or not encoder.allow_nan:
+        return None
+
+    if writes_fragments(encoder) and not hasattr(orjson, "Fragment"):
+        return None
+
+    if encoder.indent is None and (encoder.item_separator, encoder.key_separator) == (",", ":"):
+        options = ORJSON_PASSTHROUGH
+    elif encoder.indent in (2, "  ") and (encoder.item_separator, encoder.key_separator) == (",", ": "):
+        options = ORJSON_PASSTHROUGH | orjson.OPT_INDENT_2
+    else:
+        return None
+
+    typed_encoder_for = getattr(encoder, "typed_encoder_for", None)
+    if typed_encoder_for is not None and typed_encoder_for(uuid.UUID) is not str:
+        return None
+
+    # Without NumPy imported there can't be any of its arrays to write.
+    numpy = sys.modules.get("numpy")
+    if (
+        numpy is not None
+        and typed_encoder_for is not None
+        and typed_encoder_for(numpy.ndarray) is buffer_tolist
+        and typed_encoder_for(numpy.generic) is numpy_item
+    ):
+        options |= orjson.OPT_SERIALIZE_NUMPY
+
+    if encoder.sort_keys:
+        options |= orjson.OPT_SORT_KEYS
+
+    return options
+
+
+def writes_fragments(encoder):
+    return getattr(encoder, "decimals_as_numbers", False) or getattr(encoder, "fragment_cache", None) is not None
+
+
+def orjson_default(encoder):
+    """Return the encoder default, writing Decimals as raw numbers when it does so, and fragments as they are."""
+    writing_default = getattr(encoder, "writing_default", None)
+    if writing_default is None or not hasattr(orjson, "Fragment"):
+        return encoder.default
+
+    fragment_default = writing_default()
+    decimals_as_numbers = encoder.decimals_as_numbers
+    floatstr = number_floatstr(encoder.allow_nan)
+
+    def default(o):
+        if decimals_as_numbers and isinstance(o, decimal.Decimal):
+            return orjson.Fragment(floatstr(o))
+        if isinstance(o, (array.array, memoryview)):
+            # orjson writes the numbers of a list many times faster than they can be formatted in Python.
+            return encoder.default(o)
+        result = fragment_default(o)
+        if type(result) is Fragment:
+            return orjson.Fragment(result.json)
+        return result
+
+    return default
+
+
+def encode_bytes(encoder, obj, backend="json"):
+    """Encode obj as UTF-8 bytes with the encoder, or with orjson when backend is "orjson".
+
+    orjson must be installed and support the encoder configuration, see orjson_options.
+    """
+    if backend not in ("orjson", "json"):
+        raise ValueError(f"Unknown backend {backend!r}, use 'orjson' or 'json'.")
+
+    if backend == "orjson":
+        options = orjson_options(encoder)
+        if options is None:
+            raise ValueError("orjson is not installed or can't write the output of this encoder configuration.")
+        try:
+            return orjson.dumps(obj, default=orjson_default(encoder), option=options)
+        except orjson.JSONEncodeError:
+            # Let the stdlib encoder handle what orjson refuses, like big ints or non str keys, or raise the error.
+            pass
+
+    return encoder.encode(obj).encode("utf-8")
@@ -1,21 +1,96 @@
 import datetime
+import decimal
 import json as stdlib_json
+import re
+from collections.abc import Mapping
+
+from jsonstar.numeric import pack_numbers, packing_hook
+from jsonstar.schema import compile_schema
+from jsonstar.selection import Selection
+from jsonstar.stats import DecoderStats
+
+
+# Every format accepted by datetime.fromisoformat starts with a 4 digit year followed by a month or a week.
+ISO_DATE_PREFIX = re.compile(r"\d{4}-?(?:\d{2}|W\d{2})")
 
 
 class JSONDecoderStar(stdlib_json.JSONDecoder):
-    def __init__(self, *args, **kwargs):
-        super().__init__(object_hook=self.hook, *args, **kwargs)
+    def __init__(
+        self,
+        *args,
+        schema=None,
+        select=None,
+        stats: DecoderStats = None,
+        decimals_as_numbers=False,
+        numeric_arrays=False,
+        **kwargs,
+    ):
+        """Decode datetimes from any ISO looking string, or when a schema is given, only its declared fields.
+
+        See jsonstar.schema.compile_schema for the accepted schemas. Datetime parsing is counted on stats if given.
+        With decimals_as_numbers, numbers with a fraction or an exponent are decoded as Decimals, keeping their digits.
+        With select, only the values at those key paths are decoded, see jsonstar.selection.Selection.
+        With numeric_arrays, arrays of only integers or only floats are decoded as array.array("q") or ("d"), packed
+        as soon as the object holding them is decoded, see jsonstar.numeric.pack_numbers.
+        """
+        if schema is not None and select is not None:
+            raise TypeError("Pass either a schema or key paths to select, not both.")
+
+        self.stats = stats
+        if decimals_as_numbers:
+            kwargs.setdefault("parse_float", decimal.Decimal)
+
+        if schema is None and not isinstance(select, Mapping):
+            kwargs.setdefault("object_hook", self.hook if stats is None else self.hook_with_stats)
+            self.build = None
+        else:
+            self.build = compile_schema(schema) if schema is not None else None
+
+        self.numeric_arrays = numeric_arrays
+        if numeric_arrays:
+            kwargs["object_hook"] = packing_hook(kwargs.get("object_hook"))
+
+        super().__init__(*args, **kwargs)
+        self.select = Selection(select, self) if select is not None else None
+
+    def decode(self, s, *args, **kwargs):
+        if self.select is not None:
+            obj = self.select(s)
+            return pack_numbers(obj) if self.numeric_arrays and type(obj) is list else obj
+
+        obj = super().decode(s, *args, **kwargs)
+        if self.build is not None:
+            obj = self.build(obj)
+        return obj
+
+    def raw_decode(self, s, idx=0):
+        obj, end = super().raw_decode(s, idx)
+        if self.numeric_arrays and type(obj) is list:
+            # Arrays inside objects were packed by the hook, only the top level ones are left.
+            obj = pack_numbers(obj)
+        return obj, end
 
     @staticmethod
     def hook(source):
-        d = {}
         for k, v in source.items():
-            if isinstance(v, str) and not v.isdigit():
+            if isinstance(v, str) and ISO_DATE_PREFIX.match(v) and not v.isdigit():
+                try:
+                    source[k] = datetime.datetime.fromisoformat(v)
+                except (ValueError, TypeError):
+                    pass
+
+        return source
+
+    def hook_with_stats(self, source):
+        """Same as hook, counting the strings it tries to parse as datetimes."""
+        stats = self.stats
+        for k, v in source.items():
+            if isinstance(v, str) and ISO_DATE_PREFIX.match(v) and not v.isdigit():
+                stats.datetime_attempts += 1
                 try:
-                    d[k] = datetime.datetime.fromisoformat(v)
+                    source[k] = datetime.datetime.fromisoformat(v)
+                    stats.datetime_successes += 1
                 except (ValueError, TypeError):
-                    d[k] = v
-            else:
-                d[k] = v
+                    pass
 
-        return d
+        return source
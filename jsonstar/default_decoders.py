@@ -0,0 +1,46 @@
+import datetime
+import decimal
+import re
+import uuid
+
+
+ISO_DURATION = re.compile(r"(-)?P(\d+)DT(\d+)H(\d+)M(\d+)(?:\.(\d{1,6}))?S")
+
+
+def decode_datetime_from_iso_string(s):
+    """Parse datetimes including the Z suffix used by the default datetime encoder."""
+    if s.endswith("Z"):
+        s = s[:-1] + "+00:00"
+    return datetime.datetime.fromisoformat(s)
+
+
+def decode_decimal(value):
+    """Parse decimals from strings and numbers, going through repr for floats to keep their shortest form."""
+    return decimal.Decimal(repr(value) if isinstance(value, float) else value)
+
+
+def decode_timedelta_from_iso_string(s):
+    """Parse the durations produced by encode_timedelta_as_iso_string."""
+    match = ISO_DURATION.fullmatch(s)
+    if match is None:
+        raise ValueError(f"Invalid ISO duration: {s!r}")
+
+    sign, days, hours, minutes, seconds, fraction = match.groups()
+    duration = datetime.timedelta(
+        days=int(days),
+        hours=int(hours),
+        minutes=int(minutes),
+        seconds=int(seconds),
+        microseconds=int((fraction or "0").ljust(6, "0")),
+    )
+    return -duration if sign else duration
+
+
+DEFAULT_TYPED_DECODERS = {
+    datetime.datetime: decode_datetime_from_iso_string,
+    datetime.date: datetime.date.fromisoformat,
+    datetime.time: datetime.time.fromisoformat,
+    datetime.timedelta: decode_timedelta_from_iso_string,
+    decimal.Decimal: decode_decimal,
+    uuid.UUID: uuid.UUID,
+}
@@ -1,42 +1,180 @@
+import array
 import dataclasses
 import datetime
 import decimal
 import uuid
+from functools import lru_cache
+from itertools import chain
 
+from jsonstar.lazy_types import (
+    DJANGO_MODEL,
+    DJANGO_QUERYSET,
+    NUMPY_ARRAY,
+    NUMPY_SCALAR,
+    PYDANTIC_MODEL,
+    attrs_fields,
+    is_attrs_class,
+    not_an_attrs_class,
+)
 
-try:
-    from django.db.models import Model
-    from django.forms.models import model_to_dict
 
-    DJANGO_TYPED_ENCODERS = {
-        Model: model_to_dict,
-    }
-except ImportError:
-    DJANGO_TYPED_ENCODERS = {}
+UTC = datetime.timezone.utc
 
+DJANGO_CHUNK_SIZE = 2000
 
-try:
-    from pydantic import BaseModel
 
-    def pydantic_dict(o):
-        return o.dict()
+@lru_cache(maxsize=None)
+def django_model_fields(model):
+    """Return the fields model_to_dict includes for model, looked up once instead of for every instance."""
+    opts = model._meta
+    fields = chain(opts.concrete_fields, opts.private_fields, opts.many_to_many)
+    return tuple(field for field in fields if getattr(field, "editable", False))
+
+
+@lru_cache(maxsize=None)
+def django_value_names(model):
+    """Return the names of the fields of model that a values() query can read, leaving many-to-many ones out."""
+    concrete = set(model._meta.concrete_fields)
+    return tuple(field.name for field in django_model_fields(model) if field in concrete)
+
+
+def django_model_to_dict(o):
+    """Return the same dict as django.forms.models.model_to_dict."""
+    return {field.name: field.value_from_object(o) for field in django_model_fields(o.__class__)}
+
+
+def django_queryset_rows(queryset, chunk_size=DJANGO_CHUNK_SIZE):
+    """Return an iterator over the rows of queryset, fetched from the database chunk_size at a time.
+
+    Querysets of models are read as values() with the fields model_to_dict includes, so no model instance is built.
+    Many-to-many fields are left out, since they would take a query per row. Querysets already returning values()
+    or values_list() rows are iterated as they are.
+    """
+    from django.db.models.query import ModelIterable
+
+    if queryset._iterable_class is ModelIterable:
+        queryset = queryset.values(*django_value_names(queryset.model))
+    return queryset.iterator(chunk_size=chunk_size)
+
+
+def buffer_tolist(o):
+    """Return the numbers of an array.array, a memoryview or a NumPy array as (nested) lists.
+
+    Encoders writing fragments write them straight from the buffer instead, see jsonstar.numeric.numbers_json.
+    """
+    return o.tolist()
 
-    PYDANTIC_TYPED_ENCODERS = {
-        BaseModel: pydantic_dict,
-    }
-except ImportError:
-    PYDANTIC_TYPED_ENCODERS = {}
 
+def numpy_item(o):
+    """Return the Python int, float or bool of a NumPy scalar."""
+    return o.item()
+
+
+def pydantic_dict(o):
+    return o.model_dump() if hasattr(o, "model_dump") else o.dict()
+
+
+@lru_cache(maxsize=None)
+def pydantic_dumps_differently(cls):
+    """Tell if model_dump of cls instances differs from their fields, through computed or excluded fields, custom
+    serializers or aliases."""
+    decorators = getattr(cls, "__pydantic_decorators__", None)
+    if decorators is None:
+        # A pydantic v1 model.
+        return False
+
+    if cls.model_computed_fields or decorators.field_serializers or decorators.model_serializers:
+        return True
+    if cls.model_config.get("serialize_by_alias"):
+        return True
+
+    return any(
+        field.exclude or any(type(item).__module__ == "pydantic.functional_serializers" for item in field.metadata)
+        for field in cls.model_fields.values()
+    )
+
+
+def pydantic_shallow_dict(o):
+    """Return only the top level fields, leaving nested values for the encoder to recurse into.
+
+    Models whose model_dump differs from their fields are dumped whole instead.
+    """
+    if pydantic_dumps_differently(o.__class__):
+        return o.model_dump()
+    return dict(o)
+
+
+def attrs_dict(o):
+    if not is_attrs_class(o.__class__):
+        raise not_an_attrs_class(o.__class__)
 
-try:
     import attrs
 
-    def attrs_dict(o):
-        return attrs.asdict(o)
+    return attrs.asdict(o)
+
 
-    ATTRS_FUNCTIONAL_ENCODERS = [attrs_dict]
-except ImportError:
-    ATTRS_FUNCTIONAL_ENCODERS = ()
+@lru_cache(maxsize=None)
+def attrs_field_names(cls):
+    return tuple(field.name for field in attrs_fields(cls))
+
+
+def attrs_shallow_dict(o):
+    """Return only the top level fields, leaving nested values for the encoder to recurse into."""
+    return {name: getattr(o, name) for name in attrs_field_names(o.__class__)}
+
+
+def encode_datetime_as_ecma262_string(o):
+    """Format o with milliseconds and the +00:00 offset as Z, scanning the result only for timezones other than UTC."""
+    tzinfo = o.tzinfo
+    if tzinfo is None:
+        return o.isoformat(timespec="milliseconds")
+    if tzinfo is UTC:
+        return o.isoformat(timespec="milliseconds")[:-6] + "Z"
+    return o.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def encode_date_as_iso_string(o):
+    return o.isoformat()
+
+
+def encode_time_as_iso_string(o):
+    return o.isoformat(timespec="milliseconds")
+
+
+def cached_temporal_encoders(maxsize=4096):
+    """Return typed encoders for datetimes, dates and times that remember the output of recently seen values.
+
+    The output is the same as the default encoders. Naive and UTC values are looked up as they are, while values in
+    other timezones are told apart by timezone and fold, since they compare equal to the same instant in any timezone.
+    Each cache keeps up to maxsize values, and the encoders expose its cache_info.
+    """
+    datetimes = lru_cache(maxsize=maxsize)(encode_datetime_as_ecma262_string)
+    zoned_datetimes = lru_cache(maxsize=maxsize)(lambda key: encode_datetime_as_ecma262_string(key[0]))
+    dates = lru_cache(maxsize=maxsize)(encode_date_as_iso_string)
+    times = lru_cache(maxsize=maxsize)(encode_time_as_iso_string)
+
+    def encode_datetime(o):
+        if type(o) is not datetime.datetime:
+            return encode_datetime_as_ecma262_string(o)
+        if o.tzinfo is None or o.tzinfo is UTC:
+            return datetimes(o)
+        return zoned_datetimes((o, o.tzinfo, o.fold))
+
+    def encode_date(o):
+        return dates(o) if type(o) is datetime.date else encode_date_as_iso_string(o)
+
+    def encode_time(o):
+        return times(o) if type(o) is datetime.time and o.tzinfo is None else encode_time_as_iso_string(o)
+
+    encode_datetime.cache_info = datetimes.cache_info
+    encode_date.cache_info = dates.cache_info
+    encode_time.cache_info = times.cache_info
+
+    return {
+        datetime.datetime: encode_datetime,
+        datetime.date: encode_date,
+        datetime.time: encode_time,
+    }
 
 
 def encode_timedelta_as_iso_string(duration):
@@ -54,20 +192,44 @@ def dataclasses_asdict(o):
     return dataclasses.asdict(o)
 
 
+@lru_cache(maxsize=None)
+def dataclass_field_names(cls):
+    return tuple(field.name for field in dataclasses.fields(cls))
+
+
+def dataclasses_shallow_dict(o):
+    """Return only the top level fields, leaving nested values for the encoder to recurse into."""
+    return {name: getattr(o, name) for name in dataclass_field_names(o.__class__)}
+
+
 DEFAULT_FUNCTIONAL_ENCODERS = [
     dataclasses_asdict,
-    *ATTRS_FUNCTIONAL_ENCODERS,
+    attrs_dict,
+]
+
+SHALLOW_FUNCTIONAL_ENCODERS = [
+    dataclasses_shallow_dict,
+    attrs_shallow_dict,
 ]
 
+SHALLOW_TYPED_ENCODERS = {
+    PYDANTIC_MODEL: pydantic_shallow_dict,
+}
+
 DEFAULT_TYPED_ENCODERS = {
-    datetime.datetime: lambda o: o.isoformat(timespec="milliseconds").replace("+00:00", "Z"),
-    datetime.date: lambda o: o.isoformat(),
-    datetime.time: lambda o: o.isoformat(timespec="milliseconds"),
+    datetime.datetime: encode_datetime_as_ecma262_string,
+    datetime.date: encode_date_as_iso_string,
+    datetime.time: encode_time_as_iso_string,
     datetime.timedelta: encode_timedelta_as_iso_string,
     decimal.Decimal: str,
     uuid.UUID: str,
     set: list,
     frozenset: list,
-    **DJANGO_TYPED_ENCODERS,
-    **PYDANTIC_TYPED_ENCODERS,
+    DJANGO_MODEL: django_model_to_dict,
+    DJANGO_QUERYSET: django_queryset_rows,
+    PYDANTIC_MODEL: pydantic_dict,
+    array.array: buffer_tolist,
+    memoryview: buffer_tolist,
+    NUMPY_ARRAY: buffer_tolist,
+    NUMPY_SCALAR: numpy_item,
 }
@@ -1,26 +1,169 @@
-import inspect
+import copy
 import json as stdlib_json
-from collections import ChainMap, OrderedDict
+from collections.abc import Iterator, Mapping
 from contextlib import suppress
+from decimal import Decimal
+from io import IOBase
 from itertools import chain
+from json.encoder import _make_iterencode, encode_basestring, encode_basestring_ascii
 
-from jsonstar.default_encoders import DEFAULT_FUNCTIONAL_ENCODERS, DEFAULT_TYPED_ENCODERS
+from jsonstar.default_encoders import (
+    DEFAULT_FUNCTIONAL_ENCODERS,
+    DEFAULT_TYPED_ENCODERS,
+    SHALLOW_FUNCTIONAL_ENCODERS,
+    SHALLOW_TYPED_ENCODERS,
+    buffer_tolist,
+)
+from jsonstar.fragments import Fragment, FragmentCache
+from jsonstar.native import native_serializer
 from jsonstar.null_dict import NULL_DICT
+from jsonstar.numeric import number_floatstr, numbers_json
+from jsonstar.serializers import compile_serializer, is_compilable
+from jsonstar.stats import EncoderStats
+from jsonstar.streaming import StreamedArray
 
 
-__all__ = ["JSONEncoderStar"]
+__all__ = ["JSONEncoderStar", "ShallowJSONEncoderStar", "TypedEncoderRegistry", "value_dependent"]
 
 
-class TypedEncoderRegistry(OrderedDict):
+def value_dependent(function):
+    """Mark a functional encoder whose success depends on the value, so its outcome is never remembered per type."""
+    function.jsonstar_value_dependent = True
+    return function
+
+
+def is_value_dependent(function):
+    return getattr(function, "jsonstar_value_dependent", False) is True
+
+
+def configuration_key(kwargs):
+    """Return a hashable key for encoder keyword arguments, or None when some value can't be hashed."""
+    items = []
+    for name, value in sorted(kwargs.items()):
+        if isinstance(value, Mapping):
+            value = tuple(value.items())
+        elif isinstance(value, list):
+            value = tuple(value)
+        items.append((name, value))
+
+    key = tuple(items)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class TypedEncoderRegistry(dict):
+    """Typed encoders iterated in specificity order, so every type comes before its base types.
+
+    Registering only marks the order as stale, and it is sorted once on the next iteration, which keeps bulk updates
+    linear. A frozen registry can't change anymore, so encoders share it without copying.
+    """
+
+    __slots__ = ("_order", "_frozen")
+
+    def __init__(self, *args, **kwargs):
+        self._order = None
+        self._frozen = False
+        super().__init__(*args, **kwargs)
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+    @property
+    def frozen(self):
+        return self._frozen
+
+    def freeze(self):
+        """Forbid further changes and return the registry, already ordered."""
+        self.order()
+        self._frozen = True
+        return self
+
+    def order(self):
+        """Return the types sorted by how deep they are in their hierarchy, the latest registered first on ties.
+
+        A subclass always has a longer MRO than its bases, so it's checked before them.
+        """
+        if self._order is None:
+            types = reversed(list(dict.__iter__(self)))
+            self._order = sorted(types, key=lambda type_: len(type_.__mro__), reverse=True)
+        return self._order
+
+    def _changing(self):
+        if self._frozen:
+            raise TypeError("A frozen TypedEncoderRegistry can't be changed, copy it first.")
+        self._order = None
+
     def __setitem__(self, type_, function):
         """Register the type encoder and ensures inherited takes precedence over its base types encoders."""
+        self._changing()
         super().__setitem__(type_, function)
-        for base in inspect.getmro(type_):
-            if base in self:
-                self.move_to_end(base)
+
+    def __delitem__(self, type_):
+        self._changing()
+        super().__delitem__(type_)
+
+    def update(self, *args, **kwargs):
+        """Register many type encoders at once, sorting them only once."""
+        self._changing()
+        super().update(*args, **kwargs)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, type_, function=None):
+        self._changing()
+        return super().setdefault(type_, function)
+
+    def pop(self, *args):
+        self._changing()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._changing()
+        return super().popitem()
+
+    def clear(self):
+        self._changing()
+        super().clear()
+
+    def copy(self):
+        return type(self)(self)
+
+    def __iter__(self):
+        return iter(self.order())
+
+    def keys(self):
+        return list(self.order())
+
+    def values(self):
+        return [self[type_] for type_ in self.order()]
+
+    def items(self):
+        return [(type_, self[type_]) for type_ in self.order()]
+
+
+EMPTY_REGISTRY = TypedEncoderRegistry().freeze()
+
+
+class Dispatch:
+    """Encoders resolved per concrete type, discarded whenever the registries they came from change."""
+
+    __slots__ = ("typed", "functional", "native", "registry")
+
+    def __init__(self):
+        self.typed = {}
+        self.functional = {}
+        self.native = {}
+        self.registry = None
 
 
 class EncoderMeta(type):
+    DISPATCH_ATTRIBUTES = ("_default_functional_encoders", "_default_typed_encoders", "compile_serializers")
+
     def __new__(mcs, name, bases, namespace):
         if "_default_functional_encoders" not in namespace:
             namespace["_default_functional_encoders"] = []
@@ -28,8 +171,44 @@ class EncoderMeta(type):
         if "_default_typed_encoders" not in namespace:
             namespace["_default_typed_encoders"] = TypedEncoderRegistry()
 
+        namespace["_dispatch"] = Dispatch()
+        namespace["_configured"] = {}
+        namespace["_registries"] = None
+
         return super().__new__(mcs, name, bases, namespace)
 
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+        if name in cls.DISPATCH_ATTRIBUTES:
+            cls.invalidate_dispatch()
+
+    def invalidate_dispatch(cls):
+        """Discard the resolved type dispatch and the configured instances of this class and of its subclasses."""
+        type.__setattr__(cls, "_dispatch", Dispatch())
+        type.__setattr__(cls, "_configured", {})
+        type.__setattr__(cls, "_registries", None)
+        for subclass in cls.__subclasses__():
+            subclass.invalidate_dispatch()
+
+    def default_registries(cls):
+        """Return the default typed and functional encoders of every encoder class in the MRO, merged only once.
+
+        The most derived classes take precedence. They are merged again after the registries of cls or of any of its
+        ancestors change.
+        """
+        if cls._registries is None:
+            classes = [klass for klass in cls.__mro__ if isinstance(klass, EncoderMeta)]
+
+            typed = TypedEncoderRegistry()
+            for klass in reversed(classes):
+                typed.update(vars(klass)["_default_typed_encoders"])
+
+            functional = [encoder for klass in classes for encoder in vars(klass)["_default_functional_encoders"]]
+
+            type.__setattr__(cls, "_registries", (typed.freeze(), functional))
+
+        return cls._registries
+
 
 class JSONEncoderStar(stdlib_json.JSONEncoder, metaclass=EncoderMeta):
     class FUNCTIONAL:
@@ -38,41 +217,102 @@ class JSONEncoderStar(stdlib_json.JSONEncoder, metaclass=EncoderMeta):
     _default_typed_encoders = TypedEncoderRegistry(DEFAULT_TYPED_ENCODERS)
     _default_functional_encoders = DEFAULT_FUNCTIONAL_ENCODERS
 
-    def __init__(self, *args, functional_encoders=(), typed_encoders: dict[type, callable] = NULL_DICT, **kwargs):
+    compile_serializers = False
+    """Compile a serializer for dataclasses and attrs classes without a typed encoder, ahead of functional encoders."""
+
+    native_pydantic = True
+    """Write pydantic v2 models with their compiled serializer where fragments are written, if the output is alike."""
+
+    MAX_CONFIGURED = 128
+    """How many configured instances each class keeps."""
+
+    def __init__(
+        self,
+        *args,
+        functional_encoders=(),
+        typed_encoders: dict[type, callable] = NULL_DICT,
+        stats: EncoderStats = None,
+        decimals_as_numbers=False,
+        fragment_cache: FragmentCache = None,
+        **kwargs,
+    ):
+        """Besides the stdlib options, take instance encoders, optional stats, the Decimal output mode and a cache.
+
+        With decimals_as_numbers, Decimals are written as JSON numbers with exactly their digits instead of strings.
+        With a fragment_cache, the JSON of immutable objects is remembered and written again when they come back.
+        """
         super().__init__(*args, **kwargs)
 
-        self._typed_encoders = TypedEncoderRegistry(typed_encoders)
+        if isinstance(typed_encoders, TypedEncoderRegistry) and typed_encoders.frozen:
+            self._typed_encoders = typed_encoders
+        else:
+            self._typed_encoders = TypedEncoderRegistry(typed_encoders) if typed_encoders else EMPTY_REGISTRY
         self._functional_encoders = [*functional_encoders]
+        self._instance_dispatch = Dispatch()
+        self._dispatch_base = None
+        self._stream_iterators = False
+        self.stats = stats
+        self.decimals_as_numbers = decimals_as_numbers
+        self.fragment_cache = fragment_cache
+
+    @classmethod
+    def configured(cls, **kwargs):
+        """Return an encoder built with kwargs, shared by every call with the same configuration.
+
+        Like stdlib's _default_encoder, it saves building a new encoder for each call. The instances are discarded
+        whenever the default encoders of the class or of its ancestors change.
+        """
+        key = configuration_key(kwargs)
+        if key is None:
+            return cls(**kwargs)
+
+        try:
+            return cls._configured[key]
+        except KeyError:
+            encoder = cls(**kwargs)
+            if len(cls._configured) < cls.MAX_CONFIGURED:
+                cls._configured[key] = encoder
+            return encoder
 
     @classmethod
     def default_functional_encoders(cls):
-        if cls is JSONEncoderStar:
-            return cls._default_functional_encoders
-        else:
-            return cls._default_functional_encoders + cls.__base__.default_functional_encoders()
+        typed, functional = cls.default_registries()
+        return functional
 
     @classmethod
     def default_typed_encoders(cls):
-        if cls is JSONEncoderStar:
-            return cls._default_typed_encoders
-        else:
-            return TypedEncoderRegistry(ChainMap(cls._default_typed_encoders, cls.__base__.default_typed_encoders()))
+        typed, functional = cls.default_registries()
+        return typed
 
     @property
     def functional_encoders(self):
-        return chain(self._functional_encoders, self.default_functional_encoders())
+        encoders = chain(self._functional_encoders, self.default_functional_encoders())
+        if self.stats is not None:
+            return map(self.stats.instrument_functional, encoders)
+        return encoders
 
     @property
     def typed_encoders(self):
-        i = self._typed_encoders
+        """The default typed encoders merged with the ones of this instance, which win over defaults as specific."""
         base = self.default_typed_encoders()
-        return ChainMap(i, base)
+        if not self._typed_encoders:
+            return base
+
+        dispatch = self._dispatch_table()
+        if dispatch.registry is None:
+            registry = TypedEncoderRegistry(base)
+            registry.update(self._typed_encoders)
+            dispatch.registry = registry.freeze()
+        return dispatch.registry
 
     def register(self, function, type_=FUNCTIONAL):
         if type_ is self.FUNCTIONAL:
             self._functional_encoders.append(function)
         else:
+            if self._typed_encoders.frozen:
+                self._typed_encoders = self._typed_encoders.copy()
             self._typed_encoders[type_] = function
+        self._instance_dispatch = Dispatch()
 
     @classmethod
     def register_default_encoder(cls, function, type_=FUNCTIONAL):
@@ -80,14 +320,241 @@ class JSONEncoderStar(stdlib_json.JSONEncoder, metaclass=EncoderMeta):
             cls._default_functional_encoders.append(function)
         else:
             cls._default_typed_encoders[type_] = function
+        cls.invalidate_dispatch()
+
+    @classmethod
+    def register_default_encoders(cls, typed_encoders):
+        """Register many default typed encoders at once, discarding the resolved types only once."""
+        cls._default_typed_encoders.update(typed_encoders)
+        cls.invalidate_dispatch()
+
+    def _dispatch_table(self):
+        """Return the dispatch to use, shared with the class unless this instance has its own encoders or options."""
+        base = type(self)._dispatch
+        own = self._typed_encoders or self._functional_encoders or self.stats is not None or self.decimals_as_numbers
+        if not own:
+            return base
+
+        if self._dispatch_base is not base:
+            self._dispatch_base = base
+            self._instance_dispatch = Dispatch()
+
+        return self._instance_dispatch
+
+    def _registered_typed_encoder(self, type_):
+        """Find the most specific typed encoder for type_ following the registry MRO ordering."""
+        if self.decimals_as_numbers and issubclass(type_, Decimal):
+            return None
 
-    def default(self, o) -> str:
         for base, encoder in self.typed_encoders.items():
-            if isinstance(o, base):
-                return encoder(o)
+            if issubclass(type_, base):
+                return encoder
+
+        return None
+
+    def _resolve_typed_encoder(self, type_):
+        encoder = self._registered_typed_encoder(type_)
+        if encoder is None and self.compile_serializers and is_compilable(type_):
+            encoder = compile_serializer(type_, self._registered_typed_encoder)
 
-        for encoder in self.functional_encoders:
+        if encoder is not None and self.stats is not None:
+            encoder = self.stats.instrument_typed(encoder)
+
+        return encoder
+
+    def typed_encoder_for(self, type_):
+        """Return the typed encoder for type_ or None, resolving it only once per type."""
+        dispatch = self._dispatch_table().typed
+        try:
+            return dispatch[type_]
+        except KeyError:
+            encoder = dispatch[type_] = self._resolve_typed_encoder(type_)
+            return encoder
+
+    def native_serializer_for(self, type_):
+        """Return the function writing type_ objects with the pydantic v2 serializer, when it writes the same compact
+        UTF-8 output as this encoder, or None. It is resolved only once per type."""
+        if not (
+            self.native_pydantic
+            and self.indent is None
+            and (self.item_separator, self.key_separator) == (",", ":")
+            and not (self.ensure_ascii or self.sort_keys)
+        ):
+            return None
+
+        dispatch = self._dispatch_table().native
+        try:
+            return dispatch[type_]
+        except KeyError:
+            serializer = dispatch[type_] = native_serializer(type_, self.typed_encoder_for)
+            return serializer
+
+    @classmethod
+    def precompile(cls, *classes):
+        """Compile the serializers of dataclasses and attrs classes ahead of time, usually at startup."""
+        if not cls.compile_serializers:
+            raise TypeError(f"{cls.__name__}.compile_serializers must be enabled to precompile serializers.")
+
+        encoder = cls()
+        for class_ in classes:
+            if not is_compilable(class_):
+                raise TypeError(f"{class_!r} is not a dataclass or an attrs class.")
+            encoder.typed_encoder_for(class_)
+
+    def _encode_functional(self, o):
+        """Try the functional encoders in order, remembering for the class of o which ones failed.
+
+        Failing encoders are skipped for the next objects of the same type, unless marked as value_dependent.
+        """
+        dispatch = self._dispatch_table().functional
+        plan = dispatch.get(o.__class__)
+        if plan is not None:
+            for encoder in plan:
+                with suppress(Exception):
+                    return encoder(o)
+
+            return NotImplemented
+
+        encoders = list(self.functional_encoders)
+        plan = [encoder for encoder in encoders if is_value_dependent(encoder)]
+        for i, encoder in enumerate(encoders):
             with suppress(Exception):
-                return encoder(o)
+                result = encoder(o)
+                plan = [e for e in encoders[:i] if is_value_dependent(e)] + encoders[i:]
+                break
+        else:
+            result = NotImplemented
+
+        dispatch[o.__class__] = plan
+        return result
+
+    def iterencode(self, o, _one_shot=False):
+        """Encode o chunk by chunk, streaming iterators as JSON arrays without materializing them.
+
+        The one shot mode used by encode may run the C encoder, which can't consume iterators lazily.
+        """
+        if not (_one_shot or self._stream_iterators):
+            streaming = copy.copy(self)
+            streaming._stream_iterators = True
+            return streaming.iterencode(o)
+
+        if self.decimals_as_numbers or self._caches_fragments():
+            return self._iterencode_python(o, _one_shot)
+
+        return super().iterencode(o, _one_shot)
+
+    def _iterencode_python(self, o, _one_shot):
+        """Run the pure Python encoder writing Decimals and fragments as floats, since the C encoder can only write
+        float numbers."""
+        iterencode = _make_iterencode(
+            {} if self.check_circular else None,
+            self.writing_default(),
+            encode_basestring_ascii if self.ensure_ascii else encode_basestring,
+            self.indent,
+            number_floatstr(self.allow_nan),
+            self.key_separator,
+            self.item_separator,
+            self.sort_keys,
+            self.skipkeys,
+            _one_shot,
+            float=(float, Decimal, Fragment) if self.decimals_as_numbers else (float, Fragment),
+        )
+        return iterencode(o, 0)
+
+    def _caches_fragments(self):
+        # Fragments are encoded once at the top level, so they can't follow the indentation of where they go.
+        return self.fragment_cache is not None and self.indent is None
+
+    def _fragment(self, o):
+        """Return the cached fragment of o, encoding it on a miss, or None when o isn't cached."""
+        cache = self.fragment_cache
+        if not cache.cacheable(type(o)):
+            return None
+
+        key = (
+            self._dispatch_table(),
+            self.item_separator,
+            self.key_separator,
+            self.ensure_ascii,
+            self.sort_keys,
+            self.allow_nan,
+            self.decimals_as_numbers,
+            id(o),
+        )
+        fragment = cache.get(key, o)
+        if fragment is None:
+            try:
+                hash(o)
+            except TypeError:
+                return None
+
+            fragment = self._native_fragment(o)
+            if fragment is None:
+                fragment = Fragment("".join(self._iterencode_python(self._encode_default(o), False)))
+            cache.set(key, o, fragment)
+        return fragment
+
+    def _native_fragment(self, o):
+        """Return o written by the pydantic v2 serializer or straight from its buffer of numbers, or None."""
+        native = self.native_serializer_for(type(o))
+        if native is not None:
+            return Fragment(native(o))
+
+        if self.indent is None and self.typed_encoder_for(type(o)) is buffer_tolist:
+            text = numbers_json(o, self.item_separator, self.allow_nan)
+            if text is not None:
+                return Fragment(text)
+
+        return None
+
+    def default(self, o) -> str:
+        return self._encode_default(o)
+
+    def writing_default(self):
+        """Return the default of the encoders writing fragments, fragment_default unless default was overridden.
+
+        A default method of a subclass, or a default passed to the constructor, is used as it is instead, like the C
+        encoder does.
+        """
+        if "default" in vars(self) or type(self).default is not JSONEncoderStar.default:
+            return self.default
+        return self.fragment_default
+
+    def fragment_default(self, o):
+        """Like default, but return a Fragment for cached objects, for pydantic models written natively and for
+        buffers of numbers, like array.array or NumPy arrays, written without converting them to lists.
+
+        Only the pure Python encoder and orjson can write fragments.
+        """
+        if self._caches_fragments():
+            fragment = self._fragment(o)
+            if fragment is not None:
+                return fragment
+
+        fragment = self._native_fragment(o)
+        if fragment is not None:
+            return fragment
+
+        return self._encode_default(o)
+
+    def _encode_default(self, o):
+        encoder = self.typed_encoder_for(o.__class__)
+        if encoder is not None:
+            return encoder(o)
+
+        result = self._encode_functional(o)
+        if result is not NotImplemented:
+            return result
+
+        if isinstance(o, Iterator) and not isinstance(o, IOBase):
+            # Iterators no encoder claimed are written as arrays, streamed unless in one shot mode. Files are left out.
+            return StreamedArray(o) if self._stream_iterators else list(o)
 
         return super().default(o)
+
+
+class ShallowJSONEncoderStar(JSONEncoderStar):
+    """Encode dataclasses, attrs and pydantic models one level at a time instead of deep copying them to dicts."""
+
+    _default_typed_encoders = TypedEncoderRegistry(SHALLOW_TYPED_ENCODERS)
+    _default_functional_encoders = [*SHALLOW_FUNCTIONAL_ENCODERS]
@@ -0,0 +1,104 @@
+import dataclasses
+from collections import OrderedDict
+from threading import Lock
+
+from jsonstar.lazy_types import PYDANTIC_MODEL, is_attrs_class
+
+
+__all__ = ["Fragment", "FragmentCache", "is_frozen"]
+
+
+class Fragment:
+    """JSON text written as it is in place of a value, by the encoders that support it."""
+
+    __slots__ = ("json",)
+
+    def __init__(self, json):
+        self.json = json
+
+    def __repr__(self):
+        return f"Fragment({self.json!r})"
+
+
+def is_frozen(cls):
+    """Tell if instances of cls can't change once built, like frozen dataclasses, attrs classes or pydantic models."""
+    if dataclasses.is_dataclass(cls):
+        return cls.__dataclass_params__.frozen
+    if is_attrs_class(cls):
+        return getattr(cls.__setattr__, "__name__", None) == "_frozen_setattrs"
+    if issubclass(cls, PYDANTIC_MODEL):
+        config = getattr(cls, "model_config", None)
+        return bool(config.get("frozen")) if config is not None else not cls.__config__.allow_mutation
+    return False
+
+
+class FragmentCache:
+    """Keep the JSON of recently encoded immutable objects, so encoding them again writes it instead.
+
+    Objects of frozen dataclasses, attrs classes and pydantic models are cached, and so are objects of the types
+    registered, which must not change while cached. Objects are looked up by identity, since equal objects may be
+    written differently, like Decimal("1.10") and Decimal("1.1"), and each cached object is kept alive by the cache.
+    They must be hashable, and unhashable ones, which may hold mutable values, are encoded as usual. Up to maxsize
+    fragments are kept, discarding the least recently used.
+
+    Pass it to JSONEncoderStar(fragment_cache=...) or jsonstar.dumps(..., fragment_cache=...), sharing it between
+    calls to reuse fragments across documents. Indented output is never cached.
+    """
+
+    def __init__(self, maxsize=1024, types=()):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._fragments = OrderedDict()
+        self._types = tuple(types)
+        self._cacheable = {}
+        self._lock = Lock()
+
+    def __reduce__(self):
+        # Processes encoding in parallel get an empty cache each, since fragments can't be shared between them.
+        return FragmentCache, (self.maxsize, self._types)
+
+    def register(self, type_):
+        """Cache objects of type_ and its subclasses too."""
+        self._types += (type_,)
+        self._cacheable.clear()
+
+    def cacheable(self, type_):
+        try:
+            return self._cacheable[type_]
+        except KeyError:
+            cacheable = self._cacheable[type_] = issubclass(type_, self._types) or is_frozen(type_)
+            return cacheable
+
+    def get(self, key, o):
+        """Return the fragment of o stored under key or None, counting a hit or a miss."""
+        with self._lock:
+            entry = self._fragments.get(key)
+            if entry is None or entry[0] is not o:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._fragments.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, o, fragment):
+        with self._lock:
+            self._fragments[key] = (o, fragment)
+            if len(self._fragments) > self.maxsize:
+                self._fragments.popitem(last=False)
+
+    def __len__(self):
+        return len(self._fragments)
+
+    def snapshot(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._fragments), "maxsize": self.maxsize}
+
+    def reset(self):
+        """Zero the counters, keeping the fragments."""
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        with self._lock:
+            self._fragments.clear()
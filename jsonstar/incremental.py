@@ -0,0 +1,187 @@
+import codecs
+import mmap
+import os
+import re
+from json.decoder import WHITESPACE, JSONDecodeError
+
+from jsonstar.decoder import JSONDecoderStar
+from jsonstar.streaming import DEFAULT_BUFFER_SIZE
+
+
+__all__ = ["IncrementalDecoder", "iterload"]
+
+
+CONTAINER_START = frozenset('{["')
+
+VALUE_START = frozenset('{["-0123456789tfnNI')
+
+NUMBER_START = frozenset("-0123456789")
+
+NUMBER_TAIL = re.compile(r"[0-9.eE+\-]*")
+
+# What can be skipped between brackets, complete strings included, and inside a string up to its closing quote.
+PLAIN = re.compile(r'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+
+STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+
+START, FIRST_ELEMENT, ELEMENT, DELIMITER, DONE = range(5)
+
+EXPECTED = {START: "value", FIRST_ELEMENT: "value", ELEMENT: "value", DELIMITER: "',' delimiter"}
+
+
+class IncrementalDecoder:
+    """Decode a JSON document fed in chunks, returning the elements of a top-level array as soon as each is complete.
+
+    Any other top-level value is returned once complete. Only the unparsed tail is kept, so memory stays proportional
+    to the largest element. Objects are converted by the decoder hook, and a schema describes each element.
+    """
+
+    def __init__(self, cls=JSONDecoderStar, encoding="utf-8", **kwargs):
+        self.decoder = cls(**kwargs)
+        self.build = getattr(self.decoder, "build", None)
+        self._text = codecs.getincrementaldecoder(encoding)()
+        self._buffer = ""
+        self._pos = 0
+        self._state = START
+        self._array = False
+        self._scanned = 0
+        self._depth = 0
+        self._in_string = False
+
+    def feed(self, chunk):
+        """Add a chunk of bytes or text and return the values completed by it."""
+        if not isinstance(chunk, str):
+            chunk = self._text.decode(chunk)
+
+        # Drop what was parsed already, so only the value being parsed stays in memory.
+        pos = self._pos
+        self._buffer = self._buffer[pos:] + chunk
+        self._scanned -= pos
+        self._pos = 0
+        return self._parse(final=False)
+
+    def close(self):
+        """Return the last values, raising JSONDecodeError if the document is incomplete."""
+        self._buffer += self._text.decode(b"", final=True)
+        values = self._parse(final=True)
+        if self._state != DONE:
+            raise JSONDecodeError(f"Expecting {EXPECTED[self._state]}", self._buffer, len(self._buffer))
+        return values
+
+    def _parse(self, final):
+        values = []
+        buffer = self._buffer
+        while True:
+            pos = WHITESPACE.match(buffer, self._pos).end()
+            if pos == len(buffer):
+                self._pos = pos
+                return values
+
+            char = buffer[pos]
+            state = self._state
+            if state == START and char == "[":
+                self._array = True
+                self._state = FIRST_ELEMENT
+                self._pos = pos + 1
+            elif char == "]" and state in (FIRST_ELEMENT, DELIMITER):
+                self._state = DONE
+                self._pos = pos + 1
+            elif char == "," and state == DELIMITER:
+                self._state = ELEMENT
+                self._pos = pos + 1
+            elif char in VALUE_START and state in (START, FIRST_ELEMENT, ELEMENT):
+                self._pos = pos
+                if not self._decode_value(values, final):
+                    return values
+            elif state == DONE:
+                raise JSONDecodeError("Extra data", buffer, pos)
+            else:
+                raise JSONDecodeError(f"Expecting {EXPECTED[state]}", buffer, pos)
+
+    def _decode_value(self, values, final):
+        """Decode the value at the current position, or tell it needs more data by returning False."""
+        buffer, pos = self._buffer, self._pos
+        container = buffer[pos] in CONTAINER_START
+        if container and not final and not self._scan(buffer, pos):
+            return False
+
+        try:
+            value, end = self.decoder.raw_decode(buffer, pos)
+        except JSONDecodeError:
+            if final or container:
+                raise
+            # A literal or a number cut by the end of the chunk.
+            return False
+
+        if not final and buffer[pos] in NUMBER_START and NUMBER_TAIL.match(buffer, end).end() == len(buffer):
+            # The number may go on in the next chunk.
+            return False
+
+        if self.build is not None:
+            value = self.build(value)
+
+        values.append(value)
+        self._pos = end
+        self._scanned = end
+        self._state = DELIMITER if self._array else DONE
+        return True
+
+    def _scan(self, buffer, pos):
+        """Tell if the object, array or string at pos is complete, scanning only what was added since the last call.
+
+        The nesting depth and whether the scan stopped inside a string are kept between calls, so each character is
+        scanned once and the value is parsed only once it's complete.
+        """
+        i, depth, in_string = self._scanned, self._depth, self._in_string
+        if i <= pos:
+            # A new value, skipping its opening quote or bracket.
+            char = buffer[pos]
+            i, depth, in_string = pos + 1, 0 if char == '"' else 1, char == '"'
+
+        end = len(buffer)
+        while i < end:
+            if in_string:
+                i = STRING_BODY.match(buffer, i).end()
+                if i == end or buffer[i] == "\\":
+                    # The string, or an escape sequence in it, goes on in the next chunk.
+                    break
+                i += 1
+                in_string = False
+            else:
+                i = PLAIN.match(buffer, i).end()
+                if i == end:
+                    break
+                char = buffer[i]
+                i += 1
+                if char == '"':
+                    # A string cut by the end of the buffer.
+                    in_string = True
+                    continue
+                depth += 1 if char in "[{" else -1
+
+            if depth == 0:
+                self._scanned = i
+                return True
+
+        self._scanned, self._depth, self._in_string = i, depth, in_string
+        return False
+
+
+def iterload(fp, cls=JSONDecoderStar, buffer_size=DEFAULT_BUFFER_SIZE, memory_map=False, **kwargs):
+    """Yield the elements of the top-level array in fp as they are read, or its only value when it's not an array.
+
+    With memory_map, a local file is mapped in memory and decoded straight from the mapping instead of read in copies.
+    """
+    decoder = IncrementalDecoder(cls=cls, **kwargs)
+
+    if memory_map and os.fstat(fp.fileno()).st_size:
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            for start in range(0, len(view), buffer_size):
+                end = start + buffer_size
+                with view[start:end] as chunk:
+                    yield from decoder.feed(chunk)
+    elif not memory_map:
+        while chunk := fp.read(buffer_size):
+            yield from decoder.feed(chunk)
+
+    yield from decoder.close()
@@ -0,0 +1,79 @@
+import copyreg
+import sys
+from functools import lru_cache
+
+
+__all__ = [
+    "DJANGO_MODEL",
+    "DJANGO_QUERYSET",
+    "NUMPY_ARRAY",
+    "NUMPY_SCALAR",
+    "PYDANTIC_MODEL",
+    "attrs_fields",
+    "is_attrs_class",
+    "lazy_type",
+    "not_an_attrs_class",
+]
+
+
+def qualified_name(cls):
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+class LazyTypeMeta(type):
+    """Match subclasses of a class by its qualified name, so the library defining it is never imported.
+
+    When an object of that class exists, its library was already imported by whoever created it.
+    """
+
+    def __subclasscheck__(cls, subclass):
+        return any(qualified_name(base) == cls.qualified_name for base in getattr(subclass, "__mro__", ()))
+
+    def __instancecheck__(cls, instance):
+        return cls.__subclasscheck__(type(instance))
+
+
+@lru_cache(maxsize=None)
+def lazy_type(name):
+    """Return the type standing for the class with the qualified name, usable as a typed encoder key."""
+    return LazyTypeMeta(name.rpartition(".")[2], (), {"qualified_name": name, "__module__": __name__})
+
+
+# Pickled by name, so registries sent to worker processes keep the same keys.
+copyreg.pickle(LazyTypeMeta, lambda cls: (lazy_type, (cls.qualified_name,)))
+
+
+DJANGO_MODEL = lazy_type("django.db.models.base.Model")
+DJANGO_QUERYSET = lazy_type("django.db.models.query.QuerySet")
+NUMPY_ARRAY = lazy_type("numpy.ndarray")
+NUMPY_SCALAR = lazy_type("numpy.generic")
+PYDANTIC_MODEL = lazy_type("pydantic.main.BaseModel")
+
+
+def is_attrs_class(cls):
+    """Tell if cls was decorated by attrs, like attrs.has does, without importing attrs."""
+    return isinstance(cls, type) and getattr(cls, "__attrs_attrs__", None) is not None
+
+
+def not_an_attrs_class(cls):
+    """Return the NotAnAttrsClassError attrs raises for cls, a ValueError, when attrs was imported already.
+
+    Otherwise a plain ValueError is returned, since objects of other classes are no reason to import attrs.
+    """
+    message = f"{cls!r} is not an attrs-decorated class."
+    exceptions = sys.modules.get("attr.exceptions")
+    if exceptions is None:
+        return ValueError(message)
+    return exceptions.NotAnAttrsClassError(message)
+
+
+def attrs_fields(cls):
+    """Return the fields of an attrs class, like attrs.fields does, without importing attrs.
+
+    Like attrs.fields, it raises TypeError for objects other than classes and NotAnAttrsClassError for other classes.
+    """
+    if not isinstance(cls, type):
+        raise TypeError("Passed object must be a class.")
+    if not is_attrs_class(cls):
+        raise not_an_attrs_class(cls)
+    return cls.__attrs_attrs__
@@ -0,0 +1,95 @@
+import datetime
+import decimal
+import enum
+import typing
+import uuid
+
+from jsonstar.default_encoders import encode_date_as_iso_string, pydantic_dict
+from jsonstar.lazy_types import PYDANTIC_MODEL
+from jsonstar.serializers import UNION_TYPES
+
+
+__all__ = ["native_serializer"]
+
+
+PLAIN_TYPES = (str, int, bool, type(None))
+
+SEQUENCE_TYPES = (list, tuple)
+
+# Types pydantic writes as these typed encoders do. Floats are left out, as pydantic writes 1e-7 where Python writes
+# 1e-07, and so are datetimes, times and timedeltas, which jsonstar formats on its own.
+NATIVE_TYPED_ENCODERS = {
+    decimal.Decimal: str,
+    uuid.UUID: str,
+    datetime.date: encode_date_as_iso_string,
+}
+
+
+def native_serializer(cls, typed_encoder_for):
+    """Return a function writing the JSON of cls instances with the compiled pydantic v2 serializer, or None.
+
+    It's only returned when the pydantic output is the same as the encoder's, which resolves typed encoders with
+    typed_encoder_for: every field is of a type both write alike, with no custom serializer, and every model involved
+    is encoded by the default pydantic encoder. Compact UTF-8 output is left for the encoder to check.
+    """
+    if not is_native(cls, typed_encoder_for, set()):
+        return None
+
+    serializer = cls.__pydantic_serializer__
+
+    def serialize(o):
+        return serializer.to_json(o).decode()
+
+    return serialize
+
+
+def is_native(cls, typed_encoder_for, seen):
+    if cls in seen:
+        return True
+    seen.add(cls)
+
+    if not (issubclass(cls, PYDANTIC_MODEL) and getattr(cls, "__pydantic_complete__", False)):
+        return False
+
+    if typed_encoder_for(cls) is not pydantic_dict:
+        return False
+
+    decorators = cls.__pydantic_decorators__
+    if decorators.field_serializers or decorators.model_serializers or cls.model_config.get("extra") == "allow":
+        return False
+
+    for field in cls.model_fields.values():
+        if any(type(item).__module__ == "pydantic.functional_serializers" for item in field.metadata):
+            return False
+        if not is_native_annotation(field.annotation, typed_encoder_for, seen):
+            return False
+
+    return all(
+        is_native_annotation(field.return_type, typed_encoder_for, seen) for field in cls.model_computed_fields.values()
+    )
+
+
+def is_native_annotation(annotation, typed_encoder_for, seen):
+    if annotation in PLAIN_TYPES:
+        return True
+
+    if annotation in NATIVE_TYPED_ENCODERS:
+        return typed_encoder_for(annotation) is NATIVE_TYPED_ENCODERS[annotation]
+
+    origin, args = typing.get_origin(annotation), typing.get_args(annotation)
+
+    if origin is typing.Literal:
+        return all(type(arg) in PLAIN_TYPES for arg in args)
+
+    if origin in UNION_TYPES or origin in SEQUENCE_TYPES:
+        return all(arg is Ellipsis or is_native_annotation(arg, typed_encoder_for, seen) for arg in args)
+
+    if origin is dict:
+        return len(args) == 2 and args[0] is str and is_native_annotation(args[1], typed_encoder_for, seen)
+
+    if origin is None and isinstance(annotation, type):
+        if issubclass(annotation, enum.Enum):
+            return issubclass(annotation, (str, int)) and typed_encoder_for(annotation) is None
+        return is_native(annotation, typed_encoder_for, seen)
+
+    return False
@@ -0,0 +1,124 @@
+import array
+import math
+from decimal import Decimal
+from json.encoder import INFINITY
+
+from jsonstar.fragments import Fragment
+
+
+__all__ = ["number_floatstr", "numbers_json", "pack_numbers", "packing_hook"]
+
+
+FLOAT_FORMATS = frozenset("fd")
+
+INTEGER_FORMATS = frozenset("bBhHiIlLqQnN")
+
+BATCH_SIZE = 4096
+"""How many numbers are formatted at once, bounding the temporary objects while writing a buffer."""
+
+
+def number_floatstr(allow_nan):
+    """Return a function writing floats like the stdlib encoder does, Decimals as numbers with all their digits and
+    fragments as they are."""
+
+    def floatstr(o):
+        if type(o) is Fragment:
+            return o.json
+        if isinstance(o, Decimal):
+            if o.is_finite():
+                return str(o)
+            text = "NaN" if o.is_nan() else "-Infinity" if o.is_signed() else "Infinity"
+        elif o != o:
+            text = "NaN"
+        elif o == INFINITY:
+            text = "Infinity"
+        elif o == -INFINITY:
+            text = "-Infinity"
+        else:
+            return float.__repr__(o)
+
+        if not allow_nan:
+            raise ValueError(f"Out of range float values are not JSON compliant: {o!r}")
+
+        return text
+
+    return floatstr
+
+
+def numbers_json(o, separator, allow_nan):
+    """Return the JSON array of the numbers in the buffer of o, or None when they aren't native ints or floats laid
+    out contiguously, like in array.array, memoryview and most NumPy arrays.
+
+    The numbers are read from a memoryview and formatted in batches, so no list holding all of them is ever built.
+    Multidimensional buffers are written as nested arrays, like their tolist would be.
+    """
+    try:
+        view = memoryview(o)
+    except TypeError:
+        return None
+
+    if view.format in FLOAT_FORMATS:
+        format_, floatstr = float.__repr__, number_floatstr(allow_nan)
+    elif view.format in INTEGER_FORMATS:
+        format_, floatstr = int.__repr__, None
+    else:
+        return None
+
+    if view.ndim == 0 or not view.c_contiguous:
+        return None
+
+    flat = view if view.ndim == 1 else view.cast("B").cast(view.format)
+
+    def write_items(start, stop):
+        batches = []
+        for i in range(start, stop, BATCH_SIZE):
+            end = min(i + BATCH_SIZE, stop)
+            batch = flat[i:end]
+            text = separator.join(map(format_, batch))
+            if floatstr is not None and "n" in text:
+                # Only nan and inf have an n, which are written as the encoder writes them, or refused.
+                text = separator.join(map(floatstr, batch))
+            batches.append(text)
+        return separator.join(batches)
+
+    def write_array(start, shape):
+        if len(shape) == 1:
+            return f"[{write_items(start, start + shape[0])}]"
+        size = math.prod(shape[1:])
+        return f"[{separator.join(write_array(start + i * size, shape[1:]) for i in range(shape[0]))}]"
+
+    return write_array(0, view.shape)
+
+
+def pack_numbers(value):
+    """Return the list value as an array.array when it holds only ints fitting in 64 bits, or only floats, packing
+    the lists nested in it too.
+
+    Each number then takes 8 bytes instead of a Python object and a pointer. Empty and mixed lists are kept.
+    """
+    types = set(map(type, value))
+    if types == {float}:
+        return array.array("d", value)
+    if types == {int}:
+        try:
+            return array.array("q", value)
+        except OverflowError:
+            return value
+
+    if list in types:
+        for i, item in enumerate(value):
+            if type(item) is list:
+                value[i] = pack_numbers(item)
+    return value
+
+
+def packing_hook(hook=None):
+    """Return an object hook packing the numeric arrays of each object as it's decoded, before calling hook."""
+
+    def pack(source):
+        for key, value in source.items():
+            if type(value) is list:
+                source[key] = pack_numbers(value)
+        return source if hook is None else hook(source)
+
+    return pack
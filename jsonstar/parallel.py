@@ -0,0 +1,112 @@
+import concurrent.futures
+import os
+from collections import deque
+from collections.abc import Sequence
+from itertools import islice
+
+from jsonstar.encoder import EncoderMeta, JSONEncoderStar, TypedEncoderRegistry
+
+
+__all__ = ["iterencode_parallel"]
+
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def registries_snapshot(cls):
+    """Capture the default encoders of cls and its ancestors, including those registered at runtime."""
+    return [
+        (klass, dict(klass._default_typed_encoders), list(klass._default_functional_encoders))
+        for klass in cls.__mro__
+        if isinstance(klass, EncoderMeta)
+    ]
+
+
+def restore_registries(snapshot):
+    for klass, typed, functional in snapshot:
+        if dict(klass._default_typed_encoders) != typed:
+            klass._default_typed_encoders = TypedEncoderRegistry(typed)
+        if list(klass._default_functional_encoders) != functional:
+            klass._default_functional_encoders = functional
+
+
+def encode_chunk(pid, snapshot, cls, kwargs, chunk, lines):
+    """Encode a chunk of items as a JSON array fragment without brackets, or as JSON Lines."""
+    if os.getpid() != pid:
+        # Worker processes only know the registrations made before they started.
+        restore_registries(snapshot)
+
+    encoder = cls.configured(**kwargs) if isinstance(cls, EncoderMeta) else cls(**kwargs)
+    if lines:
+        return "".join([f"{encoder.encode(item)}\n" for item in chunk])
+
+    return encoder.encode(chunk)[1:-1]
+
+
+def chunked(iterable, chunk_size):
+    if isinstance(iterable, Sequence):
+        for start in range(0, len(iterable), chunk_size):
+            end = start + chunk_size
+            chunk = iterable[start:end]
+            yield chunk if isinstance(chunk, (list, tuple)) else list(chunk)
+    else:
+        iterator = iter(iterable)
+        while chunk := list(islice(iterator, chunk_size)):
+            yield chunk
+
+
+def iterencode_parallel(
+    iterable,
+    executor=None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    lines=False,
+    max_pending=None,
+    cls=JSONEncoderStar,
+    **kwargs,
+):
+    """Encode the items of iterable in chunks on executor, yielding the fragments of a JSON array in order.
+
+    With lines=True the fragments are JSON Lines instead. A process pool is used when no executor is given.
+    At most max_pending chunks, twice the number of CPUs by default, are submitted ahead of the one being yielded,
+    so iterables are consumed as the output is written.
+
+    With process pools the encoder class, its default encoders and kwargs must be picklable. Encoders registered
+    at runtime are sent along with each chunk.
+    """
+    if kwargs.get("indent") is not None:
+        raise ValueError("Parallel encoding does not support indentation.")
+
+    if executor is None:
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            yield from iterencode_parallel(iterable, executor, chunk_size, lines, max_pending, cls, **kwargs)
+        return
+
+    max_pending = max_pending or 2 * (os.cpu_count() or 1)
+    item_separator = (kwargs.get("separators") or (", ", ": "))[0]
+    snapshot = registries_snapshot(cls)
+    pid = os.getpid()
+
+    pending = deque()
+    first = True
+
+    def fragment(future):
+        nonlocal first
+        text = future.result()
+        if lines or first:
+            first = False
+            return text
+        return item_separator + text
+
+    if not lines:
+        yield "["
+
+    for chunk in chunked(iterable, chunk_size):
+        pending.append(executor.submit(encode_chunk, pid, snapshot, cls, kwargs, chunk, lines))
+        if len(pending) >= max_pending:
+            yield fragment(pending.popleft())
+
+    while pending:
+        yield fragment(pending.popleft())
+
+    if not lines:
+        yield "]"
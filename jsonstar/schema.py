@@ -0,0 +1,195 @@
+import dataclasses
+import typing
+from collections.abc import Mapping
+from functools import lru_cache
+
+from jsonstar.default_decoders import DEFAULT_TYPED_DECODERS
+from jsonstar.lazy_types import PYDANTIC_MODEL, attrs_fields, is_attrs_class
+from jsonstar.serializers import UNION_TYPES
+
+
+def attrs_init_fields(cls):
+    """Return (key, argument) pairs of the fields accepted by the attrs class __init__."""
+    return [(a.name, getattr(a, "alias", None) or a.name.lstrip("_")) for a in attrs_fields(cls) if a.init]
+
+
+def is_pydantic_model(cls):
+    return issubclass(cls, PYDANTIC_MODEL)
+
+
+def pydantic_builder(cls):
+    return cls.model_validate if hasattr(cls, "model_validate") else cls.parse_obj
+
+
+__all__ = ["compile_schema"]
+
+
+SEQUENCE_TYPES = (list, tuple, set, frozenset)
+
+
+def nullable(function):
+    def convert(value):
+        return None if value is None else function(value)
+
+    return convert
+
+
+def sequence_converter(container, convert_item):
+    def convert(value):
+        return container(convert_item(item) for item in value)
+
+    return convert
+
+
+def tuple_converter(convert_items):
+    """Convert each item with the converter for its position, keeping the items past them as they are."""
+
+    def convert(value):
+        size = len(convert_items)
+        converted = [item if convert is None else convert(item) for convert, item in zip(convert_items, value)]
+        return tuple(converted + value[size:])
+
+    return convert
+
+
+def mapping_converter(convert_value):
+    def convert(value):
+        return {k: convert_value(v) for k, v in value.items()}
+
+    return convert
+
+
+def class_builder(cls, fields):
+    """Build cls from a decoded dict passing only its init fields, converted when their type requires it."""
+    converters = None
+
+    def build(value):
+        # Resolved on first use so classes referring to themselves don't recurse forever.
+        nonlocal converters
+        if converters is None:
+            converters = [(key, argument, converter_for(hint)) for key, argument, hint in fields]
+
+        kwargs = {}
+        for key, argument, convert in converters:
+            if key in value:
+                item = value[key]
+                kwargs[argument] = convert(item) if convert is not None else item
+        return cls(**kwargs)
+
+    return build
+
+
+def type_hints(cls):
+    try:
+        return typing.get_type_hints(cls)
+    except Exception:
+        return {}
+
+
+@lru_cache(maxsize=None)
+def converter_for(annotation):
+    """Return a function converting decoded JSON values to annotation, or None when no conversion is needed."""
+    if annotation in DEFAULT_TYPED_DECODERS:
+        return nullable(DEFAULT_TYPED_DECODERS[annotation])
+
+    origin, args = typing.get_origin(annotation), typing.get_args(annotation)
+
+    if origin in UNION_TYPES:
+        args = [arg for arg in args if arg is not type(None)]
+        return converter_for(args[0]) if len(args) == 1 else None
+
+    if origin is tuple and args and args[-1] is not Ellipsis:
+        # A fixed length tuple, like tuple[Decimal, UUID], has a type per position.
+        convert_items = tuple(converter_for(arg) for arg in args)
+        return nullable(tuple_converter(convert_items))
+
+    if origin in SEQUENCE_TYPES:
+        convert_item = converter_for(args[0]) if args else None
+        if convert_item is None and origin is list:
+            return None
+        return nullable(sequence_converter(origin, convert_item or (lambda item: item)))
+
+    if origin is dict or origin is Mapping:
+        convert_value = converter_for(args[1]) if len(args) == 2 else None
+        return nullable(mapping_converter(convert_value)) if convert_value is not None else None
+
+    if not isinstance(annotation, type):
+        return None
+
+    if dataclasses.is_dataclass(annotation):
+        hints = type_hints(annotation)
+        fields = [(f.name, f.name, hints.get(f.name)) for f in dataclasses.fields(annotation) if f.init]
+        return nullable(class_builder(annotation, fields))
+
+    if is_attrs_class(annotation):
+        hints = type_hints(annotation)
+        fields = [(key, argument, hints.get(key)) for key, argument in attrs_init_fields(annotation)]
+        return nullable(class_builder(annotation, fields))
+
+    if is_pydantic_model(annotation):
+        return nullable(pydantic_builder(annotation))
+
+    return None
+
+
+def parse_key_path(path):
+    """Split a key path like "items[*].price" into ["items", "*", "price"]."""
+    keys = []
+    for part in path.split("."):
+        name, *indexes = part.split("[")
+        if name:
+            keys.append(name)
+        for index in indexes:
+            if index != "*]":
+                raise ValueError(f"Only [*] is supported as index in key path {path!r}.")
+            keys.append("*")
+    return keys
+
+
+def path_tree(paths):
+    """Group key paths into a nested dict whose leaves are converters, resolving types to their converters."""
+    tree = {}
+    for path, type_or_converter in paths.items():
+        *parents, last = parse_key_path(path)
+        node = tree
+        for key in parents:
+            node = node.setdefault(key, {})
+        node[last] = converter_for(type_or_converter) or type_or_converter
+    return tree
+
+
+def apply_node(node, value):
+    if isinstance(node, dict):
+        return apply_tree(node, value)
+    return None if value is None else node(value)
+
+
+def apply_tree(tree, value):
+    """Convert in place the values of a decoded document found at the tree paths."""
+    if isinstance(value, list):
+        node = tree.get("*")
+        if node is not None:
+            for i, item in enumerate(value):
+                value[i] = apply_node(node, item)
+    elif isinstance(value, dict):
+        for key, node in tree.items():
+            if key in value:
+                value[key] = apply_node(node, value[key])
+    return value
+
+
+def compile_schema(schema):
+    """Return a function that turns a decoded JSON document into schema.
+
+    The schema is either a type, like a dataclass, an attrs class, a pydantic model or list[Model], or a mapping of
+    key paths, like "items[*].price", to the types in DEFAULT_TYPED_DECODERS or to converter functions.
+    Only the declared fields are converted.
+    """
+    if isinstance(schema, Mapping):
+        tree = path_tree(schema)
+        return lambda value: apply_tree(tree, value)
+
+    convert = converter_for(schema)
+    if convert is None:
+        return lambda value: value
+    return convert
@@ -0,0 +1,200 @@
+import json as stdlib_json
+import re
+from collections.abc import Mapping
+from json.decoder import WHITESPACE, JSONDecodeError, scanstring
+
+from jsonstar.schema import path_tree
+
+
+__all__ = ["Selection"]
+
+
+MISSING = object()
+
+DELIMITER = re.compile(r"[ \t\n\r]*([,\]])[ \t\n\r]*")
+
+
+class Branch:
+    """A node of the selected key paths, holding the nodes of its keys and of "*" for array items."""
+
+    __slots__ = ("children", "items")
+
+    def __init__(self, tree):
+        self.children = {key: Branch(node) if isinstance(node, dict) else node for key, node in tree.items()}
+        self.items = self.children.get("*", MISSING)
+
+
+class Selection:
+    """Decode only the values found at key paths, like "items[*].id", and drop everything else as it's read.
+
+    The paths are either a collection, keeping the values as the decoder hook leaves them, or a mapping of paths to
+    the types or functions accepted by jsonstar.schema.compile_schema. The result keeps the shape of the document
+    with only the selected values, and objects without them are left empty.
+
+    Enclosing objects and arrays are walked one value at a time, so skipped values are freed right away. Objects
+    inside arrays, usually many small records, are parsed whole by the C scanner without the hook and then reduced.
+    Either way, hooks and conversions only run on what is selected.
+    """
+
+    def __init__(self, paths, decoder):
+        self.tree = Branch(path_tree(paths if isinstance(paths, Mapping) else dict.fromkeys(paths)))
+        self.scan_once = decoder.scan_once
+        self.object_hook = decoder.object_hook
+        self.strict = decoder.strict
+        self.scan_plain = stdlib_json.JSONDecoder(
+            parse_float=decoder.parse_float,
+            parse_int=decoder.parse_int,
+            parse_constant=decoder.parse_constant,
+            strict=decoder.strict,
+        ).scan_once
+
+    def __call__(self, s):
+        idx = WHITESPACE.match(s, 0).end()
+        value, end = self.select(s, idx, self.tree)
+        end = WHITESPACE.match(s, end).end()
+        if end != len(s):
+            raise JSONDecodeError("Extra data", s, end)
+        return None if value is MISSING else value
+
+    def scan(self, scan_once, s, idx):
+        try:
+            return scan_once(s, idx)
+        except StopIteration as err:
+            raise JSONDecodeError("Expecting value", s, err.value) from None
+
+    def select(self, s, idx, node):
+        """Return the value at idx reduced to the node paths, or MISSING when it can't have them, and its end."""
+        if not isinstance(node, Branch):
+            value, end = self.scan(self.scan_once, s, idx)
+            return (value if node is None or value is None else node(value)), end
+
+        stop = idx + 1
+        char = s[idx:stop]
+        if char == "{":
+            return self.select_object(s, idx + 1, node)
+        if char == "[" and node.items is not MISSING:
+            return self.select_array(s, idx + 1, node.items)
+        return MISSING, self.skip(s, idx)
+
+    def select_object(self, s, idx, node):
+        result = {}
+        children = node.children
+        idx = WHITESPACE.match(s, idx).end()
+        if s.startswith("}", idx):
+            return self.hook(result), idx + 1
+
+        while True:
+            if not s.startswith('"', idx):
+                raise JSONDecodeError("Expecting property name enclosed in double quotes", s, idx)
+            key, idx = scanstring(s, idx + 1, self.strict)
+
+            idx = WHITESPACE.match(s, idx).end()
+            if not s.startswith(":", idx):
+                raise JSONDecodeError("Expecting ':' delimiter", s, idx)
+            idx = WHITESPACE.match(s, idx + 1).end()
+
+            child = children.get(key, MISSING)
+            if child is MISSING:
+                idx = self.skip(s, idx)
+            else:
+                value, idx = self.select(s, idx, child)
+                if value is not MISSING:
+                    result[key] = value
+
+            idx = WHITESPACE.match(s, idx).end()
+            stop = idx + 1
+            char = s[idx:stop]
+            if char == "}":
+                return self.hook(result), idx + 1
+            if char != ",":
+                raise JSONDecodeError("Expecting ',' delimiter", s, idx)
+            idx = WHITESPACE.match(s, idx + 1).end()
+
+    def select_array(self, s, idx, node):
+        result = []
+        idx = WHITESPACE.match(s, idx).end()
+        if s.startswith("]", idx):
+            return result, idx + 1
+
+        project, scan_plain = self.project, self.scan_plain
+        try:
+            while True:
+                if isinstance(node, Branch):
+                    value, idx = scan_plain(s, idx)
+                    value = project(node, value)
+                else:
+                    value, idx = self.select(s, idx, node)
+                if value is not MISSING:
+                    result.append(value)
+
+                match = DELIMITER.match(s, idx)
+                if match is None:
+                    raise JSONDecodeError("Expecting ',' delimiter", s, WHITESPACE.match(s, idx).end())
+                idx = match.end()
+                if match.group(1) == "]":
+                    return result, idx
+        except StopIteration as err:
+            raise JSONDecodeError("Expecting value", s, err.value) from None
+
+    def skip(self, s, idx):
+        """Return where the value at idx ends, reading arrays one item at a time so they're never built whole."""
+        if not s.startswith("[", idx):
+            return self.scan(self.scan_plain, s, idx)[1]
+
+        idx = WHITESPACE.match(s, idx + 1).end()
+        if s.startswith("]", idx):
+            return idx + 1
+
+        skip, scan_plain = self.skip, self.scan_plain
+        try:
+            while True:
+                idx = skip(s, idx) if s.startswith("[", idx) else scan_plain(s, idx)[1]
+                match = DELIMITER.match(s, idx)
+                if match is None:
+                    raise JSONDecodeError("Expecting ',' delimiter", s, WHITESPACE.match(s, idx).end())
+                idx = match.end()
+                if match.group(1) == "]":
+                    return idx
+        except StopIteration as err:
+            raise JSONDecodeError("Expecting value", s, err.value) from None
+
+    def project(self, node, value):
+        """Reduce a value decoded without the hook to the node paths, hooking and converting only what's kept."""
+        if isinstance(value, dict):
+            result = {}
+            for key, child in node.children.items():
+                if key in value:
+                    item = value[key]
+                    if isinstance(child, Branch):
+                        item = self.project(child, item)
+                        if item is MISSING:
+                            continue
+                    else:
+                        item = self.convert(child, item)
+                    result[key] = item
+            return self.hook(result)
+
+        if isinstance(value, list) and node.items is not MISSING:
+            if not isinstance(node.items, Branch):
+                return [self.convert(node.items, item) for item in value]
+            return [item for item in (self.project(node.items, item) for item in value) if item is not MISSING]
+
+        return MISSING
+
+    def convert(self, node, value):
+        if self.object_hook is not None and isinstance(value, (dict, list)):
+            value = self.rehook(value)
+        return value if node is None or value is None else node(value)
+
+    def rehook(self, value):
+        """Apply the hook from the innermost objects out, as the scanner does while decoding."""
+        if isinstance(value, list):
+            return [self.rehook(item) if isinstance(item, (dict, list)) else item for item in value]
+
+        for key, item in value.items():
+            if isinstance(item, (dict, list)):
+                value[key] = self.rehook(item)
+        return self.object_hook(value)
+
+    def hook(self, result):
+        return self.object_hook(result) if self.object_hook is not None else result
@@ -0,0 +1,65 @@
+import dataclasses
+import types
+import typing
+
+from jsonstar.lazy_types import attrs_fields, is_attrs_class
+
+
+__all__ = ["compile_serializer", "is_compilable"]
+
+
+UNION_TYPES = (typing.Union, getattr(types, "UnionType", typing.Union))
+
+
+def is_compilable(cls):
+    """Tell if a serializer can be compiled for cls, which must be a dataclass or an attrs class."""
+    return isinstance(cls, type) and (dataclasses.is_dataclass(cls) or is_attrs_class(cls))
+
+
+def field_names(cls):
+    if dataclasses.is_dataclass(cls):
+        return tuple(field.name for field in dataclasses.fields(cls))
+
+    return tuple(field.name for field in attrs_fields(cls))
+
+
+def annotated_class(annotation):
+    """Return the class a field is annotated with, unwrapping Optional, or None when it is not a single class."""
+    if typing.get_origin(annotation) in UNION_TYPES:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        annotation = args[0] if len(args) == 1 else None
+
+    return annotation if isinstance(annotation, type) else None
+
+
+def compile_serializer(cls, typed_encoder_for):
+    """Generate a function returning the top level fields of cls instances as a dict.
+
+    Fields annotated with a class that typed_encoder_for resolves to an encoder are converted inline when the
+    value is exactly of that class. Everything else is left for the JSON encoder to recurse into.
+    """
+    try:
+        hints = typing.get_type_hints(cls)
+    except Exception:
+        hints = {}
+
+    namespace = {}
+    items = []
+    for i, name in enumerate(field_names(cls)):
+        type_ = annotated_class(hints.get(name))
+        encoder = typed_encoder_for(type_) if type_ is not None else None
+
+        if encoder is None:
+            items.append(f"{name!r}: o.{name}")
+        else:
+            namespace[f"type_{i}"] = type_
+            namespace[f"encoder_{i}"] = encoder
+            items.append(f"{name!r}: encoder_{i}(v) if type(v := o.{name}) is type_{i} else v")
+
+    body = ",\n        ".join(items)
+    source = f"def serialize(o):\n    return {{\n        {body}\n    }}\n"
+    exec(compile(source, f"<jsonstar serializer for {cls.__qualname__}>", "exec"), namespace)  # nosec
+
+    serialize = namespace["serialize"]
+    serialize.__qualname__ = f"serialize_{cls.__qualname__}"
+    return serialize
@@ -0,0 +1,104 @@
+from collections import defaultdict
+from functools import wraps
+from time import perf_counter
+
+
+__all__ = ["DecoderStats", "EncoderStats"]
+
+
+def type_name(type_):
+    return f"{type_.__module__}.{type_.__qualname__}"
+
+
+def encoder_name(encoder):
+    return getattr(encoder, "__qualname__", None) or repr(encoder)
+
+
+class TypeStats:
+    __slots__ = ("typed_hits", "functional_attempts", "functional_failures", "seconds")
+
+    def __init__(self):
+        self.typed_hits = 0
+        self.functional_attempts = 0
+        self.functional_failures = 0
+        self.seconds = defaultdict(float)
+
+    def as_dict(self):
+        return {
+            "typed_hits": self.typed_hits,
+            "functional_attempts": self.functional_attempts,
+            "functional_failures": self.functional_failures,
+            "seconds": dict(self.seconds),
+        }
+
+
+class EncoderStats:
+    """Count, per concrete type, typed encoder hits, functional encoder attempts and failures, and time per encoder.
+
+    Pass it to JSONEncoderStar(stats=...) or jsonstar.dumps(..., stats=...). Encoders without stats don't pay for it.
+    """
+
+    def __init__(self):
+        self._types = defaultdict(TypeStats)
+        self._instrumented = {}
+
+    def snapshot(self):
+        """Return the counters as plain dicts keyed by the qualified name of each type, ready to export as metrics."""
+        return {type_name(type_): stats.as_dict() for type_, stats in list(self._types.items())}
+
+    def reset(self):
+        self._types.clear()
+
+    def instrument_typed(self, encoder):
+        key = ("typed", encoder)
+        if key not in self._instrumented:
+            name = encoder_name(encoder)
+
+            @wraps(encoder)
+            def instrumented(o):
+                stats = self._types[o.__class__]
+                stats.typed_hits += 1
+                start = perf_counter()
+                try:
+                    return encoder(o)
+                finally:
+                    stats.seconds[name] += perf_counter() - start
+
+            self._instrumented[key] = instrumented
+        return self._instrumented[key]
+
+    def instrument_functional(self, encoder):
+        key = ("functional", encoder)
+        if key not in self._instrumented:
+            name = encoder_name(encoder)
+
+            @wraps(encoder)
+            def instrumented(o):
+                stats = self._types[o.__class__]
+                stats.functional_attempts += 1
+                start = perf_counter()
+                try:
+                    return encoder(o)
+                except Exception:
+                    stats.functional_failures += 1
+                    raise
+                finally:
+                    stats.seconds[name] += perf_counter() - start
+
+            self._instrumented[key] = instrumented
+        return self._instrumented[key]
+
+
+class DecoderStats:
+    """Count how many strings JSONDecoderStar.hook tried to parse as datetimes and how many succeeded."""
+
+    def __init__(self):
+        self.datetime_attempts = 0
+        self.datetime_successes = 0
+
+    def snapshot(self):
+        return {"datetime_attempts": self.datetime_attempts, "datetime_successes": self.datetime_successes}
+
+    def reset(self):
+        self.datetime_attempts = 0
+        self.datetime_successes = 0
@@ -0,0 +1,47 @@
+__all__ = ["DEFAULT_BUFFER_SIZE", "StreamedArray", "write_buffered"]
+
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+_EMPTY = object()
+
+
+class StreamedArray(list):
+    """An empty list standing in for an iterator so the pure Python encoder streams its items as a JSON array.
+
+    Only the first item is fetched in advance, to tell an empty iterator apart.
+    """
+
+    def __init__(self, iterable):
+        super().__init__()
+        self._iterator = iter(iterable)
+        self._first = next(self._iterator, _EMPTY)
+
+    def __bool__(self):
+        return self._first is not _EMPTY
+
+    def __iter__(self):
+        if self._first is _EMPTY:
+            return
+
+        first, self._first = self._first, _EMPTY
+        yield first
+        yield from self._iterator
+
+
+def write_buffered(fp, chunks, buffer_size=DEFAULT_BUFFER_SIZE, encoding=None):
+    """Write chunks to fp coalescing them into writes of about buffer_size characters, as bytes when encoding is set."""
+    buffer = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= buffer_size:
+            text = "".join(buffer)
+            fp.write(text.encode(encoding) if encoding else text)
+            buffer.clear()
+            size = 0
+
+    if buffer:
+        text = "".join(buffer)
+        fp.write(text.encode(encoding) if encoding else text)
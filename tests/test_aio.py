@@ -0,0 +1,139 @@
+import asyncio
+from datetime import date, datetime
+
+import pytest
+
+import jsonstar
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def reader_of(data, limit=3):
+    """Return a StreamReader fed with data, split in parts of limit bytes."""
+
+    async def feed():
+        reader = asyncio.StreamReader()
+        for start in range(0, len(data), limit):
+            end = start + limit
+            reader.feed_data(data[start:end])
+        reader.feed_eof()
+        return reader
+
+    return feed()
+
+
+class BufferWriter:
+    def __init__(self):
+        self.chunks = []
+        self.drained = 0
+
+    def write(self, data):
+        self.chunks.append(data)
+
+    async def drain(self):
+        self.drained += 1
+
+
+async def collect(agen):
+    return [item async for item in agen]
+
+
+OBJ = {"records": [{"id": i, "day": date(2024, 1, 1), "name": "ação"} for i in range(50)]}
+
+
+class TestAsyncEncode:
+    def test_aiterencode_yields_utf8_chunks_of_the_whole_document(self):
+        chunks = run(collect(jsonstar.aiterencode(OBJ, chunk_size=100, ensure_ascii=False)))
+
+        assert len(chunks) > 1
+        assert all(isinstance(chunk, bytes) for chunk in chunks)
+        assert b"".join(chunks) == jsonstar.dumps(OBJ, ensure_ascii=False).encode()
+
+    def test_aiterencode_lets_other_tasks_run(self):
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(len(ticks))
+                await asyncio.sleep(0)
+
+        async def main():
+            task = asyncio.create_task(ticker())
+            await collect(jsonstar.aiterencode(OBJ, chunk_size=100))
+            task.cancel()
+
+        run(main())
+
+        assert len(ticks) > 1
+
+    def test_adump_writes_and_drains(self):
+        writer = BufferWriter()
+
+        run(jsonstar.adump({"records": (i for i in range(1000))}, writer, chunk_size=100))
+
+        assert b"".join(writer.chunks) == jsonstar.dumps({"records": list(range(1000))}).encode()
+        assert writer.drained == len(writer.chunks) > 1
+
+
+class TestAsyncDecode:
+    def test_aload(self):
+        async def main():
+            return await jsonstar.aload(await reader_of('{"name": "ação", "day": "2024-01-01"}'.encode()))
+
+        assert run(main()) == {"name": "ação", "day": datetime(2024, 1, 1)}
+
+    def test_aiterload_yields_elements_as_they_complete(self):
+        data = jsonstar.dumps(OBJ["records"], ensure_ascii=False).encode()
+
+        async def main():
+            return await collect(jsonstar.aiterload(await reader_of(data, limit=100), chunk_size=64))
+
+        assert run(main()) == jsonstar.loads(data)
+
+    def test_aiterload_yields_other_values_whole(self):
+        async def main():
+            return await collect(jsonstar.aiterload(await reader_of(b'{"day": "2024-01-01"}')))
+
+        assert run(main()) == [{"day": datetime(2024, 1, 1)}]
+
+    def test_aiterload_lets_other_tasks_run(self):
+        data = jsonstar.dumps(OBJ["records"]).encode()
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(len(ticks))
+                await asyncio.sleep(0)
+
+        async def main():
+            task = asyncio.create_task(ticker())
+            await collect(jsonstar.aiterload(await reader_of(data, limit=len(data)), chunk_size=100))
+            task.cancel()
+
+        run(main())
+
+        assert len(ticks) > 1
+
+    def test_aiterload_raises_on_incomplete_documents(self):
+        async def main():
+            return await collect(jsonstar.aiterload(await reader_of(b'[{"id": 1}, {"id"')))
+
+        with pytest.raises(ValueError):
+            run(main())
+
+    def test_aload_lines_yields_records_as_lines_complete(self):
+        data = '{"id": 1}\n\n{"name": "ação"}\n[1, 2]'.encode()
+
+        async def main():
+            return await collect(jsonstar.aload_lines(await reader_of(data), chunk_size=4))
+
+        assert run(main()) == [{"id": 1}, {"name": "ação"}, [1, 2]]
+
+    def test_aload_lines_raises_on_invalid_records(self):
+        async def main():
+            return await collect(jsonstar.aload_lines(await reader_of(b'{"id": 1}\ninvalid\n')))
+
+        with pytest.raises(ValueError):
+            run(main())
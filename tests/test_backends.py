@@ -0,0 +1,177 @@
+import dataclasses
+import enum
+import io
+import math
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+import jsonstar
+from jsonstar import JSONEncoderStar
+from jsonstar.backends import orjson_options
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: int
+
+
+OBJ = {
+    "datetime": datetime(2023, 1, 1, 13, 45, 30, 643768, tzinfo=timezone.utc),
+    "date": date(2023, 1, 1),
+    "time": time(13, 45, 30, 643768),
+    "timedelta": timedelta(days=2, hours=3),
+    "decimal": Decimal("10.50"),
+    "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "set": {1},
+    "point": Point(1, 2),
+    "text": "ação",
+    "nested": [{"b": 1, "a": [True, None, 1.5]}],
+}
+
+COMPACT = {"separators": (",", ":"), "ensure_ascii": False}
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+class TestDumpsBytes:
+    @pytest.mark.parametrize("kwargs", [{}, COMPACT, {"indent": 2, "ensure_ascii": False, "sort_keys": True}])
+    def test_output_matches_dumps(self, kwargs):
+        assert jsonstar.dumps_bytes(OBJ, **kwargs) == jsonstar.dumps(OBJ, **kwargs).encode()
+
+    def test_floats_match_dumps(self):
+        obj = [1e-07, 1e16, 0.1, -0.0, math.nan, math.inf, -math.inf]
+
+        assert jsonstar.dumps_bytes(obj, **COMPACT) == jsonstar.dumps(obj, **COMPACT).encode()
+        assert jsonstar.dumps_bytes(obj, **COMPACT) == b"[1e-07,1e+16,0.1,-0.0,NaN,Infinity,-Infinity]"
+
+    def test_nan_is_refused_without_allow_nan(self):
+        with pytest.raises(ValueError):
+            jsonstar.dumps_bytes([math.nan], allow_nan=False, **COMPACT)
+
+    def test_plain_enums_are_refused_like_dumps(self):
+        with pytest.raises(TypeError):
+            jsonstar.dumps(Color.RED, **COMPACT)
+        with pytest.raises(TypeError):
+            jsonstar.dumps_bytes(Color.RED, **COMPACT)
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            jsonstar.dumps_bytes(OBJ, backend="ujson")
+
+    def test_errors_are_raised_by_the_stdlib_encoder(self):
+        with pytest.raises(TypeError):
+            jsonstar.dumps_bytes(object(), **COMPACT)
+
+
+class TestDumpBytes:
+    @pytest.mark.parametrize("kwargs", [{}, COMPACT])
+    def test_dump_bytes_writes_utf8(self, kwargs):
+        fp = io.BytesIO()
+
+        jsonstar.dump_bytes(OBJ, fp, buffer_size=16, **kwargs)
+
+        assert fp.getvalue() == jsonstar.dumps(OBJ, **kwargs).encode()
+
+
+class TestOrjsonBackend:
+    @pytest.fixture(autouse=True)
+    def orjson(self):
+        return pytest.importorskip("orjson")
+
+    def test_orjson_is_only_used_when_asked_for(self, orjson):
+        with patch("orjson.dumps", wraps=orjson.dumps) as dumps:
+            jsonstar.dumps_bytes(OBJ, **COMPACT)
+            assert not dumps.called
+
+            jsonstar.dumps_bytes(OBJ, backend="orjson", **COMPACT)
+            assert dumps.called
+
+    @pytest.mark.parametrize("kwargs", [COMPACT, {"indent": 2, "ensure_ascii": False, "sort_keys": True}])
+    def test_output_matches_dumps(self, kwargs):
+        assert jsonstar.dumps_bytes(OBJ, backend="orjson", **kwargs) == jsonstar.dumps(OBJ, **kwargs).encode()
+
+    def test_output_differs_for_a_few_values(self):
+        obj = [1e-07, math.nan, Color.RED]
+
+        assert jsonstar.dumps_bytes(obj, backend="orjson", **COMPACT) == b'[1e-7,null,"red"]'
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"separators": (",", ":")},
+            {"ensure_ascii": False},
+            {"indent": 4, "ensure_ascii": False},
+            {"skipkeys": True, **COMPACT},
+            {"allow_nan": False, **COMPACT},
+        ],
+    )
+    def test_orjson_is_not_used_for_other_configurations(self, kwargs):
+        assert orjson_options(JSONEncoderStar(**kwargs)) is None
+
+    def test_orjson_is_not_used_when_uuid_encoding_changes(self):
+        encoder = JSONEncoderStar(typed_encoders={uuid.UUID: lambda o: o.hex}, **COMPACT)
+
+        assert orjson_options(encoder) is None
+
+    def test_dump_bytes_with_orjson(self):
+        fp = io.BytesIO()
+
+        jsonstar.dump_bytes(OBJ, fp, backend="orjson", **COMPACT)
+
+        assert fp.getvalue() == jsonstar.dumps(OBJ, **COMPACT).encode()
+
+    def test_forcing_orjson_on_incompatible_configuration(self):
+        with pytest.raises(ValueError):
+            jsonstar.dumps_bytes(OBJ, backend="orjson")
+
+    def test_what_orjson_refuses_falls_back_to_stdlib(self):
+        obj = {1: 2**70}
+
+        assert jsonstar.dumps_bytes(obj, backend="orjson", **COMPACT) == b'{"1":1180591620717411303424}'
+
+    def test_decimals_as_numbers_match_dumps(self, orjson):
+        if not hasattr(orjson, "Fragment"):
+            pytest.skip("orjson.Fragment requires orjson 3.9")
+
+        obj = {"amounts": [Decimal("1.10"), Decimal("1E+3")], **OBJ}
+
+        assert jsonstar.dumps_bytes(obj, backend="orjson", decimals_as_numbers=True, **COMPACT) == jsonstar.dumps(
+            obj, decimals_as_numbers=True, **COMPACT
+        ).encode("utf-8")
+
+    @pytest.mark.parametrize("kwargs", [{"decimals_as_numbers": True}, {"fragment_cache": jsonstar.FragmentCache()}])
+    def test_default_argument_is_used(self, kwargs):
+        output = jsonstar.dumps_bytes([object()], backend="orjson", default=lambda o: "custom", **kwargs, **COMPACT)
+
+        assert output == b'["custom"]'
+
+    @pytest.mark.parametrize("kwargs", [{"decimals_as_numbers": True}, {"fragment_cache": jsonstar.FragmentCache()}])
+    def test_default_method_of_subclasses_is_used(self, kwargs):
+        class Encoder(JSONEncoderStar):
+            def default(self, o):
+                return "custom"
+
+        output = jsonstar.dumps_bytes([object()], cls=Encoder, backend="orjson", **kwargs, **COMPACT)
+
+        assert output == b'["custom"]'
+
+    def test_cached_fragments_match_dumps(self, orjson):
+        if not hasattr(orjson, "Fragment"):
+            pytest.skip("orjson.Fragment requires orjson 3.9")
+
+        cache = jsonstar.FragmentCache(types=[Decimal])
+        amount = Decimal("1.10")
+        obj = {"amounts": [amount, amount], **OBJ}
+
+        assert jsonstar.dumps_bytes(obj, backend="orjson", fragment_cache=cache, **COMPACT) == jsonstar.dumps(
+            obj, **COMPACT
+        ).encode("utf-8")
+        assert (cache.hits, cache.misses) == (1, 2)
@@ -0,0 +1,119 @@
+import dataclasses
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Optional
+
+import attrs
+import pytest
+
+from jsonstar import JSONEncoderStar
+from jsonstar.serializers import compile_serializer, is_compilable
+
+
+@dataclasses.dataclass
+class Payment:
+    id: uuid.UUID
+    amount: Decimal
+    paid_at: Optional[datetime]
+    note: str = ""
+
+
+@attrs.define
+class AttrsPayment:
+    amount: Decimal
+    payment: Payment
+
+
+class CompiledEncoder(JSONEncoderStar):
+    compile_serializers = True
+
+
+@pytest.fixture
+def payment():
+    return Payment(
+        id=uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        amount=Decimal("10.50"),
+        paid_at=datetime(2024, 1, 1, 12, tzinfo=timezone.utc),
+    )
+
+
+class TestCompileSerializer:
+    def test_only_dataclasses_and_attrs_classes_are_compilable(self):
+        assert is_compilable(Payment)
+        assert is_compilable(AttrsPayment)
+        assert not is_compilable(object)
+        assert not is_compilable(Payment(uuid.uuid4(), Decimal(0), None))
+
+    def test_annotated_fields_are_converted_inline(self, payment):
+        serialize = compile_serializer(Payment, JSONEncoderStar().typed_encoder_for)
+
+        assert serialize(payment) == {
+            "id": "12345678-1234-5678-1234-567812345678",
+            "amount": "10.50",
+            "paid_at": "2024-01-01T12:00:00.000Z",
+            "note": "",
+        }
+
+    def test_values_of_other_types_are_left_for_the_encoder(self, payment):
+        serialize = compile_serializer(Payment, JSONEncoderStar().typed_encoder_for)
+        payment.amount = 10
+        payment.paid_at = None
+
+        assert serialize(payment)["amount"] == 10
+        assert serialize(payment)["paid_at"] is None
+
+    def test_nested_objects_are_left_for_the_encoder(self, payment):
+        serialize = compile_serializer(AttrsPayment, JSONEncoderStar().typed_encoder_for)
+
+        assert serialize(AttrsPayment(Decimal("1"), payment)) == {"amount": "1", "payment": payment}
+
+
+class TestCompiledEncoder:
+    def test_compiled_output_matches_default_encoder(self, payment):
+        obj = [payment, AttrsPayment(Decimal("1"), payment)]
+
+        assert CompiledEncoder().encode(obj) == JSONEncoderStar().encode(obj)
+
+    def test_serializer_is_cached_in_the_dispatch(self, payment):
+        encoder = CompiledEncoder()
+        encoder.encode(payment)
+
+        assert encoder.typed_encoder_for(Payment) is encoder.typed_encoder_for(Payment)
+        assert encoder.typed_encoder_for(Payment).__qualname__ == "serialize_Payment"
+
+    def test_serializers_are_not_compiled_by_default(self):
+        assert JSONEncoderStar().typed_encoder_for(Payment) is None
+
+    def test_serializer_follows_registered_typed_encoders(self, payment):
+        class Encoder(CompiledEncoder):
+            pass
+
+        assert '"amount": "10.50"' in Encoder().encode(payment)
+
+        Encoder.register_default_encoder(float, Decimal)
+
+        assert '"amount": 10.5' in Encoder().encode(payment)
+
+    def test_typed_encoders_have_precedence_over_compiled_serializers(self, payment):
+        encoder = CompiledEncoder(typed_encoders={Payment: lambda o: "Payment encoder"})
+
+        assert encoder.encode(payment) == '"Payment encoder"'
+
+
+class TestPrecompile:
+    def test_precompile_fills_the_class_dispatch(self):
+        class Encoder(CompiledEncoder):
+            pass
+
+        Encoder.precompile(Payment, AttrsPayment)
+
+        assert set(Encoder._dispatch.typed) == {Payment, AttrsPayment}
+
+    def test_precompile_requires_compile_serializers(self):
+        with pytest.raises(TypeError):
+            JSONEncoderStar.precompile(Payment)
+
+    def test_precompile_rejects_other_classes(self):
+        with pytest.raises(TypeError):
+            CompiledEncoder.precompile(object)
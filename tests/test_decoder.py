@@ -0,0 +1,176 @@
+import dataclasses
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import Optional
+
+import attrs
+import pytest
+from pydantic import BaseModel
+
+import jsonstar
+from jsonstar.decoder import JSONDecoderStar
+from jsonstar.default_decoders import DEFAULT_TYPED_DECODERS, decode_timedelta_from_iso_string
+
+
+class TestDatetimeHook:
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("2024-01-01", datetime(2024, 1, 1)),
+            ("2024-01-01T13:45:30", datetime(2024, 1, 1, 13, 45, 30)),
+            ("2024-01-01 13:45:30.643", datetime(2024, 1, 1, 13, 45, 30, 643000)),
+            ("2024-01-01T13:45:30.643+00:00", datetime(2024, 1, 1, 13, 45, 30, 643000, tzinfo=timezone.utc)),
+        ],
+    )
+    def test_iso_strings_are_decoded_as_datetime(self, value, expected):
+        assert jsonstar.loads(f'{{"value": "{value}"}}') == {"value": expected}
+
+    @pytest.mark.parametrize("value", ["John Doe", "", "2024", "20240101", "2024-13-01", "1234 Main Street", "2024-ab"])
+    def test_other_strings_are_kept(self, value):
+        assert jsonstar.loads(f'{{"value": "{value}"}}') == {"value": value}
+
+    def test_other_types_are_kept(self):
+        assert jsonstar.loads('{"a": 1, "b": null, "c": [1], "d": {}}') == {"a": 1, "b": None, "c": [1], "d": {}}
+
+    def test_hook_updates_the_dict_in_place(self):
+        source = {"name": "John Doe", "birthday": "1990-01-01"}
+
+        assert JSONDecoderStar.hook(source) is source
+        assert source == {"name": "John Doe", "birthday": datetime(1990, 1, 1)}
+
+
+class TestDefaultTypedDecoders:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            datetime(2024, 1, 1, 13, 45, 30, 643000, tzinfo=timezone.utc),
+            datetime(2024, 1, 1, 13, 45, 30, 643000),
+            date(2024, 1, 1),
+            time(13, 45, 30, 643000),
+            timedelta(days=2, hours=3, minutes=4, seconds=5),
+            timedelta(days=-2, hours=-3, minutes=-4, seconds=-5),
+            timedelta(seconds=1, microseconds=123456),
+            Decimal("10.50"),
+            uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        ],
+    )
+    def test_decoders_reverse_default_encoders(self, value):
+        assert DEFAULT_TYPED_DECODERS[type(value)](jsonstar.loads(jsonstar.dumps(value))) == value
+
+    def test_invalid_duration_raises_value_error(self):
+        with pytest.raises(ValueError):
+            decode_timedelta_from_iso_string("P2D")
+
+
+@dataclasses.dataclass
+class Item:
+    id: uuid.UUID
+    price: Decimal
+    name: str
+
+
+@attrs.define
+class Order:
+    placed_at: datetime
+    items: list[Item]
+    shipped_on: Optional[date] = None
+    parent: Optional["Order"] = None
+
+
+class Customer(BaseModel):
+    name: str
+    birthday: date
+
+
+ORDER_JSON = """{
+    "placed_at": "2024-01-01T12:00:00.000Z",
+    "items": [{"id": "12345678-1234-5678-1234-567812345678", "price": "9.99", "name": "2024-01-01"}],
+    "shipped_on": null,
+    "unknown": "ignored"
+}"""
+
+
+class TestSchemaDecoding:
+    def test_decode_into_classes(self):
+        assert jsonstar.loads(ORDER_JSON, schema=Order) == Order(
+            placed_at=datetime(2024, 1, 1, 12, tzinfo=timezone.utc),
+            items=[Item(uuid.UUID("12345678-1234-5678-1234-567812345678"), Decimal("9.99"), "2024-01-01")],
+        )
+
+    def test_decode_into_generic_types(self):
+        orders = jsonstar.loads(f"[{ORDER_JSON}]", schema=list[Order])
+
+        assert [order.items[0].price for order in orders] == [Decimal("9.99")]
+
+    def test_decode_self_referencing_classes(self):
+        order = jsonstar.loads(
+            '{"placed_at": "2024-01-01", "items": [], "parent": {"placed_at": "2023-01-01", ' '"items": []}}',
+            schema=Order,
+        )
+
+        assert order.parent.placed_at == datetime(2023, 1, 1)
+
+    def test_decode_fixed_length_tuples_item_by_item(self):
+        @dataclasses.dataclass
+        class Row:
+            pair: tuple[Decimal, uuid.UUID]
+            dated: tuple[str, date]
+            amounts: tuple[Decimal, ...]
+
+        data = (
+            '{"pair": ["1.50", "12345678-1234-5678-1234-567812345678"], "dated": ["2024-01-01", "2024-01-02"], '
+            '"amounts": ["1", "2.5"]}'
+        )
+
+        assert jsonstar.loads(data, schema=Row) == Row(
+            pair=(Decimal("1.50"), uuid.UUID("12345678-1234-5678-1234-567812345678")),
+            dated=("2024-01-01", date(2024, 1, 2)),
+            amounts=(Decimal("1"), Decimal("2.5")),
+        )
+
+    def test_decode_into_pydantic_models(self):
+        assert jsonstar.loads('{"name": "John", "birthday": "1990-01-01"}', schema=Customer) == Customer(
+            name="John", birthday=date(1990, 1, 1)
+        )
+
+    def test_decode_key_paths(self):
+        schema = {"placed_at": datetime, "items[*].price": Decimal, "items[*].id": lambda s: s.upper()}
+
+        assert jsonstar.loads(ORDER_JSON, schema=schema) == {
+            "placed_at": datetime(2024, 1, 1, 12, tzinfo=timezone.utc),
+            "items": [{"id": "12345678-1234-5678-1234-567812345678", "price": Decimal("9.99"), "name": "2024-01-01"}],
+            "shipped_on": None,
+            "unknown": "ignored",
+        }
+
+    def test_decode_key_paths_of_top_level_arrays(self):
+        assert jsonstar.loads('[{"price": "1.10"}, {"price": null}, {}]', schema={"[*].price": Decimal}) == [
+            {"price": Decimal("1.10")},
+            {"price": None},
+            {},
+        ]
+
+    def test_undeclared_iso_strings_are_not_decoded_with_schema(self):
+        assert jsonstar.loads('{"when": "2024-01-01"}', schema={}) == {"when": "2024-01-01"}
+
+    def test_invalid_key_path_index(self):
+        with pytest.raises(ValueError):
+            jsonstar.loads("[]", schema={"items[0].price": Decimal})
+
+
+class TestDecimalsAsNumbers:
+    def test_fractions_and_exponents_are_decoded_as_decimals(self):
+        assert jsonstar.loads('[1.10, 2, 1e3, {"a": 0.1}]', decimals_as_numbers=True) == [
+            Decimal("1.10"),
+            2,
+            Decimal("1E+3"),
+            {"a": Decimal("0.1")},
+        ]
+
+    def test_round_trip_keeps_every_digit(self):
+        amounts = [Decimal("0.10"), Decimal("12345678901234567890.123456789"), Decimal("-0.000001")]
+        document = jsonstar.dumps(amounts, decimals_as_numbers=True)
+
+        assert document == "[0.10, 12345678901234567890.123456789, -0.000001]"
+        assert [str(d) for d in jsonstar.loads(document, decimals_as_numbers=True)] == [str(d) for d in amounts]
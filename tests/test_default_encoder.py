@@ -1,14 +1,22 @@
 import dataclasses
 import uuid
 from datetime import date, datetime, time, timedelta
+from datetime import timezone as dt_timezone
 
 import attrs
 import pytest
 from freezegun import freeze_time
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_serializer, model_serializer
 from pytz import timezone
 
-from jsonstar import JSONEncoderStar
+from jsonstar import JSONEncoderStar, ShallowJSONEncoderStar
+from jsonstar.default_encoders import (
+    attrs_dict,
+    attrs_shallow_dict,
+    cached_temporal_encoders,
+    dataclasses_shallow_dict,
+    encode_datetime_as_ecma262_string,
+)
 
 
 def encode(o):
@@ -30,6 +38,60 @@ class TestDatetimeEncoder:
         assert encode(dt) == expected
 
 
+DATETIMES = [
+    datetime(2023, 1, 1, 13, 45, 30, 643768),
+    datetime(2023, 1, 1, 13, 45, 30),
+    datetime(2023, 1, 1, 13, 45, 30, 643768, tzinfo=dt_timezone.utc),
+    datetime(2023, 1, 1, 13, 45, 30, 643768, tzinfo=timezone("UTC")),
+    datetime(2023, 1, 1, 13, 45, 30, 643768, tzinfo=dt_timezone(timedelta(hours=-3))),
+    datetime(2023, 1, 1, 13, 45, 30, 643768, tzinfo=dt_timezone(timedelta(seconds=30))),
+    timezone("Europe/London").localize(datetime(2023, 1, 1, 13, 45, 30, 643768)),
+    datetime(1, 1, 1, tzinfo=dt_timezone.utc),
+]
+
+
+class TestDatetimeFormatting:
+    @pytest.mark.parametrize("value", DATETIMES)
+    def test_output_matches_isoformat_with_z(self, value):
+        assert encode_datetime_as_ecma262_string(value) == value.isoformat(timespec="milliseconds").replace(
+            "+00:00", "Z"
+        )
+
+    @pytest.mark.parametrize("value", [*DATETIMES, date(2022, 1, 1), time(13, 45, 30, 643768)])
+    def test_cached_encoders_match_default_encoders(self, value):
+        encoders = cached_temporal_encoders(maxsize=2)
+        expected = encode(value)
+
+        assert JSONEncoderStar(typed_encoders=encoders).encode(value).strip('"') == expected
+        assert JSONEncoderStar(typed_encoders=encoders).encode(value).strip('"') == expected
+
+    def test_cached_datetimes_tell_apart_equal_instants_in_other_timezones(self):
+        encoder = JSONEncoderStar(typed_encoders=cached_temporal_encoders())
+        utc = datetime(2023, 1, 1, 12, tzinfo=dt_timezone.utc)
+        brt = utc.astimezone(dt_timezone(timedelta(hours=-3)))
+
+        assert utc == brt
+        assert encoder.encode([utc, brt]) == '["2023-01-01T12:00:00.000Z", "2023-01-01T09:00:00.000-03:00"]'
+        assert encoder.encode([brt, utc]) == '["2023-01-01T09:00:00.000-03:00", "2023-01-01T12:00:00.000Z"]'
+
+    def test_cached_encoders_reuse_repeated_values(self):
+        encoders = cached_temporal_encoders()
+        encoder = JSONEncoderStar(typed_encoders=encoders)
+
+        encoder.encode([date(2022, 1, 1)] * 3)
+
+        assert encoders[date].cache_info().hits == 2
+
+    def test_datetime_subclasses_are_not_cached(self):
+        class Timestamp(datetime):
+            pass
+
+        encoders = cached_temporal_encoders()
+
+        assert encoders[datetime](Timestamp(2023, 1, 1, 13, 45, 30, 643768)) == "2023-01-01T13:45:30.643"
+        assert encoders[datetime].cache_info().currsize == 0
+
+
 class TestDateEncoder:
     def test_encode_date_as_iso_string(self):
         assert encode(date(2022, 1, 1)) == "2022-01-01"
@@ -115,18 +177,7 @@ class TestFrozensetEncoder:
 @freeze_time("2024-01-01")
 class TestDjangoModelEncoder:
     @pytest.fixture(autouse=True, scope="class")
-    def user(self):
-        import django
-        from django.conf import settings
-
-        settings.configure(
-            INSTALLED_APPS=[
-                "django.contrib.auth",
-                "django.contrib.contenttypes",
-            ]
-        )
-        django.setup()
-
+    def user(self, django_db):
         from django.contrib.auth.models import User
 
         return User
@@ -145,6 +196,13 @@ class TestDjangoModelEncoder:
             '"date_joined": "2024-01-01T00:00:00.000", "groups": [], "user_permissions": []}'
         )
 
+    def test_django_model_encoder_handles_lazy_objects(self, user):
+        from django.utils.functional import SimpleLazyObject
+
+        lazy = SimpleLazyObject(lambda: user(username="testuser", password="testpass"))
+
+        assert encode(lazy) == encode(user(username="testuser", password="testpass"))
+
     def test_django_model_encoder_handles_model_with_null_fields(self, user):
         assert encode(user(username=None, password=None)) == (
             '{"id": null, "password": null, "last_login": null, "is_superuser": false, "username": null, '
@@ -179,6 +237,10 @@ class TestAttrsFunctionalEncoders:
 
         assert encode(AttrsClass(x=5)) == '{"x": 5}'
 
+    def test_attrs_dict_rejects_other_objects(self):
+        with pytest.raises(attrs.exceptions.NotAnAttrsClassError):
+            attrs_dict(object())
+
 
 class TestDataclassFunctionalEncoders:
     def test_dataclass_functional_encoder(self):
@@ -187,3 +249,115 @@ class TestDataclassFunctionalEncoders:
             x: int
 
         assert encode(DataclassClass(x=5)) == '{"x": 5}'
+
+
+@dataclasses.dataclass
+class Leaf:
+    when: date
+
+
+@dataclasses.dataclass
+class Node:
+    name: str
+    leaves: list
+
+
+@attrs.define
+class AttrsNode:
+    name: str
+    leaf: object
+
+
+class PydanticLeaf(BaseModel):
+    when: date
+
+
+class PydanticNode(BaseModel):
+    name: str
+    leaves: list[PydanticLeaf]
+
+
+class PydanticTotal(BaseModel):
+    leaves: list[PydanticLeaf]
+
+    @computed_field
+    @property
+    def count(self) -> int:
+        return len(self.leaves)
+
+
+class PydanticRenamed(BaseModel):
+    model_config = ConfigDict(serialize_by_alias=True)
+
+    name: str = Field(serialization_alias="label")
+    secret: str = Field(exclude=True)
+
+    @field_serializer("name")
+    def shout(self, name):
+        return name.upper()
+
+
+class PydanticWrapped(BaseModel):
+    leaf: PydanticLeaf
+
+    @model_serializer
+    def wrap(self):
+        return {"wrapped": self.leaf.when}
+
+
+class TestShallowEncoders:
+    def test_dataclass_shallow_dict_keeps_nested_objects(self):
+        leaves = [Leaf(date(2024, 1, 1))]
+        d = dataclasses_shallow_dict(Node("root", leaves))
+
+        assert d == {"name": "root", "leaves": leaves}
+        assert d["leaves"] is leaves
+
+    def test_attrs_shallow_dict_keeps_nested_objects(self):
+        leaf = Leaf(date(2024, 1, 1))
+
+        assert attrs_shallow_dict(AttrsNode("root", leaf))["leaf"] is leaf
+
+    def test_shallow_dict_rejects_other_objects(self):
+        with pytest.raises(TypeError):
+            dataclasses_shallow_dict(object())
+
+        with pytest.raises(attrs.exceptions.NotAnAttrsClassError):
+            attrs_shallow_dict(object())
+
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            Node("root", [Leaf(date(2024, 1, 1)), Leaf(date(2024, 1, 2))]),
+            AttrsNode("root", Leaf(date(2024, 1, 1))),
+            PydanticNode(name="root", leaves=[PydanticLeaf(when=date(2024, 1, 1))]),
+            PydanticTotal(leaves=[PydanticLeaf(when=date(2024, 1, 1))]),
+            PydanticRenamed(name="root", secret="hidden"),
+            PydanticWrapped(leaf=PydanticLeaf(when=date(2024, 1, 1))),
+        ],
+    )
+    def test_shallow_encoder_output_matches_deep_encoder(self, obj):
+        assert ShallowJSONEncoderStar().encode(obj) == JSONEncoderStar().encode(obj)
+
+    def test_shallow_encoder_uses_typed_encoders_of_nested_objects(self):
+        encoder = ShallowJSONEncoderStar(typed_encoders={Leaf: lambda o: "leaf"})
+
+        assert encoder.encode(Node("root", [Leaf(date(2024, 1, 1))])) == '{"name": "root", "leaves": ["leaf"]}'
+
+
+class TestProxies:
+    """Lazy proxies, like Django's request.user, report the class of the object they stand for."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (datetime(2024, 1, 2, 3, 4, 5, tzinfo=dt_timezone.utc), '"2024-01-02T03:04:05.000Z"'),
+            (uuid.UUID(int=1), '"00000000-0000-0000-0000-000000000001"'),
+            (date(2024, 1, 2), '"2024-01-02"'),
+        ],
+    )
+    def test_proxies_are_encoded_as_the_object_they_stand_for(self, value, expected):
+        from django.utils.functional import SimpleLazyObject
+
+        assert JSONEncoderStar().encode(SimpleLazyObject(lambda: value)) == expected
+        assert JSONEncoderStar().encode(SimpleLazyObject(lambda: value)) == JSONEncoderStar().encode(value)
@@ -0,0 +1,92 @@
+import datetime
+import io
+from functools import partial
+
+import pytest
+from freezegun import freeze_time
+
+import jsonstar
+from jsonstar import JSONEncoderStar
+from jsonstar.default_encoders import django_queryset_rows
+from jsonstar.lazy_types import DJANGO_QUERYSET
+
+
+@pytest.fixture(scope="module")
+def models(django_db):
+    from django.contrib.auth.models import Group, Permission, User
+
+    with freeze_time("2024-01-01"):
+        group = Group.objects.create(name="staff")
+        for i in range(5):
+            user = User.objects.create(username=f"user{i}", email=f"user{i}@example.com")
+            user.groups.add(group)
+
+    return User, Permission
+
+
+class TestQuerySetEncoder:
+    def test_querysets_encode_their_rows_without_many_to_many_fields(self, models):
+        from django.forms.models import model_to_dict
+
+        User, _ = models
+        users = User.objects.order_by("id")
+        expected = [model_to_dict(user, exclude=["groups", "user_permissions"]) for user in users]
+
+        assert jsonstar.loads(jsonstar.dumps(users)) == jsonstar.loads(jsonstar.dumps(expected))
+
+    def test_rows_are_read_in_a_single_query(self, models):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        User, _ = models
+        with CaptureQueriesContext(connection) as queries:
+            rows = jsonstar.loads(jsonstar.dumps(User.objects.order_by("id")))
+
+        assert len(queries) == 1
+        assert [row["username"] for row in rows] == [f"user{i}" for i in range(5)]
+        assert rows[0]["date_joined"] == datetime.datetime(2024, 1, 1)
+
+    def test_foreign_keys_are_encoded_as_their_ids(self, models):
+        _, Permission = models
+        permission = Permission.objects.order_by("id").first()
+
+        assert jsonstar.loads(jsonstar.dumps(Permission.objects.order_by("id")))[0] == {
+            "id": permission.id,
+            "name": permission.name,
+            "content_type": permission.content_type_id,
+            "codename": permission.codename,
+        }
+
+    def test_values_querysets_are_encoded_as_they_are(self, models):
+        User, _ = models
+        users = User.objects.order_by("id")[:2]
+
+        assert jsonstar.dumps(users.values("username")) == '[{"username": "user0"}, {"username": "user1"}]'
+        assert jsonstar.dumps(users.values_list("username", flat=True)) == '["user0", "user1"]'
+
+    def test_dump_streams_querysets(self, models):
+        User, _ = models
+        users = User.objects.order_by("id")
+        fp = io.StringIO()
+
+        jsonstar.dump({"users": users}, fp, buffer_size=1)
+
+        assert fp.getvalue() == jsonstar.dumps({"users": users})
+        assert list(JSONEncoderStar().iterencode(User.objects.none())) == ["[]"]
+
+    def test_chunk_size_is_configurable(self, models):
+        User, _ = models
+        users = User.objects.order_by("id")
+        encoder = JSONEncoderStar(typed_encoders={DJANGO_QUERYSET: partial(django_queryset_rows, chunk_size=2)})
+
+        assert encoder.encode(users) == jsonstar.dumps(users)
+
+
+class TestModelEncoder:
+    def test_saved_models_match_model_to_dict(self, models):
+        from django.forms.models import model_to_dict
+
+        User, _ = models
+        user = User.objects.order_by("id").first()
+
+        assert jsonstar.dumps(user) == jsonstar.dumps(model_to_dict(user))
@@ -1,8 +1,12 @@
+import dataclasses
+from datetime import date
+from decimal import Decimal
 from unittest.mock import Mock
 
 import pytest
 
-from jsonstar.encoder import JSONEncoderStar
+from jsonstar.encoder import JSONEncoderStar, TypedEncoderRegistry, value_dependent
+from jsonstar.fragments import FragmentCache
 
 
 class CustomType:
@@ -134,3 +138,256 @@ class TestRegistrationOnInit:
         encoder.register(lambda o: "CustomType encoder override", CustomType)
 
         assert encoder.encode(CustomType()) == '"CustomType encoder override"'
+
+
+class TestTypedDispatch:
+    def test_typed_encoder_is_resolved_once_per_type(self, encoder, monkeypatch):
+        encoder.register(lambda o: "CustomType encoder", CustomType)
+        resolve = Mock(wraps=encoder._resolve_typed_encoder)
+        monkeypatch.setattr(encoder, "_resolve_typed_encoder", resolve)
+
+        assert encoder.encode([CustomType(), CustomType()]) == '["CustomType encoder", "CustomType encoder"]'
+        assert resolve.call_count == 1
+
+    def test_register_invalidates_resolved_types(self, encoder):
+        encoder.register(lambda o: "CustomType encoder", CustomType)
+        assert encoder.encode(CustomType()) == '"CustomType encoder"'
+
+        encoder.register(lambda o: "CustomType encoder override", CustomType)
+        assert encoder.encode(CustomType()) == '"CustomType encoder override"'
+
+    def test_register_default_encoder_invalidates_resolved_types_of_subclasses(self):
+        class SubEncoder(JSONEncoderTest):
+            pass
+
+        encoder = SubEncoder()
+        JSONEncoderTest.register_default_encoder(lambda o: "CustomType encoder", CustomType)
+        assert encoder.encode(CustomType()) == '"CustomType encoder"'
+
+        JSONEncoderTest.register_default_encoder(lambda o: "CustomType encoder override", CustomType)
+        assert encoder.encode(CustomType()) == '"CustomType encoder override"'
+
+    def test_instance_encoders_do_not_leak_into_class_dispatch(self, encoder):
+        encoder.register(lambda o: "CustomType encoder", CustomType)
+
+        assert encoder.encode(CustomType()) == '"CustomType encoder"'
+        with pytest.raises(TypeError):
+            JSONEncoderTest().encode(CustomType())
+
+
+class TestFunctionalDispatch:
+    def test_failing_functional_encoder_is_skipped_for_the_same_type(self, encoder):
+        encoder.register(failing_functional_encoder := Mock(side_effect=Exception))
+        encoder.register(lambda o: "Functional encoder")
+
+        assert encoder.encode([CustomType(), CustomType()]) == '["Functional encoder", "Functional encoder"]'
+        assert failing_functional_encoder.call_count == 1
+
+    def test_failing_functional_encoder_is_tried_for_other_types(self, encoder):
+        class OtherType:
+            pass
+
+        encoder.register(failing_functional_encoder := Mock(side_effect=Exception))
+        encoder.register(lambda o: "Functional encoder")
+
+        assert encoder.encode([CustomType(), OtherType()]) == '["Functional encoder", "Functional encoder"]'
+        assert failing_functional_encoder.call_count == 2
+
+    def test_value_dependent_functional_encoder_is_always_tried(self, encoder):
+        @value_dependent
+        def only_marked(o):
+            if not getattr(o, "marked", False):
+                raise ValueError
+            return "Value dependent encoder"
+
+        encoder.register(only_marked)
+        encoder.register(lambda o: "Functional encoder")
+        marked = CustomType()
+        marked.marked = True
+
+        assert encoder.encode([CustomType(), marked, CustomType()]) == (
+            '["Functional encoder", "Value dependent encoder", "Functional encoder"]'
+        )
+
+    def test_types_without_functional_encoder_keep_raising(self, encoder):
+        encoder.register(Mock(side_effect=Exception))
+
+        for _ in range(2):
+            with pytest.raises(TypeError):
+                encoder.encode(CustomType())
+
+    def test_register_functional_encoder_invalidates_remembered_failures(self, encoder):
+        with pytest.raises(TypeError):
+            encoder.encode(CustomType())
+
+        encoder.register(lambda o: "Functional encoder")
+
+        assert encoder.encode(CustomType()) == '"Functional encoder"'
+
+
+class TestConfiguredEncoders:
+    def test_same_configuration_shares_the_instance(self):
+        assert JSONEncoderTest.configured(indent=2) is JSONEncoderTest.configured(indent=2)
+        assert JSONEncoderTest.configured(indent=2) is not JSONEncoderTest.configured(indent=4)
+
+    def test_encoder_sets_are_part_of_the_configuration(self):
+        def encode_custom_type(o):
+            return "CustomType encoder"
+
+        a = JSONEncoderTest.configured(typed_encoders={CustomType: encode_custom_type})
+        b = JSONEncoderTest.configured(typed_encoders={CustomType: encode_custom_type})
+
+        assert a is b
+        assert a is not JSONEncoderTest.configured(functional_encoders=[encode_custom_type])
+        assert a.encode(CustomType()) == '"CustomType encoder"'
+
+    def test_unhashable_configuration_builds_new_instances(self):
+        assert JSONEncoderTest.configured(default=[{}]) is not JSONEncoderTest.configured(default=[{}])
+
+    def test_register_default_encoder_discards_configured_instances(self):
+        class SubEncoder(JSONEncoderTest):
+            pass
+
+        encoder = SubEncoder.configured()
+        JSONEncoderTest.register_default_encoder(lambda o: "CustomType encoder", CustomType)
+
+        assert SubEncoder.configured() is not encoder
+        assert SubEncoder.configured().encode(CustomType()) == '"CustomType encoder"'
+
+    def test_module_dumps_reuses_configured_instances(self, monkeypatch):
+        import jsonstar
+
+        configured = Mock(wraps=JSONEncoderTest.configured)
+        monkeypatch.setattr(JSONEncoderTest, "configured", configured)
+
+        assert jsonstar.dumps([1], cls=JSONEncoderTest, indent=None) == "[1]"
+        configured.assert_called_once_with(indent=None)
+
+
+class TestTypedEncoderRegistry:
+    def test_subclasses_come_before_their_bases_whatever_the_registration_order(self):
+        class Base:
+            pass
+
+        class Child(Base):
+            pass
+
+        class GrandChild(Child):
+            pass
+
+        registry = TypedEncoderRegistry({Base: 1, GrandChild: 3})
+        registry[Child] = 2
+
+        assert list(registry) == [GrandChild, Child, Base]
+        assert registry.items() == [(GrandChild, 3), (Child, 2), (Base, 1)]
+
+    def test_latest_registered_comes_first_among_types_as_deep(self):
+        registry = TypedEncoderRegistry()
+        registry.update({int: 1, str: 2, CustomType: 3})
+
+        assert list(registry) == [CustomType, str, int]
+
+    def test_frozen_registry_can_not_change(self):
+        registry = TypedEncoderRegistry({CustomType: str}).freeze()
+
+        with pytest.raises(TypeError):
+            registry[int] = str
+
+        with pytest.raises(TypeError):
+            registry.update({int: str})
+
+        with pytest.raises(TypeError):
+            registry |= {int: str}
+
+        assert int not in registry
+        assert registry.copy().frozen is False
+
+    def test_merging_in_place_orders_again(self):
+        registry = TypedEncoderRegistry({int: 1})
+        assert list(registry) == [int]
+
+        registry |= {CustomType: 2}
+
+        assert list(registry) == [CustomType, int]
+
+    def test_frozen_registry_is_shared_by_instances(self):
+        registry = TypedEncoderRegistry({CustomType: lambda o: "shared"}).freeze()
+
+        first = JSONEncoderTest(typed_encoders=registry)
+        second = JSONEncoderTest(typed_encoders=registry)
+
+        assert first._typed_encoders is second._typed_encoders is registry
+        assert first.encode(CustomType()) == '"shared"'
+
+    def test_registering_on_an_instance_copies_a_frozen_registry(self):
+        registry = TypedEncoderRegistry({CustomType: lambda o: "shared"}).freeze()
+        encoder = JSONEncoderTest(typed_encoders=registry)
+
+        encoder.register(lambda o: "own", CustomType)
+
+        assert encoder.encode(CustomType()) == '"own"'
+        assert JSONEncoderTest(typed_encoders=registry).encode(CustomType()) == '"shared"'
+
+    def test_register_default_encoders_in_bulk(self):
+        class Other:
+            pass
+
+        JSONEncoderTest.register_default_encoders({CustomType: lambda o: "custom", Other: lambda o: "other"})
+
+        assert JSONEncoderTest().encode([CustomType(), Other()]) == '["custom", "other"]'
+
+
+class TestDefaultArgument:
+    @pytest.mark.parametrize("kwargs", [{}, {"decimals_as_numbers": True}, {"fragment_cache": FragmentCache()}])
+    def test_default_argument_is_used_by_every_encoder(self, kwargs):
+        encoder = JSONEncoderStar(default=lambda o: "custom", **kwargs)
+
+        assert encoder.encode([CustomType()]) == '["custom"]'
+
+    @pytest.mark.parametrize("kwargs", [{}, {"decimals_as_numbers": True}, {"fragment_cache": FragmentCache()}])
+    def test_default_method_of_subclasses_is_used_by_every_encoder(self, kwargs):
+        class Encoder(JSONEncoderStar):
+            def default(self, o):
+                if isinstance(o, CustomType):
+                    return "custom"
+                return super().default(o)
+
+        assert Encoder(**kwargs).encode([CustomType(), date(2024, 1, 1)]) == '["custom", "2024-01-01"]'
+
+
+class TestDecimalsAsNumbers:
+    def test_decimals_are_written_as_numbers_with_their_digits(self):
+        encoder = JSONEncoderStar(decimals_as_numbers=True)
+
+        assert (
+            encoder.encode([Decimal("1.10"), Decimal("-0E-8"), Decimal("1E+100"), 1.5]) == "[1.10, -0E-8, 1E+100, 1.5]"
+        )
+        assert encoder.encode(Decimal("7")) == "7"
+        assert encoder.encode({Decimal("2.5"): Decimal("0.1")}) == '{"2.5": 0.1}'
+
+    def test_decimals_are_strings_by_default(self):
+        assert JSONEncoderStar().encode([Decimal("1.10")]) == '["1.10"]'
+
+    def test_non_finite_decimals_follow_allow_nan(self):
+        values = [Decimal("NaN"), Decimal("Infinity"), Decimal("-Infinity")]
+
+        assert JSONEncoderStar(decimals_as_numbers=True).encode(values) == "[NaN, Infinity, -Infinity]"
+
+        with pytest.raises(ValueError):
+            JSONEncoderStar(decimals_as_numbers=True, allow_nan=False).encode(values)
+
+    def test_streaming_and_indent(self):
+        encoder = JSONEncoderStar(decimals_as_numbers=True, indent=1)
+
+        assert "".join(encoder.iterencode({"a": iter([Decimal("1.0")])})) == '{\n "a": [\n  1.0\n ]\n}'
+
+    def test_compiled_serializers_leave_decimals_as_numbers(self):
+        @dataclasses.dataclass
+        class Amount:
+            value: Decimal
+
+        class CompiledEncoder(JSONEncoderStar):
+            compile_serializers = True
+
+        assert CompiledEncoder(decimals_as_numbers=True).encode(Amount(Decimal("3.14"))) == '{"value": 3.14}'
+        assert CompiledEncoder().encode(Amount(Decimal("3.14"))) == '{"value": "3.14"}'
@@ -0,0 +1,221 @@
+import dataclasses
+import pickle
+from decimal import Decimal
+
+import attrs
+import pytest
+from pydantic import BaseModel, ConfigDict
+
+import jsonstar
+from jsonstar import FragmentCache, JSONEncoderStar, ShallowJSONEncoderStar
+from jsonstar.fragments import is_frozen
+
+
+@dataclasses.dataclass(frozen=True)
+class Currency:
+    code: str
+    name: str
+    rate: Decimal
+
+
+@dataclasses.dataclass(frozen=True)
+class Country:
+    code: str
+    currency: Currency
+
+
+@dataclasses.dataclass
+class Mutable:
+    code: str
+
+
+@dataclasses.dataclass(frozen=True)
+class Unhashable:
+    codes: list
+
+
+@attrs.frozen
+class AttrsFrozen:
+    code: str
+
+
+class PydanticFrozen(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    code: str
+
+
+class PydanticMutable(BaseModel):
+    code: str
+
+
+class Reference:
+    def __init__(self, code):
+        self.code = code
+
+    def __eq__(self, other):
+        return isinstance(other, Reference) and other.code == self.code
+
+    def __hash__(self):
+        return hash(self.code)
+
+
+@dataclasses.dataclass(frozen=True)
+class Money:
+    amount: Decimal
+    flag: object
+
+
+@dataclasses.dataclass(frozen=True)
+class Named:
+    id: int
+    name: str = dataclasses.field(compare=False)
+
+
+BRL = Currency("BRL", "Real", Decimal("5.10"))
+BRAZIL = Country("BR", BRL)
+
+
+class TestFragmentCache:
+    @pytest.mark.parametrize(
+        "cls, frozen",
+        [
+            (Currency, True),
+            (Mutable, False),
+            (AttrsFrozen, True),
+            (attrs.define(type("AttrsMutable", (), {"__annotations__": {"code": str}})), False),
+            (PydanticFrozen, True),
+            (PydanticMutable, False),
+            (Reference, False),
+            (int, False),
+        ],
+    )
+    def test_is_frozen(self, cls, frozen):
+        assert is_frozen(cls) is frozen
+
+    def test_output_is_the_same_as_without_cache(self):
+        data = {"countries": [BRAZIL, BRAZIL], "currencies": [BRL, Currency("USD", "Dollar", Decimal("1"))]}
+
+        assert jsonstar.dumps(data, fragment_cache=FragmentCache()) == jsonstar.dumps(data)
+
+    def test_repeated_objects_are_encoded_once(self):
+        cache = FragmentCache()
+
+        jsonstar.dumps([BRAZIL, BRAZIL, BRL], fragment_cache=cache)
+        jsonstar.dumps([BRAZIL], fragment_cache=cache)
+
+        assert cache.snapshot() == {"hits": 2, "misses": 2, "size": 2, "maxsize": 1024}
+
+    def test_equal_objects_get_their_own_fragment(self):
+        cache = FragmentCache()
+
+        jsonstar.dumps([BRL, Currency("BRL", "Real", Decimal("5.10"))], fragment_cache=cache)
+
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_equal_objects_written_differently_keep_their_output(self):
+        cache = FragmentCache(types=[Decimal])
+        values = [
+            Money(Decimal("1.10"), 1),
+            Money(Decimal("1.1"), True),
+            Money(Decimal("1.100"), 1.0),
+            Decimal("2.0"),
+            Decimal("2.00"),
+            Named(1, "first"),
+            Named(1, "second"),
+        ]
+
+        assert jsonstar.dumps(values, fragment_cache=cache) == jsonstar.dumps(values)
+        assert jsonstar.dumps(values, fragment_cache=cache) == jsonstar.dumps(values)
+        assert cache.hits == len(values)
+
+    def test_least_recently_used_are_discarded(self):
+        cache = FragmentCache(maxsize=2)
+        currencies = [Currency(code, code, Decimal(1)) for code in ("A", "B", "C")]
+
+        jsonstar.dumps(
+            [currencies[0], currencies[1], currencies[0], currencies[2], currencies[0]], fragment_cache=cache
+        )
+
+        assert len(cache) == 2
+        assert (cache.hits, cache.misses) == (2, 3)
+        jsonstar.dumps(currencies[1], fragment_cache=cache)
+        assert cache.misses == 4
+
+    @pytest.mark.parametrize("value", [AttrsFrozen("a"), PydanticFrozen(code="a")])
+    def test_frozen_attrs_and_pydantic_are_cached(self, value):
+        cache = FragmentCache()
+
+        assert jsonstar.dumps([value, value], fragment_cache=cache) == jsonstar.dumps([value, value])
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_registered_types_are_cached(self):
+        cache = FragmentCache(types=[Decimal])
+        cache.register(Reference)
+        encoder = JSONEncoderStar(fragment_cache=cache, typed_encoders={Reference: lambda o: {"code": o.code}})
+        reference, amount = Reference("x"), Decimal("1.5")
+
+        assert encoder.encode([reference, reference, amount, amount]) == (
+            '[{"code": "x"}, {"code": "x"}, "1.5", "1.5"]'
+        )
+        assert (cache.hits, cache.misses) == (2, 2)
+
+    def test_mutable_and_unhashable_objects_are_not_cached(self):
+        cache = FragmentCache()
+
+        assert jsonstar.dumps([Mutable("a"), Unhashable([1])], fragment_cache=cache) == (
+            '[{"code": "a"}, {"codes": [1]}]'
+        )
+        assert (len(cache), cache.hits) == (0, 0)
+
+    def test_fragments_depend_on_the_encoder_configuration(self):
+        cache = FragmentCache()
+
+        compact = jsonstar.dumps(BRL, fragment_cache=cache, separators=(",", ":"))
+        numbers = jsonstar.dumps(BRL, fragment_cache=cache, decimals_as_numbers=True)
+        custom = JSONEncoderStar(fragment_cache=cache, typed_encoders={Currency: lambda o: o.code}).encode(BRL)
+
+        assert (compact, numbers, custom) == (
+            '{"code":"BRL","name":"Real","rate":"5.10"}',
+            '{"code": "BRL", "name": "Real", "rate": 5.10}',
+            '"BRL"',
+        )
+        assert cache.misses == 3
+
+    def test_indented_output_is_not_cached(self):
+        cache = FragmentCache()
+
+        assert jsonstar.dumps([BRAZIL], fragment_cache=cache, indent=2) == jsonstar.dumps([BRAZIL], indent=2)
+        assert len(cache) == 0
+
+    def test_nested_objects_are_cached_on_their_own_with_shallow_encoder(self):
+        cache = FragmentCache()
+
+        output = jsonstar.dumps([BRAZIL, BRL], cls=ShallowJSONEncoderStar, fragment_cache=cache)
+
+        assert output == jsonstar.dumps([BRAZIL, BRL])
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_streaming_splices_fragments(self):
+        cache = FragmentCache()
+
+        assert "".join(JSONEncoderStar(fragment_cache=cache).iterencode(iter([BRL, BRL]))) == jsonstar.dumps([BRL, BRL])
+        assert cache.hits == 1
+
+    def test_reset_keeps_fragments(self):
+        cache = FragmentCache()
+        jsonstar.dumps([BRL, BRL], fragment_cache=cache)
+
+        cache.reset()
+
+        assert cache.snapshot() == {"hits": 0, "misses": 0, "size": 1, "maxsize": 1024}
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_pickles_as_an_empty_cache(self):
+        cache = FragmentCache(maxsize=10, types=[Reference])
+        jsonstar.dumps(BRL, fragment_cache=cache)
+
+        copy = pickle.loads(pickle.dumps(cache))
+
+        assert (copy.maxsize, len(copy), copy.cacheable(Reference)) == (10, 0, True)
@@ -0,0 +1,108 @@
+import dataclasses
+import json
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+import jsonstar
+from jsonstar import IncrementalDecoder
+
+
+DOCUMENT = '[1, -23.5e2, "a\\"]", {"when": "2024-01-01", "items": [{}, []]}, true, null, [], "ação", -0.1E-2]'
+
+
+def feed_in_chunks(decoder, data, size):
+    values = []
+    for start in range(0, len(data), size):
+        end = start + size
+        values += decoder.feed(data[start:end])
+    return values + decoder.close()
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    when: datetime
+
+
+class TestIncrementalDecoder:
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+    def test_elements_match_loads_whatever_the_chunk_size(self, size):
+        decoder = IncrementalDecoder()
+
+        assert feed_in_chunks(decoder, DOCUMENT.encode(), size) == jsonstar.loads(DOCUMENT)
+
+    def test_elements_are_returned_as_soon_as_they_are_complete(self):
+        decoder = IncrementalDecoder()
+
+        assert decoder.feed(b'[{"a": 1}, {"b"') == [{"a": 1}]
+        assert decoder.feed(b": 2}, 3") == [{"b": 2}]
+        assert decoder.feed(b"4") == []
+        assert decoder.feed(b"]") == [34]
+        assert decoder.close() == []
+
+    def test_strings_are_returned_as_soon_as_they_are_complete(self):
+        decoder = IncrementalDecoder()
+
+        assert decoder.feed(b'["a\\"') == []
+        assert decoder.feed(b'", "b') == ['a"']
+        assert decoder.feed(b'"]') == ["b"]
+
+    def test_each_element_is_parsed_once(self):
+        data = '[{"a": ["]", "\\\\", "\\"}"], "b": {"c": "[{"}}, ["x\\\\"], "y"]'.encode()
+        decoder = IncrementalDecoder()
+
+        with patch.object(decoder.decoder, "raw_decode", wraps=decoder.decoder.raw_decode) as raw_decode:
+            values = feed_in_chunks(decoder, data, 1)
+
+        assert values == json.loads(data)
+        assert raw_decode.call_count == len(values)
+
+    def test_other_top_level_values_are_returned_whole(self):
+        assert feed_in_chunks(IncrementalDecoder(), b' {"a": [1, 2]} ', 2) == [{"a": [1, 2]}]
+        assert feed_in_chunks(IncrementalDecoder(), b"12", 1) == [12]
+
+    def test_hook_converts_each_object(self):
+        assert feed_in_chunks(IncrementalDecoder(), b'[{"when": "2024-01-01"}]', 4) == [{"when": datetime(2024, 1, 1)}]
+
+    def test_schema_describes_each_element(self):
+        data = b'[{"x": 1, "when": "2024-01-01"}, {"x": 2, "when": "2024-01-02"}]'
+
+        assert feed_in_chunks(IncrementalDecoder(schema=Point), data, 5) == [
+            Point(1, datetime(2024, 1, 1)),
+            Point(2, datetime(2024, 1, 2)),
+        ]
+
+    def test_decoder_options_are_passed_on(self):
+        assert feed_in_chunks(IncrementalDecoder(decimals_as_numbers=True), b"[1.10]", 1) == [Decimal("1.10")]
+
+    @pytest.mark.parametrize("data", ["[1 2]", "[1,]", "[", '{"a":', "[1] x", "", "x", "[1,,2]"])
+    def test_invalid_documents(self, data):
+        with pytest.raises(json.JSONDecodeError):
+            feed_in_chunks(IncrementalDecoder(), data.encode(), 1)
+
+
+class TestIterload:
+    @pytest.fixture
+    def path(self, tmp_path):
+        path = tmp_path / "array.json"
+        path.write_text(DOCUMENT, encoding="utf-8")
+        return path
+
+    @pytest.mark.parametrize("mode", ["r", "rb"])
+    def test_iterload_file(self, path, mode):
+        with open(path, mode) as fp:
+            assert list(jsonstar.iterload(fp, buffer_size=3)) == jsonstar.loads(DOCUMENT)
+
+    def test_iterload_memory_map(self, path):
+        with open(path, "rb") as fp:
+            assert list(jsonstar.iterload(fp, buffer_size=3, memory_map=True)) == jsonstar.loads(DOCUMENT)
+
+    def test_iterload_memory_map_of_empty_file(self, tmp_path):
+        path = tmp_path / "empty.json"
+        path.write_bytes(b"")
+
+        with open(path, "rb") as fp, pytest.raises(json.JSONDecodeError):
+            list(jsonstar.iterload(fp, memory_map=True))
@@ -0,0 +1,73 @@
+import pickle
+import subprocess
+import sys
+
+import attrs
+import pytest
+from django.db import models
+from pydantic import BaseModel
+
+import jsonstar
+from jsonstar.lazy_types import DJANGO_MODEL, PYDANTIC_MODEL, attrs_fields, is_attrs_class, lazy_type
+
+
+class Model(BaseModel):
+    name: str = "jsonstar"
+
+
+@attrs.define
+class AttrsClass:
+    name: str = "jsonstar"
+
+
+class TestLazyTypes:
+    def test_importing_jsonstar_does_not_import_optional_integrations(self):
+        code = "import sys, jsonstar; print(sorted({'attrs', 'django', 'pydantic'} & set(sys.modules)))"
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+        assert output.strip() == "[]"
+
+    def test_encoding_other_objects_does_not_import_attrs(self):
+        code = (
+            "import sys, jsonstar\n"
+            "try:\n    jsonstar.dumps(object())\nexcept TypeError:\n    pass\n"
+            "print(sorted({'attr', 'attrs'} & set(sys.modules)))"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+        assert output.strip() == "[]"
+
+    @pytest.mark.parametrize(
+        "lazy, matching",
+        [
+            (DJANGO_MODEL, models.Model),
+            (PYDANTIC_MODEL, Model),
+            (PYDANTIC_MODEL, BaseModel),
+        ],
+    )
+    def test_lazy_type_matches_subclasses_by_qualified_name(self, lazy, matching):
+        assert issubclass(matching, lazy)
+        assert not issubclass(object, lazy)
+        assert not isinstance(object(), lazy)
+
+    def test_lazy_type_is_unique_per_name_even_pickled(self):
+        assert lazy_type("pydantic.main.BaseModel") is PYDANTIC_MODEL
+        assert pickle.loads(pickle.dumps(PYDANTIC_MODEL)) is PYDANTIC_MODEL
+
+    def test_attrs_classes_are_detected_without_attrs(self):
+        assert is_attrs_class(AttrsClass)
+        assert not is_attrs_class(Model)
+        assert attrs_fields(AttrsClass) == attrs.fields(AttrsClass)
+
+        with pytest.raises(attrs.exceptions.NotAnAttrsClassError):
+            attrs_fields(Model)
+
+    def test_registering_the_real_class_overrides_the_lazy_default(self):
+        class Encoder(jsonstar.JSONEncoderStar):
+            pass
+
+        Encoder.register_default_encoder(lambda o: "class", BaseModel)
+
+        assert jsonstar.dumps(Model()) == '{"name": "jsonstar"}'
+        assert jsonstar.dumps(Model(), cls=Encoder) == '"class"'
+        assert jsonstar.dumps(Model(), typed_encoders={BaseModel: lambda o: "instance"}) == '"instance"'
@@ -0,0 +1,60 @@
+import io
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+import jsonstar
+
+
+RECORDS = [{"id": 1, "price": Decimal("9.99")}, {"id": 2, "tags": {"a"}}, [], "text"]
+LINES = '{"id": 1, "price": "9.99"}\n{"id": 2, "tags": ["a"]}\n[]\n"text"\n'
+
+
+class TestDumpLines:
+    def test_dumps_lines(self):
+        assert jsonstar.dumps_lines(RECORDS) == LINES
+
+    def test_dumps_lines_accepts_generators(self):
+        assert jsonstar.dumps_lines(record for record in RECORDS) == LINES
+
+    def test_dump_lines(self):
+        fp = io.StringIO()
+
+        jsonstar.dump_lines(iter(RECORDS), fp, buffer_size=8)
+
+        assert fp.getvalue() == LINES
+
+    def test_dumps_lines_forwards_encoder_options(self):
+        assert jsonstar.dumps_lines([{"b": 1, "a": 2}], sort_keys=True, separators=(",", ":")) == '{"a":2,"b":1}\n'
+
+    def test_lines_can_not_be_indented(self):
+        with pytest.raises(ValueError):
+            jsonstar.dumps_lines(RECORDS, indent=2)
+
+
+class TestLoadLines:
+    def test_load_lines(self):
+        assert list(jsonstar.load_lines(io.StringIO(LINES))) == [
+            {"id": 1, "price": "9.99"},
+            {"id": 2, "tags": ["a"]},
+            [],
+            "text",
+        ]
+
+    def test_load_lines_from_binary_files_skipping_blank_lines(self):
+        fp = io.BytesIO(b'{"at": "2024-01-01"}\n\n{"at": null}')
+
+        assert list(jsonstar.load_lines(fp)) == [{"at": datetime(2024, 1, 1)}, {"at": None}]
+
+    def test_load_lines_is_lazy(self):
+        records = jsonstar.load_lines(io.StringIO('{"id": 1}\ninvalid\n'), buffer_size=1)
+
+        assert next(records) == {"id": 1}
+        with pytest.raises(ValueError):
+            next(records)
+
+    def test_load_lines_forwards_decoder_options(self):
+        fp = io.StringIO('{"price": "9.99"}\n')
+
+        assert list(jsonstar.load_lines(fp, schema={"price": Decimal})) == [{"price": Decimal("9.99")}]
@@ -0,0 +1,141 @@
+import enum
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Annotated, Literal, Optional
+
+import pytest
+from pydantic import BaseModel, ConfigDict, PlainSerializer, computed_field, field_serializer
+
+import jsonstar
+from jsonstar import FragmentCache, JSONEncoderStar, ShallowJSONEncoderStar
+
+
+COMPACT = {"separators": (",", ":"), "ensure_ascii": False}
+
+
+class Color(str, enum.Enum):
+    RED = "red"
+
+
+class Level(enum.IntEnum):
+    HIGH = 1
+
+
+class Tag(BaseModel):
+    name: str
+    color: Color = Color.RED
+
+
+class Product(BaseModel):
+    id: uuid.UUID
+    name: str
+    price: Decimal
+    released: date
+    level: Level = Level.HIGH
+    kind: Literal["book", "game"] = "book"
+    tags: list[Tag] = []
+    attributes: dict[str, Optional[int]] = {}
+    parent: Optional["Product"] = None
+
+    @computed_field
+    @property
+    def label(self) -> str:
+        return self.name.upper()
+
+
+class Event(BaseModel):
+    at: datetime
+
+
+class Measure(BaseModel):
+    value: float
+
+
+class Custom(BaseModel):
+    name: str
+
+    @field_serializer("name")
+    def serialize_name(self, name):
+        return name.upper()
+
+
+class Annotated_(BaseModel):
+    value: Annotated[int, PlainSerializer(str)]
+
+
+class Extra(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    name: str
+
+
+PRODUCT = Product(
+    id=uuid.UUID(int=1),
+    name='Ação "livro" \n',
+    price=Decimal("10.50"),
+    released=date(2024, 1, 1),
+    tags=[Tag(name="new")],
+    attributes={"pages": 100, "weight": None},
+    parent=Product(id=uuid.UUID(int=2), name="Série", price=Decimal("1E+2"), released=date(2023, 1, 1)),
+)
+
+
+class TestNativeSerializer:
+    def test_compatible_models_are_written_natively(self):
+        encoder = JSONEncoderStar(**COMPACT)
+
+        assert encoder.native_serializer_for(Product) is not None
+        assert encoder.native_serializer_for(Tag) is not None
+
+    @pytest.mark.parametrize("model", [Event, Measure, Custom, Annotated_, Extra])
+    def test_models_written_differently_are_not(self, model):
+        assert JSONEncoderStar(**COMPACT).native_serializer_for(model) is None
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{}, {"separators": (",", ":")}, {**COMPACT, "sort_keys": True}, {**COMPACT, "indent": 2}],
+    )
+    def test_other_output_formats_are_not(self, kwargs):
+        assert JSONEncoderStar(**kwargs).native_serializer_for(Product) is None
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"typed_encoders": {Decimal: lambda o: str(o.quantize(Decimal("1.0")))}},
+            {"typed_encoders": {Tag: lambda o: o.name}},
+            {"decimals_as_numbers": True},
+        ],
+    )
+    def test_typed_encoders_of_their_fields_win(self, kwargs):
+        assert JSONEncoderStar(**COMPACT, **kwargs).native_serializer_for(Product) is None
+
+    def test_can_be_disabled(self):
+        class Encoder(JSONEncoderStar):
+            native_pydantic = False
+
+        assert Encoder(**COMPACT).native_serializer_for(Product) is None
+
+    def test_shallow_encoder_does_not(self):
+        # Its pydantic encoder is not pydantic_dict, whose output the native serializer is checked against.
+        assert ShallowJSONEncoderStar(**COMPACT).native_serializer_for(Product) is None
+
+    @pytest.mark.parametrize("backend", ["orjson", "json"])
+    def test_output_is_the_same(self, backend):
+        data = {"products": [PRODUCT, PRODUCT.parent], "events": [Event(at=datetime(2024, 1, 1))]}
+        expected = jsonstar.dumps(data, **COMPACT).encode()
+
+        assert jsonstar.dumps_bytes(data, backend=backend, **COMPACT) == expected
+        assert jsonstar.dumps_bytes(data, backend=backend, fragment_cache=FragmentCache(), **COMPACT) == expected
+
+    def test_pure_python_encoder_splices_native_output(self):
+        class Encoder(JSONEncoderStar):
+            pass
+
+        encoder = Encoder(fragment_cache=FragmentCache(), **COMPACT)
+        calls = []
+        serializer = encoder.native_serializer_for(Product)
+        encoder._dispatch_table().native[Product] = lambda o: calls.append(o) or serializer(o)
+
+        assert encoder.encode([PRODUCT, Tag(name="x")]) == jsonstar.dumps([PRODUCT, Tag(name="x")], **COMPACT)
+        assert calls == [PRODUCT]
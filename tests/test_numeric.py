@@ -0,0 +1,153 @@
+import array
+import io
+import json
+import math
+from unittest.mock import patch
+
+import pytest
+
+import jsonstar
+from jsonstar import FragmentCache, JSONEncoderStar
+from jsonstar.backends import orjson_options
+from jsonstar.numeric import numbers_json
+
+
+COMPACT = {"separators": (",", ":"), "ensure_ascii": False}
+
+FLOATS = array.array("d", [0.1, -2.5, 1e16, 1e-07, 3.0])
+
+INTS = array.array("q", [0, -1, 2**62, 42])
+
+
+def fragments(obj, **kwargs):
+    """Encode obj with the pure Python encoder, which writes buffers as fragments."""
+    return jsonstar.dumps(obj, fragment_cache=FragmentCache(), **kwargs)
+
+
+class TestEncodeBuffers:
+    @pytest.mark.parametrize("typecode", ["b", "B", "h", "H", "i", "I", "l", "L", "q", "Q", "f", "d"])
+    def test_arrays_are_written_as_their_list(self, typecode):
+        numbers = array.array(typecode, [0, 1, 2, 100])
+
+        assert jsonstar.dumps(numbers) == json.dumps(numbers.tolist())
+        assert fragments(numbers) == json.dumps(numbers.tolist())
+
+    @pytest.mark.parametrize("kwargs", [{}, COMPACT])
+    def test_fragments_follow_the_separators(self, kwargs):
+        obj = {"floats": FLOATS, "ints": memoryview(INTS), "empty": array.array("d")}
+        expected = json.dumps({"floats": FLOATS.tolist(), "ints": INTS.tolist(), "empty": []}, **kwargs)
+
+        assert fragments(obj, **kwargs) == expected
+        assert jsonstar.dumps(obj, decimals_as_numbers=True, **kwargs) == expected
+
+    def test_numbers_are_formatted_in_batches(self):
+        numbers = array.array("d", [i / 7 for i in range(10)])
+
+        with patch("jsonstar.numeric.BATCH_SIZE", 3):
+            assert numbers_json(numbers, ", ", True) == json.dumps(numbers.tolist())
+
+    def test_multidimensional_memoryviews_are_nested_arrays(self):
+        view = memoryview(array.array("d", range(12))).cast("B").cast("d", (2, 3, 2))
+
+        assert fragments(view) == json.dumps(view.tolist())
+        assert jsonstar.dumps(view) == json.dumps(view.tolist())
+
+    def test_non_finite_floats_follow_allow_nan(self):
+        numbers = array.array("d", [1.0, math.nan, math.inf, -math.inf])
+
+        assert fragments(numbers) == "[1.0, NaN, Infinity, -Infinity]"
+        with pytest.raises(ValueError):
+            fragments(numbers, allow_nan=False)
+
+    @pytest.mark.parametrize(
+        "obj",
+        [array.array("u", "ab"), memoryview(INTS)[::2], memoryview(INTS).cast("B")],
+    )
+    def test_other_buffers_are_written_as_their_list(self, obj):
+        assert fragments(obj) == json.dumps(obj.tolist())
+
+    def test_typed_encoders_win(self):
+        encoder = JSONEncoderStar(typed_encoders={array.array: sum}, fragment_cache=FragmentCache())
+
+        assert encoder.encode(INTS) == str(sum(INTS))
+
+    def test_orjson_writes_them_too(self):
+        pytest.importorskip("orjson")
+        obj = {"floats": FLOATS[:2], "ints": memoryview(INTS)}
+
+        assert jsonstar.dumps_bytes(obj, backend="orjson", **COMPACT) == jsonstar.dumps(obj, **COMPACT).encode()
+
+
+class TestEncodeNumpy:
+    @pytest.fixture(autouse=True)
+    def numpy(self):
+        return pytest.importorskip("numpy")
+
+    @pytest.mark.parametrize("dtype", ["int8", "uint16", "int64", "float32", "float64"])
+    def test_arrays_are_written_as_their_list(self, numpy, dtype):
+        matrix = (numpy.arange(12).reshape(3, 4) * 7 / 3).astype(dtype)
+
+        assert jsonstar.dumps(matrix) == json.dumps(matrix.tolist())
+        assert fragments(matrix) == json.dumps(matrix.tolist())
+
+    def test_other_arrays_are_written_as_their_list(self, numpy):
+        obj = [numpy.array([True, False]), numpy.arange(6).reshape(2, 3).T, numpy.array(5), numpy.zeros(2, ">f8")]
+
+        assert fragments(obj) == json.dumps([item.tolist() for item in obj])
+
+    def test_scalars_are_written_as_python_numbers(self, numpy):
+        obj = [numpy.int64(3), numpy.float32(0.5), numpy.bool_(True), numpy.uint8(255)]
+
+        assert jsonstar.dumps(obj) == "[3, 0.5, true, 255]"
+
+    def test_orjson_writes_them_natively(self, numpy):
+        orjson = pytest.importorskip("orjson")
+        obj = {"matrix": numpy.arange(6.0).reshape(2, 3), "count": numpy.int64(3)}
+
+        assert orjson_options(JSONEncoderStar(**COMPACT)) & orjson.OPT_SERIALIZE_NUMPY
+        assert jsonstar.dumps_bytes(obj, backend="orjson", **COMPACT) == jsonstar.dumps(obj, **COMPACT).encode()
+
+    def test_orjson_leaves_them_to_their_typed_encoders(self, numpy):
+        orjson = pytest.importorskip("orjson")
+        typed_encoders = {numpy.ndarray: lambda o: o.shape}
+        encoder = JSONEncoderStar(typed_encoders=typed_encoders, **COMPACT)
+
+        assert not orjson_options(encoder) & orjson.OPT_SERIALIZE_NUMPY
+        output = jsonstar.dumps_bytes(numpy.zeros((2, 3)), backend="orjson", typed_encoders=typed_encoders, **COMPACT)
+        assert output == b"[2,3]"
+
+
+class TestDecodeNumericArrays:
+    def test_homogeneous_arrays_are_packed(self):
+        data = '{"ints": [1, 2], "floats": [1.5, 2.0], "matrix": [[1.5], [2.5]], "when": "2024-01-01"}'
+
+        result = jsonstar.loads(data, numeric_arrays=True)
+
+        assert result["ints"] == array.array("q", [1, 2])
+        assert result["floats"] == array.array("d", [1.5, 2.0])
+        assert result["matrix"] == [array.array("d", [1.5]), array.array("d", [2.5])]
+        assert result["when"].year == 2024
+
+    @pytest.mark.parametrize("data", ["[]", "[1, 2.5]", "[1, true]", "[1, null]", '["a"]', f"[{2**64}]", "[[], {}]"])
+    def test_other_arrays_are_kept(self, data):
+        assert jsonstar.loads(data, numeric_arrays=True) == json.loads(data)
+        assert type(jsonstar.loads(data, numeric_arrays=True)) is list
+
+    def test_top_level_arrays_are_packed(self):
+        assert jsonstar.loads("[1.5, 2.5]", numeric_arrays=True) == array.array("d", [1.5, 2.5])
+        assert list(jsonstar.iterload(io.StringIO("[[1, 2], [3]]"), numeric_arrays=True)) == [
+            array.array("q", [1, 2]),
+            array.array("q", [3]),
+        ]
+
+    def test_selected_arrays_are_packed(self):
+        data = '{"rows": [{"values": [1.0, 2.0], "name": "a"}]}'
+
+        assert jsonstar.loads(data, select=["rows[*].values"], numeric_arrays=True) == {
+            "rows": [{"values": array.array("d", [1.0, 2.0])}]
+        }
+
+    def test_packed_arrays_encode_back(self):
+        data = '{"ints": [1, 2], "floats": [[1.5, 2.0]]}'
+
+        assert jsonstar.dumps(jsonstar.loads(data, numeric_arrays=True)) == data
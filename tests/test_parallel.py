@@ -0,0 +1,101 @@
+import io
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+import jsonstar
+from jsonstar import JSONEncoderStar
+
+
+class CustomType:
+    def __init__(self, value):
+        self.value = value
+
+
+class ParallelEncoder(JSONEncoderStar):
+    _default_typed_encoders = {Decimal: float}
+
+
+def encode_custom_type(o):
+    return f"custom {o.value}"
+
+
+RECORDS = [{"id": i, "day": date(2024, 1, 1), "amount": Decimal("1.5")} for i in range(25)]
+
+
+@pytest.fixture(scope="module")
+def process_pool():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+@pytest.fixture(params=["threads", "processes"])
+def executor(request, process_pool):
+    if request.param == "processes":
+        yield process_pool
+    else:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            yield executor
+
+
+class TestDumpsParallel:
+    @pytest.mark.parametrize("chunk_size", [1, 7, 100])
+    def test_output_matches_dumps(self, executor, chunk_size):
+        assert jsonstar.dumps_parallel(RECORDS, executor, chunk_size=chunk_size) == jsonstar.dumps(RECORDS)
+
+    def test_output_keeps_the_order_of_iterables(self, executor):
+        output = jsonstar.dumps_parallel(iter(range(100)), executor, chunk_size=3, max_pending=2)
+
+        assert output == jsonstar.dumps(list(range(100)))
+
+    def test_empty_iterable(self, executor):
+        assert jsonstar.dumps_parallel([], executor) == "[]"
+        assert jsonstar.dumps_parallel([], executor, lines=True) == ""
+
+    def test_separators(self, executor):
+        output = jsonstar.dumps_parallel(RECORDS, executor, chunk_size=4, separators=(",", ":"))
+
+        assert output == jsonstar.dumps(RECORDS, separators=(",", ":"))
+
+    def test_lines(self, executor):
+        assert jsonstar.dumps_parallel(RECORDS, executor, chunk_size=4, lines=True) == jsonstar.dumps_lines(RECORDS)
+
+    def test_class_default_encoders_carry_over(self, executor):
+        output = jsonstar.dumps_parallel(RECORDS, executor, chunk_size=4, cls=ParallelEncoder)
+
+        assert output == jsonstar.dumps(RECORDS, cls=ParallelEncoder)
+        assert '"amount": 1.5' in output
+
+    def test_encoders_registered_after_workers_started_carry_over(self, executor, monkeypatch):
+        jsonstar.dumps_parallel(RECORDS, executor, chunk_size=4, cls=ParallelEncoder)
+        monkeypatch.setattr(ParallelEncoder, "_default_functional_encoders", [])
+        monkeypatch.setattr(ParallelEncoder, "_default_typed_encoders", ParallelEncoder._default_typed_encoders.copy())
+        ParallelEncoder.register_default_encoder(encode_custom_type, CustomType)
+
+        objects = [CustomType(i) for i in range(10)]
+        output = jsonstar.dumps_parallel(objects, executor, chunk_size=2, cls=ParallelEncoder)
+
+        assert output == jsonstar.dumps([f"custom {i}" for i in range(10)])
+
+    def test_default_separators(self, executor):
+        output = jsonstar.dumps_parallel(RECORDS, executor, chunk_size=4, separators=None)
+
+        assert output == jsonstar.dumps(RECORDS)
+
+    def test_indent_is_not_supported(self, executor):
+        with pytest.raises(ValueError):
+            jsonstar.dumps_parallel(RECORDS, executor, indent=2)
+
+
+class TestDumpParallel:
+    def test_dump_parallel(self, executor):
+        fp = io.StringIO()
+
+        jsonstar.dump_parallel((record for record in RECORDS), fp, executor, chunk_size=4)
+
+        assert fp.getvalue() == jsonstar.dumps(RECORDS)
+
+    def test_default_process_pool(self):
+        assert jsonstar.dumps_parallel(range(10), chunk_size=3) == jsonstar.dumps(list(range(10)))
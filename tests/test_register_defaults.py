@@ -93,3 +93,51 @@ class TestIsolateDefaultsFromEncoderClasses:
         assert EncoderA1.default_typed_encoders() == {**default_typed_encoders, str: a1, int: a1}
         assert EncoderA2.default_typed_encoders() == {**default_typed_encoders, str: a2, int: a1}
         assert EncoderB1.default_typed_encoders() == {**default_typed_encoders, str: b1}
+
+
+class TestFlattenedDefaults:
+    def test_multiple_inheritance_merges_defaults_following_the_mro(self):
+        class EncoderA(JSONEncoderStar):
+            pass
+
+        class EncoderB(JSONEncoderStar):
+            pass
+
+        class EncoderAB(EncoderA, EncoderB):
+            pass
+
+        def a(o):
+            return o
+
+        def b(o):
+            return o
+
+        default_functional_encoders = JSONEncoderStar._default_functional_encoders.copy()
+
+        EncoderA.register_default_encoder(a)
+        EncoderA.register_default_encoder(a, str)
+        EncoderB.register_default_encoder(b)
+        EncoderB.register_default_encoder(b, str)
+        EncoderB.register_default_encoder(b, int)
+
+        assert EncoderAB.default_functional_encoders() == [a, b] + default_functional_encoders
+        assert EncoderAB.default_typed_encoders()[str] is a
+        assert EncoderAB.default_typed_encoders()[int] is b
+
+    def test_defaults_are_merged_once_until_an_ancestor_registers(self):
+        class EncoderA1(JSONEncoderStar):
+            pass
+
+        class EncoderA2(EncoderA1):
+            pass
+
+        def a1(o):
+            return o
+
+        merged = EncoderA2.default_typed_encoders()
+        assert EncoderA2.default_typed_encoders() is merged
+
+        EncoderA1.register_default_encoder(a1, CustomType)
+
+        assert EncoderA2.default_typed_encoders() is not merged
+        assert EncoderA2.default_typed_encoders()[CustomType] is a1
@@ -0,0 +1,94 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+import jsonstar
+from jsonstar import JSONDecoderStar
+
+
+DOCUMENT = json.dumps(
+    {
+        "meta": {"created_at": "2024-01-01T12:00:00", "notes": ["a]", {"b": "}"}]},
+        "items": [
+            {"id": 1, "name": "one", "when": "2024-01-02", "tags": [[["deep"]]], "seller": {"id": 10, "x": {}}},
+            {"name": "two", "id": 2, "when": "2024-01-03", "seller": {"id": 20}, "price": 1.5},
+            {"id": 3, "seller": None},
+        ],
+        "total": 3,
+    }
+)
+
+
+def project(value, keys):
+    return {key: value[key] for key in keys if key in value}
+
+
+class TestSelection:
+    def test_only_selected_paths_are_kept(self):
+        assert jsonstar.loads(DOCUMENT, select=["meta.created_at", "items[*].id", "total"]) == {
+            "meta": {"created_at": datetime(2024, 1, 1, 12)},
+            "items": [{"id": 1}, {"id": 2}, {"id": 3}],
+            "total": 3,
+        }
+
+    def test_selected_values_match_loads(self):
+        full = jsonstar.loads(DOCUMENT)
+
+        selected = jsonstar.loads(DOCUMENT, select=["items[*].when", "items[*].seller", "meta.notes"])
+
+        assert selected["items"] == [project(item, ["when", "seller"]) for item in full["items"]]
+        assert selected["meta"] == {"notes": full["meta"]["notes"]}
+
+    def test_nested_paths_inside_arrays(self):
+        selected = jsonstar.loads(DOCUMENT, select=["items[*].seller.id"])
+
+        assert selected == {"items": [{"seller": {"id": 10}}, {"seller": {"id": 20}}, {}]}
+
+    def test_mapping_converts_like_a_schema_without_the_hook(self):
+        selected = jsonstar.loads(
+            DOCUMENT, select={"meta.created_at": str, "items[*].when": date, "items[*].price": Decimal}
+        )
+
+        assert selected == {
+            "meta": {"created_at": "2024-01-01T12:00:00"},
+            "items": [{"when": date(2024, 1, 2)}, {"when": date(2024, 1, 3), "price": Decimal("1.5")}, {}],
+        }
+
+    def test_arrays_of_selected_values(self):
+        assert jsonstar.loads('[[1, 2], [3], "x"]', select=["[*][*]"]) == [[1, 2], [3]]
+        assert jsonstar.loads('{"a": [{"b": 1}, 2]}', select=["a[*]"]) == {"a": [{"b": 1}, 2]}
+
+    def test_values_of_another_shape_are_left_out(self):
+        assert jsonstar.loads('{"a": [1, 2], "b": 3}', select=["a.x", "b.y"]) == {}
+        assert jsonstar.loads('{"a": {"x": 1}}', select=["a[*]"]) == {"a": {}}
+        assert jsonstar.loads("[1, 2]", select=["a"]) is None
+
+    def test_keys_with_escapes(self):
+        assert jsonstar.loads('{"\\u0069d": 1, "x\\"y": 2, "z": 3}', select=["id", 'x"y']) == {"id": 1, 'x"y': 2}
+
+    def test_decoder_options_apply_to_selected_values(self):
+        decoder = JSONDecoderStar(select=["items[*].price"], decimals_as_numbers=True)
+
+        assert decoder.decode(DOCUMENT)["items"][1] == {"price": Decimal("1.5")}
+
+    @pytest.mark.parametrize(
+        "document",
+        [
+            '{"items": [{"id": 1}, {"id": 2}',
+            '{"items": [1 2]}',
+            '{"other": [1, }',
+            '{"other": {"a" 1}}',
+            '{"id": 1} x',
+            '{"id": 1,}',
+            "",
+        ],
+    )
+    def test_invalid_documents_raise(self, document):
+        with pytest.raises(json.JSONDecodeError):
+            jsonstar.loads(document, select=["items[*].id", "id"])
+
+    def test_schema_and_select_are_exclusive(self):
+        with pytest.raises(TypeError):
+            JSONDecoderStar(schema=dict, select=["id"])
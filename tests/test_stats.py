@@ -0,0 +1,83 @@
+import dataclasses
+from datetime import datetime
+from decimal import Decimal
+
+import jsonstar
+from jsonstar import DecoderStats, EncoderStats, JSONEncoderStar
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+
+
+def type_stats(snapshot, type_):
+    return snapshot[f"{type_.__module__}.{type_.__qualname__}"]
+
+
+class TestEncoderStats:
+    def test_typed_encoder_hits_are_counted_per_type(self):
+        stats = EncoderStats()
+
+        JSONEncoderStar(stats=stats).encode([Decimal("1"), Decimal("2"), datetime(2024, 1, 1)])
+
+        snapshot = stats.snapshot()
+        assert type_stats(snapshot, Decimal)["typed_hits"] == 2
+        assert type_stats(snapshot, datetime)["typed_hits"] == 1
+        assert set(type_stats(snapshot, Decimal)["seconds"]) == {"str"}
+
+    def test_functional_attempts_and_failures_are_counted(self):
+        stats = EncoderStats()
+
+        JSONEncoderStar(stats=stats).encode([Point(1), Point(2)])
+
+        point = type_stats(stats.snapshot(), Point)
+        assert point["typed_hits"] == 0
+        assert point["functional_attempts"] == 2
+        assert point["functional_failures"] == 0
+        assert set(point["seconds"]) == {"dataclasses_asdict"}
+
+    def test_functional_failures_are_counted(self):
+        def failing(o):
+            raise ValueError
+
+        stats = EncoderStats()
+
+        JSONEncoderStar(functional_encoders=[failing], stats=stats).encode(Point(1))
+
+        point = type_stats(stats.snapshot(), Point)
+        assert point["functional_attempts"] == 2
+        assert point["functional_failures"] == 1
+
+    def test_module_dumps_accepts_stats(self):
+        stats = EncoderStats()
+
+        jsonstar.dumps(Decimal("1"), stats=stats)
+
+        assert type_stats(stats.snapshot(), Decimal)["typed_hits"] == 1
+
+    def test_reset(self):
+        stats = EncoderStats()
+        JSONEncoderStar(stats=stats).encode(Decimal("1"))
+
+        stats.reset()
+
+        assert stats.snapshot() == {}
+
+    def test_stats_do_not_leak_into_the_class_dispatch(self):
+        JSONEncoderStar(stats=EncoderStats()).encode(Decimal("1"))
+
+        assert JSONEncoderStar().typed_encoder_for(Decimal) is str
+
+
+class TestDecoderStats:
+    def test_datetime_attempts_and_successes_are_counted(self):
+        stats = DecoderStats()
+
+        result = jsonstar.loads('{"a": "2024-01-01", "b": "2024-99-99", "c": "text", "d": "2024"}', stats=stats)
+
+        assert result["a"] == datetime(2024, 1, 1)
+        assert stats.snapshot() == {"datetime_attempts": 2, "datetime_successes": 1}
+
+        stats.reset()
+        assert stats.snapshot() == {"datetime_attempts": 0, "datetime_successes": 0}
@@ -0,0 +1,107 @@
+import io
+import json
+from datetime import date
+from unittest.mock import Mock
+
+import pytest
+
+import jsonstar
+from jsonstar.streaming import StreamedArray, write_buffered
+
+
+class Cursor:
+    def __init__(self):
+        self.rows = iter([1, 2, 3])
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self.rows)
+
+
+def records(n):
+    for i in range(n):
+        yield {"id": i, "day": date(2024, 1, 1)}
+
+
+class TestDump:
+    @pytest.mark.parametrize("kwargs", [{}, {"indent": 2}, {"sort_keys": True, "separators": (",", ":")}])
+    def test_dump_matches_dumps(self, kwargs):
+        obj = {"records": [{"id": i, "day": date(2024, 1, 1), "tags": {"a"}} for i in range(100)]}
+        fp = io.StringIO()
+
+        jsonstar.dump(obj, fp, **kwargs)
+
+        assert fp.getvalue() == jsonstar.dumps(obj, **kwargs)
+
+    def test_dump_streams_generators_as_arrays(self):
+        fp = io.StringIO()
+
+        jsonstar.dump({"records": records(3), "empty": records(0)}, fp)
+
+        assert json.loads(fp.getvalue()) == {
+            "records": [{"id": 0, "day": "2024-01-01"}, {"id": 1, "day": "2024-01-01"}, {"id": 2, "day": "2024-01-01"}],
+            "empty": [],
+        }
+
+    def test_dump_streams_top_level_generators(self):
+        fp = io.StringIO()
+
+        jsonstar.dump((i for i in range(3)), fp, indent=2)
+
+        assert fp.getvalue() == "[\n  0,\n  1,\n  2\n]"
+
+    def test_dump_consumes_generators_lazily(self):
+        fp = Mock()
+        consumed = []
+
+        def generator():
+            for i in range(3):
+                consumed.append(i)
+                yield i
+
+        fp.write.side_effect = lambda s: consumed.append(s)
+        jsonstar.dump(generator(), fp, buffer_size=1)
+
+        assert consumed == [0, "[0", 1, ", 1", 2, ", 2", "]"]
+
+    def test_dumps_materializes_generators(self):
+        assert jsonstar.dumps({"records": (i for i in range(3))}) == '{"records": [0, 1, 2]}'
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_encoders_of_iterator_classes_win(self, stream):
+        encoder = jsonstar.JSONEncoderStar(typed_encoders={Cursor: lambda o: "custom"})
+        output = "".join(encoder.iterencode([Cursor()])) if stream else encoder.encode([Cursor()])
+
+        assert output == '["custom"]'
+
+    def test_functional_encoders_of_iterators_win(self):
+        encoder = jsonstar.JSONEncoderStar(functional_encoders=[lambda o: "custom"])
+
+        assert encoder.encode([Cursor()]) == '["custom"]'
+
+    def test_files_are_not_read(self, tmp_path):
+        path = tmp_path / "lines.txt"
+        path.write_text("a\nb\n")
+
+        with open(path) as fp, pytest.raises(TypeError):
+            jsonstar.dumps({"f": fp})
+
+
+class TestStreamedArray:
+    def test_empty_iterator_is_falsy(self):
+        assert not StreamedArray(iter([]))
+        assert StreamedArray(iter([0]))
+
+    def test_iterates_over_all_items(self):
+        assert list(StreamedArray(iter([1, 2, 3]))) == [1, 2, 3]
+
+
+class TestWriteBuffered:
+    def test_chunks_are_coalesced_into_buffer_sized_writes(self):
+        fp = Mock()
+
+        write_buffered(fp, ["ab", "cd", "ef", "g"], buffer_size=4)
+
+        assert [c.args[0] for c in fp.write.call_args_list] == ["abcd", "efg"]